@@ -1,6 +1,6 @@
 import os
 import json
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 
 DEFAULT_SETTINGS_PATH = os.path.join(os.path.dirname(__file__), "settings.json")
 
@@ -8,8 +8,8 @@ DEFAULT_SETTINGS_PATH = os.path.join(os.path.dirname(__file__), "settings.json")
 class AppSettings:
     fit_to_window: bool = True
     scale_factor: float = 1.0
-    tile: int = 512
-    tile_pad: int = 12
+    tile: int = 128  # auto_tile이 꺼져 있을 때 사용
+    tile_pad: int = 4
     scale: float = 4.0
     half: bool = False
     enabled_thumbnails: bool = True
@@ -17,6 +17,42 @@ class AppSettings:
     page_mode: str = "single"
     model_path: str = "src/models/RealESRNET_x4plus.pth"
     sequential_upscale: bool = False
+    decode_workers: int = 0  # 0이면 CPU 코어 수만큼
+    prefetch_count: int = 2
+    roi_upscale: bool = True  # 확대 시 보이는 영역만 업스케일
+    roi_min_zoom: float = 2.0
+    roi_tile: int = 256
+    roi_margin: int = 64
+    # 플러그인별 CPU 추론 백엔드 (fp32 / torchscript / compile / int8 / onnx)
+    inference_backends: dict = field(default_factory=lambda: {"real-esrgan": "fp32"})
+    inference_threads: int = 0  # 0이면 torch 기본값
+    preview_upscaler: str = "lanczos"  # 무거운 모델 결과 전에 먼저 보여줄 업스케일러 ("" 이면 사용 안 함)
+    enabled_trace: bool = False  # 성능 계측 + 오버레이
+    auto_tile: bool = True  # 이미지 크기/가용 메모리로 tile, tile_pad, 배치 자동 결정
+    tile_memory_ratio: float = 0.5  # 가용 메모리 중 업스케일에 사용할 비율
+    tile_calibrate: bool = False  # 최초 실행 시 짧은 실측으로 메모리 사용량 보정 (결과는 캐시에 저장)
+    memory_budget_mb: int = 0  # 캐시/버퍼 전체 예산 (0이면 전체 메모리의 절반)
+    duplicate_hash: str = "phash"  # 중복 검색에 쓸 해시 (ahash / dhash / phash)
+    duplicate_distance: int = 6  # 같은 이미지로 볼 최대 해밍 거리 (64비트 중)
+    catalog_sort: str = "name"  # 페이지 정렬 (name / size / pixels / mtime)
+    catalog_descending: bool = False
+    catalog_filter: str = ""  # "" / portrait / landscape / animated
+    slideshow_interval: float = 5.0  # 슬라이드쇼 전환 간격 (초)
+    slideshow_auto_scroll: bool = False  # 세로로 긴 페이지는 위에서 아래로 스크롤하며 표시
+    progressive_display: bool = True  # 큰 이미지는 축소 미리보기를 먼저 그리고 전체 해상도로 교체
+    progressive_min_kb: int = 512  # 이 크기 이상의 파일만 점진 표시
+    upscale_daemon: bool = False  # 업스케일 모델을 로컬 서비스 프로세스 하나에서 공유 (없으면 자동 실행)
+    upscale_daemon_address: str = ""  # Unix 소켓 경로 또는 host:port ("" 이면 기본 위치)
+    single_instance: bool = True  # 이미 실행 중인 뷰어가 있으면 그 창에서 파일을 열고 바로 종료
+    idle_upscale: bool = False  # 입력이 없는 동안 다음 페이지들을 읽는 순서대로 미리 업스케일
+    idle_upscale_delay: float = 2.0  # 마지막 입력 후 이 시간(초)이 지나면 미리 업스케일 재개
+    idle_upscale_cores: int = 1  # 미리 업스케일에 쓸 CPU 코어 수 (낮은 우선순위로 실행)
+    idle_upscale_ahead: int = 0  # 현재 페이지부터 미리 업스케일할 페이지 수 (0이면 끝까지)
+    io_threads: int = 4  # 파일 읽기 스레드 수 (0이면 디코드 워커가 경로로 직접 읽음)
+    read_ahead_count: int = 8  # 바이트를 미리 읽어 둘 다음 페이지 수
+    read_ahead_mb: int = 128  # 미리 읽은 파일 바이트 최대 크기
+    restore_session: bool = True  # 시작할 때 마지막으로 보던 페이지에서 이어 보기
+    export_workers: int = 0  # 일괄 내보내기 프로세스 수 (0이면 CPU 코어 수)
 
     def __post_init__(self):
         self._on_change_callback = None
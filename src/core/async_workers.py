@@ -1,8 +1,12 @@
 import os
+import logging
 import cv2
 import numpy as np
-from PIL import Image
 from PySide6.QtCore import QThread, Signal
+from core.decode_service import decode_rgb
+from core.roi_upscale import upscale_region
+from core.image_hash import find_duplicates
+from core.batch_export import export_source
 
 class AsyncUpscaleWorker(QThread):
     finished = Signal(np.ndarray)
@@ -15,15 +19,12 @@ class AsyncUpscaleWorker(QThread):
 
     def run(self):
         try:
-            img = cv2.imread(self.path)
+            img = decode_rgb(self.path)
             if img is None:
                 raise ValueError("이미지를 읽을 수 없습니다.")
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(img)
 
             if not os.path.exists(self.cache_path):
-                output = self.upscaler.upscale(pil_img)
-                result_np = np.array(output)
+                result_np = self.upscaler.upscale(img)
                 cv2.imwrite(self.cache_path, cv2.cvtColor(result_np, cv2.COLOR_RGB2BGR))
             else:
                 result_np = cv2.imread(self.cache_path)
@@ -31,5 +32,106 @@ class AsyncUpscaleWorker(QThread):
 
             self.finished.emit(result_np)
         except Exception as e:
-            print(f"[AsyncUpscaleWorker] 오류: {e}")
-            self.finished.emit(None)
\ No newline at end of file
+            logging.error(f"[AsyncUpscaleWorker] 오류: {e}")
+            self.finished.emit(None)
+
+class AsyncRegionUpscaleWorker(QThread):
+    # (업스케일된 영역, 원본 좌표계 영역, 요청 번호)
+    finished = Signal(object, tuple, int)
+
+    def __init__(self, img, region, upscaler, tile_cache, image_key, request_id, tile=256, margin=64, parent=None):
+        super().__init__(parent)
+        self.img = img
+        self.region = region
+        self.upscaler = upscaler
+        self.tile_cache = tile_cache
+        self.image_key = image_key
+        self.request_id = request_id
+        self.tile = tile
+        self.margin = margin
+
+    def run(self):
+        try:
+            canvas, covered = upscale_region(
+                self.img, self.region, self.upscaler, self.tile_cache,
+                self.image_key, tile=self.tile, margin=self.margin
+            )
+            self.finished.emit(canvas, covered, self.request_id)
+        except Exception as e:
+            logging.error(f"[AsyncRegionUpscaleWorker] 오류: {e}")
+            self.finished.emit(None, (), self.request_id)
+
+class AsyncDuplicateWorker(QThread):
+    # 경로 묶음 목록
+    finished = Signal(list)
+    progress = Signal(int, int)
+
+    def __init__(self, items, decode_service, kind="phash", max_distance=6, prepare=None, parent=None):
+        super().__init__(parent)
+        self.items = items
+        self.decode_service = decode_service
+        self.kind = kind
+        self.max_distance = max_distance
+        self.prepare = prepare  # 압축 내부 페이지를 파일로 풀어두는 함수
+
+    def run(self):
+        try:
+            items = self.items
+            if self.prepare is not None:
+                items = [item for item in items if self.prepare(item[1])]
+            groups = find_duplicates(
+                items, self.decode_service, kind=self.kind, max_distance=self.max_distance,
+                progress=self.progress.emit
+            )
+            self.finished.emit(groups)
+        except Exception as e:
+            logging.error(f"[AsyncDuplicateWorker] 오류: {e}")
+            self.finished.emit([])
+
+class CatalogScanWorker(QThread):
+    # (스캔한 폴더/압축 파일 경로, 새로 읽은 항목 수)
+    finished = Signal(str, int)
+
+    def __init__(self, catalog, source, is_archive=False, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.source = source
+        self.is_archive = is_archive
+
+    def run(self):
+        try:
+            if self.is_archive:
+                changed = self.catalog.scan_archive(self.source, stop=self.isInterruptionRequested)
+            else:
+                changed = self.catalog.scan_folder(self.source, stop=self.isInterruptionRequested)
+            self.finished.emit(self.source, changed)
+        except Exception as e:
+            logging.error(f"[CatalogScanWorker] 오류: {e}")
+            self.finished.emit(self.source, 0)
+
+class BatchExportWorker(QThread):
+    # (성공 수, 실패 수)
+    finished = Signal(int, int)
+    progress = Signal(int, int)
+
+    def __init__(self, source, pipeline, target, names=None, reader=None, workers=0, settings=None, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.pipeline = pipeline
+        self.target = target
+        self.names = names
+        self.reader = reader  # 뷰어가 열어 둔 같은 압축 파일의 리더 (공유)
+        self.workers = workers
+        self.settings = settings
+
+    def run(self):
+        try:
+            done, failed = export_source(
+                self.source, self.pipeline, self.target, names=self.names, reader=self.reader,
+                workers=self.workers, settings=self.settings,
+                progress=self.progress.emit, stop=self.isInterruptionRequested
+            )
+            self.finished.emit(done, failed)
+        except Exception as e:
+            logging.error(f"[BatchExportWorker] 오류: {e}")
+            self.finished.emit(0, 0)
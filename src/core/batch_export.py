@@ -0,0 +1,301 @@
+"""
+일괄 내보내기 (회전/반전, 크기 조절, 업스케일, 형식/품질 변환).
+
+선택한 페이지, 폴더 전체 또는 압축 파일 전체에 같은 변환 파이프라인을 적용해
+폴더나 새 CBZ 파일로 씁니다.
+
+    pipeline = ExportPipeline(rotation=90, max_height=2400, format="webp", quality=85)
+    done, failed = export_source("book.cbz", pipeline, "out/book.cbz", workers=4)
+
+- 생산자(호출 스레드)가 파일 경로 또는 압축 멤버 바이트를 프로세스 풀에 넘기고,
+  워커가 디코딩 → 변환 → 인코딩한 바이트를 돌려주면 소비자가 입력 순서대로 씁니다.
+- 동시에 풀에 들어가 있는 작업은 max_inflight개로 제한하므로, 페이지 수와 관계없이
+  메모리에는 그만큼의 원본/결과 바이트만 올라옵니다.
+- CBZ 출력은 인코딩된 바이트를 zip 멤버로 바로 기록합니다 (페이지별 임시 파일 없음).
+"""
+import os
+import logging
+import zipfile
+import multiprocessing as mp
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from core.decoders import decode_bgr
+from core.image_transform import apply_rotation, apply_flip
+from utils.image_utils import list_image_files
+
+# 출력 형식 -> (확장자, cv2.imencode 품질 플래그)
+EXPORT_FORMATS = {
+    "jpg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "png": (".png", None),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+}
+# 무거운 업스케일 모델을 쓰는 내보내기의 최대 프로세스 수 (워커마다 모델이 한 벌씩 올라가고,
+# 다른 프로세스의 모델은 메모리 관리자가 회수할 수 없으므로)
+MODEL_WORKERS = 1
+# format이 "" (원본 유지)일 때 그대로 다시 쓸 수 없는 확장자는 png로
+_KEEP_EXTS = {".jpg": "jpg", ".jpeg": "jpg", ".png": "png", ".webp": "webp"}
+
+
+@dataclass
+class ExportPipeline:
+    rotation: int = 0              # 0 / 90 / 180 / 270 (시계 방향)
+    flip_horizontal: bool = False
+    flip_vertical: bool = False
+    scale: float = 1.0             # 배율 (업스케일 후 적용)
+    max_width: int = 0             # 이 크기 안에 맞게 축소 (0이면 제한 없음)
+    max_height: int = 0
+    upscale: str = ""              # 업스케일 플러그인 이름 ("" 이면 사용 안 함)
+    format: str = ""               # jpg / png / webp ("" 이면 원본 형식 유지)
+    quality: int = 90              # jpg / webp 품질 (png는 무시)
+
+    def output_format(self, name):
+        if self.format:
+            return self.format
+        return _KEEP_EXTS.get(os.path.splitext(name)[1].lower(), "png")
+
+    def output_name(self, name):
+        """출력 파일/멤버 이름 (확장자만 출력 형식에 맞게 바꿈)"""
+        ext, _ = EXPORT_FORMATS[self.output_format(name)]
+        return os.path.splitext(name)[0] + ext
+
+
+def fit_size(w, h, scale=1.0, max_width=0, max_height=0):
+    """배율을 적용한 뒤 max_width × max_height 안에 들어가도록 비율을 유지해 줄인 크기"""
+    ratio = scale
+    if max_width:
+        ratio = min(ratio, max_width / w)
+    if max_height:
+        ratio = min(ratio, max_height / h)
+    return max(1, round(w * ratio)), max(1, round(h * ratio))
+
+
+def transform(img, pipeline, upscaler=None):
+    """
+    BGR 이미지에 파이프라인 적용 (업스케일 → 회전/반전 → 크기 조절).
+
+    Args:
+        img (np.ndarray): (H, W, 3) uint8 BGR
+        pipeline (ExportPipeline): 변환 설정
+        upscaler: upscale(rgb) -> rgb 를 가진 플러그인 인스턴스 (None이면 생략)
+    """
+    if upscaler is not None:
+        rgb = upscaler.upscale(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+        img = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    img = apply_flip(apply_rotation(img, pipeline.rotation), pipeline.flip_horizontal, pipeline.flip_vertical)
+
+    h, w = img.shape[:2]
+    size = fit_size(w, h, pipeline.scale, pipeline.max_width, pipeline.max_height)
+    if size != (w, h):
+        shrink = size[0] < w
+        img = cv2.resize(img, size, interpolation=cv2.INTER_AREA if shrink else cv2.INTER_LANCZOS4)
+    return img
+
+
+def encode(img, fmt, quality=90):
+    ext, flag = EXPORT_FORMATS[fmt]
+    params = [flag, int(quality)] if flag is not None else []
+    ok, buf = cv2.imencode(ext, img, params)
+    if not ok:
+        raise ValueError(f"{fmt} 인코딩 실패")
+    return buf.tobytes()
+
+
+# 워커 프로세스 상태 (initializer에서 한 번 설정)
+_pipeline = None
+_upscaler = None
+
+
+def _init_worker(pipeline, settings_fields, threads):
+    """
+    워커 프로세스마다 한 번: 파이프라인 저장 + 업스케일러 준비
+    (업스케일 서비스를 켜 두었으면 무거운 모델은 로드하지 않고 서비스의 모델을 공유)
+    """
+    global _pipeline, _upscaler
+    _pipeline = pipeline
+    if pipeline.upscale:
+        from config.settings_loader import AppSettings
+        from plugins.plugin_loader import create_upscaler
+        settings = AppSettings(**settings_fields)
+        # 워커 여러 개가 코어를 나눠 쓰도록 추론 스레드 수 제한
+        settings.inference_threads = threads
+        _upscaler = create_upscaler(pipeline.upscale, settings)
+
+
+def _export_one(name, source):
+    """
+    워커 프로세스에서 실행: 경로(str) 또는 파일 바이트를 변환해 인코딩된 바이트로 반환
+    """
+    data = np.fromfile(source, np.uint8) if isinstance(source, str) else np.frombuffer(source, np.uint8)
+    img = decode_bgr(data)
+    if img is None:
+        raise ValueError("이미지를 읽을 수 없습니다.")
+    img = transform(img, _pipeline, _upscaler)
+    return encode(img, _pipeline.output_format(name), _pipeline.quality)
+
+
+class DirectoryWriter:
+    """출력 폴더에 파일로 쓰기 (멤버 이름의 하위 폴더 구조 유지)"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+
+    def target_path(self, name):
+        """
+        멤버 이름 -> 출력 경로. 압축 파일 안의 이름은 신뢰할 수 없으므로 절대 경로나 ".."가 들어간
+        이름, 출력 폴더 밖으로 풀리는 이름은 거부합니다 (zip slip).
+        """
+        parts = name.replace("\\", "/").split("/")
+        if os.path.isabs(name) or name.startswith("/") or ".." in parts or os.path.splitdrive(name)[0]:
+            raise ValueError(f"허용되지 않는 이름: {name}")
+        root = os.path.realpath(self.folder)
+        path = os.path.realpath(os.path.join(root, *[p for p in parts if p not in ("", ".")]))
+        if os.path.commonpath([root, path]) != root or path == root:
+            raise ValueError(f"출력 폴더 밖의 경로: {name}")
+        return path
+
+    def write(self, name, data):
+        path = self.target_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+
+class CbzWriter:
+    """새 CBZ 파일에 멤버로 바로 쓰기 (이미 압축된 이미지이므로 무압축 저장)"""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_STORED)
+
+    def write(self, name, data):
+        self._zip.writestr(name, data)
+
+    def close(self):
+        self._zip.close()
+
+
+def open_writer(target):
+    """확장자가 .cbz / .zip이면 CBZ, 아니면 폴더"""
+    if target.lower().endswith((".cbz", ".zip")):
+        return CbzWriter(target)
+    return DirectoryWriter(target)
+
+
+def folder_items(paths, base=None):
+    """파일 경로 목록 -> (출력 이름, 경로) (base 기준 상대 경로, 없으면 파일 이름)"""
+    items = []
+    for path in paths:
+        name = os.path.relpath(path, base) if base else os.path.basename(path)
+        items.append((name.replace(os.sep, "/"), path))
+    return items
+
+
+def archive_items(reader, names=None):
+    """압축 멤버 -> (멤버 이름, 바이트를 읽는 함수) (바이트는 풀에 넣기 직전에 읽음)"""
+    names = reader.names() if names is None else names
+    return [(name, lambda n=name: reader.read(n)) for name in names]
+
+
+def export_batch(items, pipeline, writer, workers=0, settings=None, max_inflight=0, progress=None, stop=None):
+    """
+    items를 프로세스 풀에서 변환해 입력 순서대로 writer에 씁니다.
+
+    Args:
+        items (list[tuple[str, str | callable]]): (이름, 경로 또는 바이트를 돌려주는 함수)
+        pipeline (ExportPipeline): 변환 설정
+        writer: write(name, bytes)를 가진 출력 (DirectoryWriter / CbzWriter)
+        workers (int): 프로세스 수 (0이면 CPU 코어 수, 무거운 업스케일 모델을 쓰면 MODEL_WORKERS개까지)
+        settings (AppSettings, optional): 업스케일 모델 설정
+        max_inflight (int): 풀에 동시에 넣어 둘 최대 작업 수 (0이면 workers × 2)
+        progress (callable, optional): (완료 수, 전체 수)
+        stop (callable, optional): True를 반환하면 새 작업을 넣지 않고 중단
+
+    Returns:
+        tuple[int, int]: (성공 수, 실패 수)
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(items) or 1))
+    if pipeline.upscale:
+        from plugins.plugin_loader import PLUGINS
+        if PLUGINS[pipeline.upscale.lower()].resident_model:
+            workers = min(workers, MODEL_WORKERS)
+    max_inflight = max(1, max_inflight or workers * 2)
+    fields = asdict(settings) if settings is not None else {}
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    done = failed = 0
+    pending = {}  # 입력 순번 -> (이름, Future)
+    next_submit = next_write = 0
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp.get_context("spawn"),
+        initializer=_init_worker, initargs=(pipeline, fields, threads)
+    )
+    try:
+        while True:
+            # 생산: 빈자리만큼 채움 (압축 멤버 바이트는 여기서 읽음)
+            while next_submit < len(items) and len(pending) < max_inflight and not (stop and stop()):
+                name, source = items[next_submit]
+                try:
+                    data = source() if callable(source) else source
+                    pending[next_submit] = (name, executor.submit(_export_one, name, data))
+                except Exception as e:
+                    logging.warning(f"[일괄 내보내기] 읽기 실패 {name}: {e}")
+                    pending[next_submit] = (name, None)
+                next_submit += 1
+            if next_write not in pending:
+                break
+
+            # 소비: 입력 순서대로 기다렸다가 씀 (CBZ 페이지 순서 유지)
+            name, future = pending.pop(next_write)
+            next_write += 1
+            try:
+                if future is None:
+                    raise ValueError("원본을 읽지 못했습니다.")
+                writer.write(pipeline.output_name(name), future.result())
+                done += 1
+            except Exception as e:
+                logging.warning(f"[일괄 내보내기] 실패 {name}: {e}")
+                failed += 1
+            if progress:
+                progress(done + failed, len(items))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return done, failed
+
+
+def export_source(source, pipeline, target, names=None, reader=None, **kwargs):
+    """
+    폴더 또는 압축 파일(source)의 페이지를 target(폴더 또는 .cbz)으로 내보냅니다.
+
+    Args:
+        names (list[str], optional): 내보낼 파일 이름 / 압축 멤버 이름 (없으면 전체)
+        reader (ArchiveReader, optional): 이미 열려 있는 source의 리더 (없으면 새로 엶)
+        **kwargs: export_batch 인자 (workers, settings, max_inflight, progress, stop)
+    """
+    from utils.archive_reader import is_archive_file, open_archive
+
+    owns_reader = False
+    if os.path.isfile(source) and is_archive_file(source):
+        if reader is None:
+            reader, owns_reader = open_archive(source), True
+        items = archive_items(reader, names)
+    else:
+        paths = list_image_files(source) if names is None else [os.path.join(source, n) for n in names]
+        items = folder_items(paths, source)
+
+    writer = open_writer(target)
+    try:
+        return export_batch(items, pipeline, writer, **kwargs)
+    finally:
+        writer.close()
+        if owns_reader:
+            reader.close()
@@ -0,0 +1,231 @@
+import os
+import logging
+import weakref
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+
+import cv2
+import numpy as np
+
+from utils.perf_trace import tracer
+from core.decoders import decode_bgr
+
+
+def _read_bgr(path, reduce=1, max_side=None, data=None):
+    """data(파일 바이트)가 있으면 디스크를 읽지 않고 메모리에서 디코딩 (형식은 매직 바이트로 판별)"""
+    with tracer.span("decode", reduce=reduce):
+        if data is None:
+            try:
+                data = np.fromfile(path, dtype=np.uint8)
+            except OSError:
+                return None
+        img = decode_bgr(data, reduce)
+    if img is None:
+        return None
+
+    if max_side:
+        h, w = img.shape[:2]
+        ratio = max_side / max(h, w)
+        if ratio < 1.0:
+            with tracer.span("scale"):
+                img = cv2.resize(img, (max(1, int(w * ratio)), max(1, int(h * ratio))), interpolation=cv2.INTER_AREA)
+    return img
+
+
+def decode_rgb(path, reduce=1, max_side=None):
+    """
+    이미지를 RGB ndarray로 디코딩합니다.
+
+    Args:
+        path (str): 이미지 경로
+        reduce (int): 1/2/4/8 축소 디코딩 배율
+        max_side (int, optional): 긴 변 최대 길이 (썸네일용)
+
+    Returns:
+        np.ndarray | None: (H, W, 3) uint8 RGB 배열, 실패 시 None
+    """
+    img = _read_bgr(path, reduce, max_side)
+    if img is None:
+        return None
+    with tracer.span("color"):
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+
+def _read_bgr_buffer(path, reduce, max_side, buffer):
+    """
+    읽기 계층이 소유한 공유 메모리 블록 (이름, 크기)의 파일 바이트를 디코딩합니다.
+    그사이 블록이 해제됐으면 경로로 직접 읽습니다.
+    """
+    name, size = buffer
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return _read_bgr(path, reduce, max_side)
+    # 워커는 부모의 resource_tracker를 공유하므로 등록을 건드리지 않음 (해제는 읽기 계층이 unlink로)
+    try:
+        data = np.ndarray((size,), dtype=np.uint8, buffer=shm.buf)
+        img = _read_bgr(path, reduce, max_side, data)
+        del data
+    finally:
+        shm.close()
+    return img
+
+
+def _decode_to_shm(path, reduce=1, max_side=None, buffer=None, trace=False):
+    """
+    워커 프로세스에서 실행: 디코딩 결과를 공유 메모리 블록에 기록하고
+    ((블록 이름, shape, dtype) | None, 계측 구간 목록)을 반환합니다. 픽셀 배열은 피클링되지 않습니다.
+    buffer (블록 이름, 크기)가 있으면 미리 읽어 둔 파일 바이트를 메모리에서 디코딩합니다.
+    trace가 켜져 있으면 워커에서 잰 decode/scale/color 구간을 부모가 기록하도록 함께 돌려줍니다.
+    """
+    tracer.enable(trace)
+    if buffer:
+        img = _read_bgr_buffer(path, reduce, max_side, buffer)
+    else:
+        img = _read_bgr(path, reduce, max_side)
+    if img is None:
+        return None, tracer.drain()
+
+    shm = shared_memory.SharedMemory(create=True, size=img.nbytes)
+    # 블록의 수명은 클라이언트가 관리하므로 워커 종료 시 resource_tracker가 지우지 않도록 해제
+    resource_tracker.unregister(shm._name, "shared_memory")
+    buf = np.ndarray(img.shape, dtype=img.dtype, buffer=shm.buf)
+    # 색 변환 결과를 공유 메모리에 바로 기록 (추가 복사 없음)
+    with tracer.span("color"):
+        cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=buf)
+    del buf
+    shm.close()
+    return (shm.name, img.shape, img.dtype.str), tracer.drain()
+
+
+def share_array(arr):
+    """
+    배열을 새 공유 메모리 블록에 복사하고 (블록 이름, shape, dtype)을 반환합니다.
+    블록은 받는 쪽이 attach_shared로 열면서 제거합니다 (다른 프로세스로 픽셀을 넘길 때 사용).
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    resource_tracker.unregister(shm._name, "shared_memory")
+    np.copyto(np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf), arr)
+    shm.close()
+    return shm.name, arr.shape, arr.dtype.str
+
+
+def attach_shared(name, shape, dtype):
+    """공유 메모리 블록을 복사 없이 ndarray로 감싸고, 배열이 해제될 때 블록을 닫습니다."""
+    shm = shared_memory.SharedMemory(name=name)
+    arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    # 이름은 바로 제거 (매핑은 arr이 살아있는 동안 유지됨)
+    shm.unlink()
+    weakref.finalize(arr, shm.close)
+    return arr
+
+
+class DecodeService:
+    """
+    워커 프로세스 풀에서 이미지를 디코딩하는 서비스.
+    결과 픽셀은 multiprocessing.shared_memory로 전달되어 GIL/피클링 비용 없이 받아옵니다.
+
+    사용 예:
+        service = DecodeService()
+        future = service.submit(path)          # 비동기 (prefetch)
+        img = service.decode(path)             # 동기
+        for img in service.map(paths, max_side=150):  # 폴더 일괄 스캔 (썸네일)
+            ...
+
+    set_reader(ReadAheadReader)로 읽기 계층을 붙이면 파일 바이트는 그 계층에서 비동기로 읽고
+    (미리 읽은 버퍼 공유), 워커는 공유 메모리로 받은 바이트를 디코딩만 합니다.
+    """
+
+    def __init__(self, workers=0):
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        # Qt 스레드가 살아있는 프로세스에서 fork는 위험하므로 spawn 사용
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("spawn"))
+        self.reader = None
+
+    def set_reader(self, reader):
+        """파일 읽기 계층 (core.io_service.ReadAheadReader, None이면 워커가 경로로 직접 읽음)"""
+        self.reader = reader
+
+    def submit(self, path, reduce=1, max_side=None) -> Future:
+        """디코딩 요청을 보내고, RGB ndarray(실패 시 None)를 담을 Future를 반환합니다."""
+        result = Future()
+        reader = self.reader
+        if reader is None:
+            self._submit_decode(result, path, reduce, max_side, None)
+            return result
+
+        read = reader.read(path)
+
+        def _on_read(f):
+            if result.cancelled():
+                return
+            data = None
+            if not f.cancelled():
+                try:
+                    data = f.result()
+                except Exception as e:
+                    logging.warning(f"[DecodeService] 미리 읽기 실패 {path}: {e}")
+            # 읽기 계층에서 실패하면 워커가 경로로 직접 읽음
+            buffer = (data.name, len(data)) if data else None
+            self._submit_decode(result, path, reduce, max_side, buffer)
+
+        read.add_done_callback(_on_read)
+        return result
+
+    def _submit_decode(self, result, path, reduce, max_side, buffer):
+        try:
+            inner = self._executor.submit(_decode_to_shm, path, reduce, max_side, buffer, tracer.enabled)
+        except RuntimeError:
+            # 종료된 풀 (창을 닫는 중 늦게 끝난 읽기)
+            result.cancel()
+            return
+
+        def _on_done(f):
+            if f.cancelled():
+                result.cancel()
+                return
+            try:
+                meta, events = f.result()
+            except Exception as e:
+                logging.error(f"[DecodeService] 디코딩 실패 {path}: {e}")
+                meta, events = None, []
+            # 워커 프로세스의 계측 구간을 오버레이 / Chrome trace에 반영
+            tracer.merge(events)
+            # 취소된 요청이어도 블록은 반드시 attach해야 unlink됨 (img 해제 시 정리)
+            img = attach_shared(*meta) if meta else None
+            if result.set_running_or_notify_cancel():
+                result.set_result(img)
+
+        inner.add_done_callback(_on_done)
+        result.add_done_callback(lambda r: inner.cancel() if r.cancelled() else None)
+
+    def decode(self, path, reduce=1, max_side=None):
+        return self.submit(path, reduce, max_side).result()
+
+    def map(self, paths, reduce=1, max_side=None):
+        """여러 경로를 모든 코어에 분산 디코딩하고, 입력 순서대로 결과를 돌려줍니다."""
+        futures = [self.submit(p, reduce, max_side) for p in paths]
+        for f in futures:
+            yield f.result()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_service = None
+
+
+def get_decode_service(workers=0) -> DecodeService:
+    """프로세스 전역 디코드 서비스 (최초 호출 시 생성)"""
+    global _service
+    if _service is None:
+        _service = DecodeService(workers)
+    return _service
+
+
+def shutdown_decode_service():
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
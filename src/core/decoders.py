@@ -0,0 +1,114 @@
+"""
+형식별 디코더 등록/선택.
+
+형식은 파일 앞부분의 매직 바이트로 판별하고 (utils.image_formats), 형식마다 빠른 순으로 등록된
+디코더를 차례로 시도해 처음 성공한 결과를 씁니다. 이 환경의 OpenCV 빌드가 모르는 형식
+(예: AVIF 없이 빌드된 OpenCV)은 cv2.imdecode가 머리만 보고 바로 None을 돌려주므로
+다음 디코더(Pillow)로 넘어가는 비용이 거의 없습니다.
+
+    img = decode_bgr(data, reduce=4)                 # 파일 바이트 -> BGR ndarray (1/4 축소)
+    register_decoder("webp", "pillow", pillow_decode, first=True)   # 새 디코더 추가 / 순서 변경
+
+축소 디코딩(reduce)은 코덱이 지원하면 디코딩 단계에서 (JPEG: DCT 축소), 아니면 전체를 푼 뒤 줄입니다.
+디코더별 속도 비교: python tests/benchmark_decoders.py
+"""
+import io
+import logging
+from typing import NamedTuple, Callable
+
+import cv2
+import numpy as np
+
+from utils.image_formats import FORMATS, SNIFF_BYTES, sniff
+
+# cv2 축소 디코딩 플래그 (JPEG는 DCT 단계에서 바로 축소되어 훨씬 빠름, 나머지는 디코딩 후 축소)
+_REDUCE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def opencv_decode(data, reduce=1):
+    return cv2.imdecode(data, _REDUCE_FLAGS.get(reduce, cv2.IMREAD_COLOR))
+
+
+def pillow_decode(data, reduce=1):
+    """Pillow 디코딩 (JPEG는 draft로 DCT 축소, 나머지는 디코딩 후 정수 배율 축소). 첫 프레임만."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as im:
+        width = im.width
+        if reduce > 1 and im.format == "JPEG":
+            im.draft("RGB", (max(1, im.width // reduce), max(1, im.height // reduce)))
+        rgb = im if im.mode == "RGB" else im.convert("RGB")
+        factor = round(rgb.width / max(1, width // reduce))
+        if factor > 1:
+            rgb = rgb.reduce(factor)
+        arr = np.asarray(rgb)
+    return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+
+
+class Decoder(NamedTuple):
+    name: str
+    decode: Callable  # (np.ndarray[uint8] 파일 바이트, reduce) -> BGR ndarray | None
+
+
+# 형식 -> 디코더 (빠른 순, tests/benchmark_decoders.py 기준)
+DECODERS = {
+    "jpeg": [Decoder("opencv", opencv_decode), Decoder("pillow", pillow_decode)],
+    "png": [Decoder("opencv", opencv_decode), Decoder("pillow", pillow_decode)],
+    "gif": [Decoder("pillow", pillow_decode), Decoder("opencv", opencv_decode)],
+    "webp": [Decoder("opencv", opencv_decode), Decoder("pillow", pillow_decode)],
+    "avif": [Decoder("pillow", pillow_decode), Decoder("opencv", opencv_decode)],  # libavif 디코더 차이
+    "bmp": [Decoder("opencv", opencv_decode), Decoder("pillow", pillow_decode)],
+    "tiff": [Decoder("opencv", opencv_decode), Decoder("pillow", pillow_decode)],
+}
+# 형식을 판별하지 못했을 때 차례로 시도
+FALLBACK = [Decoder("opencv", opencv_decode), Decoder("pillow", pillow_decode)]
+
+
+def register_decoder(fmt, name, decode, first=False):
+    """
+    형식에 디코더를 추가합니다 (같은 이름이 있으면 교체).
+
+    Args:
+        fmt (str): utils.image_formats.FORMATS의 형식 이름
+        name (str): 디코더 이름 (벤치마크/로그 표시용)
+        decode (callable): (파일 바이트 ndarray, reduce) -> BGR ndarray | None
+        first (bool): 가장 먼저 시도 (더 빠른 디코더)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"알 수 없는 이미지 형식: {fmt}")
+    decoders = [d for d in DECODERS.setdefault(fmt, []) if d.name != name]
+    decoders.insert(0 if first else len(decoders), Decoder(name, decode))
+    DECODERS[fmt] = decoders
+
+
+def decoders_for(fmt):
+    return DECODERS.get(fmt) or FALLBACK
+
+
+def decode_bgr(data, reduce=1, fmt=None):
+    """
+    파일 바이트를 BGR ndarray로 디코딩합니다.
+
+    Args:
+        data (np.ndarray): uint8 파일 바이트 (np.fromfile / 공유 메모리 버퍼)
+        reduce (int): 1/2/4/8 축소 배율
+        fmt (str, optional): 형식 (없으면 매직 바이트로 판별)
+
+    Returns:
+        np.ndarray | None: (H, W, 3) uint8 BGR, 모든 디코더가 실패하면 None
+    """
+    fmt = fmt or sniff(data[:SNIFF_BYTES])
+    for decoder in decoders_for(fmt):
+        try:
+            img = decoder.decode(data, reduce)
+        except Exception as e:
+            logging.debug(f"[decoders] {decoder.name} 실패 ({fmt}): {e}")
+            continue
+        if img is not None:
+            return img
+    return None
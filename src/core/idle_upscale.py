@@ -0,0 +1,223 @@
+"""
+유휴 시간 미리 업스케일.
+
+읽는 순서대로 다음 페이지들을 업스케일 캐시에 미리 채워 두는 백그라운드 작업입니다.
+
+- 별도 프로세스에서 낮은 OS 우선순위(nice)와 제한된 코어 수(affinity + 추론 스레드 수)로 실행
+- 사용자 입력이 들어오면 프로세스 자체를 일시 정지 (SIGSTOP / psutil.suspend) →
+  추론 중간이라도 즉시 CPU를 돌려주고, 입력이 멈추면 이어서 계속
+- 캐시 파일은 임시 이름으로 쓴 뒤 교체하므로 중간에 끝나도 반쯤 쓴 파일이 남지 않고,
+  폴더/압축 파일별 진행 위치는 CACHE_DIR/idle_upscale.json에 저장
+"""
+import os
+import json
+import signal
+import logging
+import queue
+import multiprocessing as mp
+from dataclasses import asdict
+
+from utils.image_utils import CACHE_DIR, is_image_file
+from utils.image_formats import is_animated
+
+PROGRESS_PATH = os.path.join(CACHE_DIR, "idle_upscale.json")
+NICE_INCREMENT = 10
+
+
+def plan_queue(paths, current, cached, ahead=0, animated=is_animated, limit=0):
+    """
+    미리 업스케일할 페이지 목록 (현재 페이지를 포함해 읽는 순서대로, 이미 캐시된 페이지와
+    GIF 등 애니메이션 페이지 제외). 현재 페이지가 아직 캐시되지 않았으면 가장 먼저 처리합니다.
+
+    Args:
+        paths (list[str]): 페이지 목록
+        current (int): 현재 페이지 위치
+        cached (callable): path -> 캐시에 결과가 있는지
+        ahead (int): 현재 페이지 뒤로 더 볼 페이지 수 (0이면 끝까지)
+        animated (callable): path -> 애니메이션 페이지인지 (기본: 헤더 판별)
+        limit (int): 이만큼 찾으면 나머지는 보지 않음 (0이면 전부, cached 확인은 파일 접근이라 큰 폴더에서 느림)
+    """
+    start = max(0, current)
+    end = len(paths) if ahead <= 0 else min(len(paths), start + 1 + ahead)
+    queue = []
+    for p in paths[start:end]:
+        if is_image_file(p) and not animated(p) and not cached(p):
+            queue.append(p)
+            if len(queue) == limit:
+                break
+    return queue
+
+
+class ProgressStore:
+    """폴더/압축 파일별 미리 업스케일 진행 상황 (완료한 페이지 수 / 전체)"""
+
+    def __init__(self, path=PROGRESS_PATH):
+        self.path = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    def get(self, source):
+        return self.data.get(source, {"done": 0, "total": 0})
+
+    def update(self, source, done, total):
+        self.data[source] = {"done": done, "total": total}
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.warning(f"[미리 업스케일] 진행 상황 저장 실패: {e}")
+
+
+def _lower_priority(cores):
+    """현재 프로세스를 낮은 우선순위 + 코어 cores개로 제한"""
+    try:
+        os.nice(NICE_INCREMENT)
+    except (AttributeError, OSError):
+        try:
+            import psutil
+            psutil.Process().nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+        except Exception:
+            pass
+    if hasattr(os, "sched_setaffinity"):
+        available = sorted(os.sched_getaffinity(0))
+        # 뒤쪽 코어를 사용 (GUI/디코드 워커는 보통 앞쪽 코어부터 스케줄됨)
+        os.sched_setaffinity(0, available[-cores:])
+
+
+def write_atomic(cache_path, img_rgb):
+    """임시 파일에 쓴 뒤 교체 (확장자로 형식을 정하므로 임시 이름도 같은 확장자 유지)"""
+    import cv2
+    root, ext = os.path.splitext(cache_path)
+    tmp = f"{root}.part{ext}"
+    if not cv2.imwrite(tmp, cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR)):
+        raise OSError(f"캐시 저장 실패: {cache_path}")
+    os.replace(tmp, cache_path)
+
+
+def _worker_main(settings_fields, model, cores, jobs, results):
+    """
+    백그라운드 프로세스에서 실행: (path, cache_path) 작업을 받아 업스케일 결과를 캐시에 씁니다.
+    None을 받으면 종료.
+    """
+    _lower_priority(cores)
+    from config.settings_loader import AppSettings
+    from core.decode_service import decode_rgb
+    from plugins.plugin_loader import load_plugin
+
+    settings = AppSettings(**settings_fields)
+    settings.inference_threads = cores
+    try:
+        upscaler = load_plugin(model)(settings)
+    except Exception as e:
+        logging.error(f"[미리 업스케일] 모델 로드 실패: {e}")
+        results.put((None, False))
+        return
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        path, cache_path = job
+        ok = False
+        try:
+            if not os.path.exists(cache_path):
+                img = decode_rgb(path)
+                if img is None:
+                    raise ValueError("이미지를 읽을 수 없습니다.")
+                write_atomic(cache_path, upscaler.upscale(img))
+            ok = True
+        except Exception as e:
+            logging.warning(f"[미리 업스케일] 오류: {path} ({e})")
+        results.put((path, ok))
+
+
+class IdleUpscaler:
+    """
+    백그라운드 업스케일 프로세스 관리 (작업은 한 번에 하나씩 보내므로 현재 페이지가 바뀌면
+    다음 작업부터 바로 새 위치 기준으로 진행됩니다).
+    """
+
+    def __init__(self, settings, model="real-esrgan", cores=1):
+        fields = asdict(settings)
+        self.cores = max(1, min(cores, os.cpu_count() or 1))
+        ctx = mp.get_context("spawn")
+        self.jobs = ctx.Queue()
+        self.results = ctx.Queue()
+        self.process = ctx.Process(
+            target=_worker_main, args=(fields, model, self.cores, self.jobs, self.results), daemon=True
+        )
+        self.process.start()
+        self.inflight = None
+        self.paused = False
+        self.failed = False  # 모델 로드 실패 등으로 프로세스가 쓸 수 없음
+
+    def submit(self, path, cache_path):
+        self.inflight = path
+        self.jobs.put((path, cache_path))
+
+    def busy(self):
+        return self.inflight is not None
+
+    def poll(self):
+        """끝난 작업 [(path, ok)] (블로킹 없음)"""
+        done = []
+        while True:
+            try:
+                path, ok = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if path is None:
+                self.failed = True
+                continue
+            if path == self.inflight:
+                self.inflight = None
+            done.append((path, ok))
+        if not self.process.is_alive() and not self.paused:
+            self.failed = True
+        return done
+
+    def _signal(self, suspend):
+        pid = self.process.pid
+        if pid is None or not self.process.is_alive():
+            return
+        if hasattr(signal, "SIGSTOP"):
+            os.kill(pid, signal.SIGSTOP if suspend else signal.SIGCONT)
+            return
+        try:
+            import psutil
+            process = psutil.Process(pid)
+            process.suspend() if suspend else process.resume()
+        except Exception as e:
+            logging.warning(f"[미리 업스케일] 일시 정지 실패: {e}")
+
+    def pause(self):
+        """추론 중이어도 즉시 멈춤"""
+        if not self.paused:
+            self.paused = True
+            self._signal(True)
+
+    def resume(self):
+        if self.paused:
+            self.paused = False
+            self._signal(False)
+
+    def stop(self, timeout=2.0):
+        self.resume()
+        self.jobs.put(None)
+        # 추론 중이면 기다리지 않음 (캐시는 교체 방식으로 쓰므로 반쯤 쓴 결과가 남지 않음)
+        if self.inflight is None:
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        for q in (self.jobs, self.results):
+            q.cancel_join_thread()
+            q.close()
@@ -0,0 +1,293 @@
+"""
+지각 해시(perceptual hash)로 중복/유사 이미지를 찾습니다.
+
+    hashes = hash_images(images)                       # (N, 3) uint64: aHash, dHash, pHash
+    index = HammingIndex(hashes[:, HASH_KINDS.index("phash")], max_distance=6)
+    rows, dists = index.query(h)                      # 거리 6 이내 항목
+    groups = index.duplicate_groups()                 # 서로 가까운 항목끼리 묶음
+
+해시는 축소 디코딩(1/4, 긴 변 128px) 결과에서 계산하며, HashStore가 원본 크기/수정시각과 함께
+캐시에 저장하므로 두 번째 검색부터는 바뀐 파일만 다시 디코딩합니다.
+"""
+import os
+import json
+import logging
+
+import cv2
+import numpy as np
+
+from utils.image_utils import CACHE_DIR
+
+HASH_INDEX_PATH = os.path.join(CACHE_DIR, "image_hash_index.json")
+HASH_KINDS = ("ahash", "dhash", "phash")
+
+# 해시 계산용 축소 디코딩 (JPEG는 DCT 단계에서 바로 1/4로 디코딩됨)
+HASH_DECODE_REDUCE = 4
+HASH_DECODE_MAX_SIDE = 128
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m.astype(np.float32)
+
+
+_DCT32 = _dct_matrix(32)
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    _POP8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(x):
+        x = np.ascontiguousarray(x, dtype=np.uint64)
+        return _POP8[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+def hamming(a, b):
+    """uint64 해시(배열) 사이의 해밍 거리"""
+    return _popcount(np.bitwise_xor(np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64)))
+
+
+def _pack_bits(bits):
+    # (N, 64) bool -> (N,) uint64, 첫 비트가 최상위 비트
+    return np.packbits(bits, axis=1).view(">u8").ravel().astype(np.uint64)
+
+
+def _gray(img, size):
+    gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY) if img.ndim == 3 else img
+    return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+
+def hash_images(images):
+    """
+    여러 이미지의 aHash / dHash / pHash를 한 번에 계산합니다.
+    이미지별로는 작은 리사이즈만 하고, 비교/DCT는 배치 전체에 벡터 연산으로 적용합니다.
+
+    Args:
+        images (list[np.ndarray]): RGB 또는 grayscale uint8 배열
+
+    Returns:
+        np.ndarray: (N, 3) uint64, 열 순서는 HASH_KINDS
+    """
+    n = len(images)
+    if n == 0:
+        return np.zeros((0, 3), dtype=np.uint64)
+
+    small = np.stack([_gray(img, (32, 32)) for img in images]).astype(np.float32)   # (N, 32, 32)
+    wide = np.stack([_gray(img, (9, 8)) for img in images]).astype(np.int16)        # (N, 8, 9)
+
+    # aHash: 8x8 평균보다 밝은지
+    mean8 = small.reshape(n, 8, 4, 8, 4).mean(axis=(2, 4)).reshape(n, 64)
+    ahash = _pack_bits(mean8 > mean8.mean(axis=1, keepdims=True))
+
+    # dHash: 가로로 이웃한 픽셀보다 밝아지는지
+    dhash = _pack_bits((wide[:, :, 1:] > wide[:, :, :-1]).reshape(n, 64))
+
+    # pHash: 32x32 DCT의 저주파 8x8 계수가 (DC 제외) 중앙값보다 큰지
+    dct = np.einsum("ij,njk,lk->nil", _DCT32, small, _DCT32, optimize=True)
+    low = dct[:, :8, :8].reshape(n, 64)
+    phash = _pack_bits(low > np.median(low[:, 1:], axis=1, keepdims=True))
+
+    return np.stack([ahash, dhash, phash], axis=1)
+
+
+class HammingIndex:
+    """
+    다중 인덱스 해싱(multi-index hashing)으로 해밍 거리 검색을 합니다.
+
+    64비트를 max_distance + 1개 구간으로 나누면 거리 max_distance 이내인 두 해시는
+    적어도 한 구간이 정확히 같습니다 (비둘기집 원리). 구간 값별로 정렬해 두고
+    같은 값을 가진 후보에만 해밍 거리를 계산하므로 전체 비교 없이 찾을 수 있습니다.
+    완전히 같은 해시(빈 페이지, 재업로드)는 먼저 하나로 합쳐 색인합니다.
+    """
+
+    def __init__(self, hashes, max_distance=6):
+        self.hashes = np.ascontiguousarray(hashes, dtype=np.uint64)
+        self.max_distance = max_distance
+
+        self._unique, inverse, counts = np.unique(self.hashes, return_inverse=True, return_counts=True)
+        self._rows = np.argsort(inverse.ravel(), kind="stable")  # 고유 해시 순서로 묶인 행 번호
+        self._offsets = np.r_[0, np.cumsum(counts)]
+
+        parts = min(max_distance + 1, 64)
+        bounds = np.linspace(0, 64, parts + 1).astype(int)
+        self._chunks = []  # (shift, mask, 정렬된 구간 값, 정렬 순서)
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            shift = np.uint64(lo)
+            mask = np.uint64((1 << int(hi - lo)) - 1)
+            values = (self._unique >> shift) & mask
+            order = np.argsort(values, kind="stable")
+            self._chunks.append((shift, mask, values[order], order))
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def _expand(self, uids):
+        # 고유 해시 번호 -> 원래 행 번호들
+        if len(uids) == 0:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate([self._rows[self._offsets[u]:self._offsets[u + 1]] for u in uids])
+
+    def query(self, h, radius=None):
+        """
+        Returns:
+            (np.ndarray, np.ndarray): 거리 radius 이내 항목의 행 번호와 거리 (행 번호 순)
+        """
+        radius = self.max_distance if radius is None else radius
+        h = np.uint64(h)
+        if radius > self.max_distance:
+            # 구간 조건이 보장되지 않으므로 전체 비교
+            uids = np.arange(len(self._unique))
+        else:
+            candidates = [np.zeros(0, dtype=np.int64)]
+            for shift, mask, values, order in self._chunks:
+                key = (h >> shift) & mask
+                lo, hi = np.searchsorted(values, key, "left"), np.searchsorted(values, key, "right")
+                candidates.append(order[lo:hi])
+            uids = np.unique(np.concatenate(candidates))
+
+        dists = hamming(self._unique[uids], h)
+        keep = dists <= radius
+        uids, dists = uids[keep], dists[keep]
+        rows = self._expand(uids)
+        dists = np.repeat(dists, np.diff(self._offsets)[uids])
+        order = np.argsort(rows, kind="stable")
+        return rows[order], dists[order]
+
+    def duplicate_groups(self, radius=None, block=1024):
+        """
+        거리 radius 이내로 이어지는 항목들을 묶어 반환합니다 (2개 이상인 묶음만, 큰 묶음부터).
+
+        Returns:
+            list[list[int]]: 행 번호 묶음
+        """
+        radius = min(self.max_distance if radius is None else radius, self.max_distance)
+        parent = list(range(len(self._unique)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for _, _, values, order in self._chunks:
+            # 같은 구간 값을 가진 버킷만 서로 비교
+            starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+            ends = np.r_[starts[1:], len(values)]
+            multi = ends - starts > 1
+            for s, e in zip(starts[multi], ends[multi]):
+                members = order[s:e]
+                hs = self._unique[members]
+                for b in range(0, len(members), block):  # 큰 버킷도 메모리 제한 안에서 비교
+                    near = hamming(hs[b:b + block, None], hs[None, :]) <= radius
+                    ii, jj = np.nonzero(near)
+                    for i, j in zip(members[b + ii].tolist(), members[jj].tolist()):
+                        if i < j:
+                            ri, rj = find(i), find(j)
+                            if ri != rj:
+                                parent[max(ri, rj)] = min(ri, rj)
+
+        groups = {}
+        for u in range(len(parent)):
+            groups.setdefault(find(u), []).append(u)
+        counts = np.diff(self._offsets)
+        result = [
+            sorted(self._expand(uids).tolist())
+            for uids in groups.values() if len(uids) > 1 or counts[uids[0]] > 1
+        ]
+        return sorted(result, key=len, reverse=True)
+
+
+class HashStore:
+    """
+    key -> (원본 크기, 수정시각, aHash, dHash, pHash) 영구 저장소.
+    원본이 바뀐 항목은 조회되지 않으므로 다시 계산됩니다.
+    """
+
+    def __init__(self, path=HASH_INDEX_PATH):
+        self.path = path
+        self.dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, key, stamp):
+        entry = self.entries.get(key)
+        if entry is None or tuple(entry[:2]) != tuple(stamp):
+            return None
+        return tuple(int(h, 16) for h in entry[2:])
+
+    def put(self, key, stamp, hashes):
+        self.entries[key] = [*stamp, *(f"{int(h):016x}" for h in hashes)]
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def find_duplicates(items, decode_service, kind="phash", max_distance=6, store=None, chunk=256, progress=None):
+    """
+    중복/유사 이미지 묶음을 찾습니다.
+
+    Args:
+        items (list[tuple[str, str, str]]): (색인 키, 디코딩할 파일 경로, 수정 여부를 볼 원본 경로)
+        decode_service (DecodeService): 해시가 없는 파일의 축소 디코딩에 사용
+        kind (str): 비교에 쓸 해시 ("ahash" / "dhash" / "phash")
+        max_distance (int): 같은 이미지로 볼 최대 해밍 거리
+        store (HashStore, optional): 해시 캐시 (기본: HASH_INDEX_PATH)
+        chunk (int): 한 번에 디코딩할 파일 수 (공유 메모리 사용량 제한)
+        progress (callable, optional): progress(처리한 수, 전체 수)
+
+    Returns:
+        list[list[str]]: 파일 경로 묶음 (큰 묶음부터)
+    """
+    store = HashStore() if store is None else store
+    column = HASH_KINDS.index(kind)
+
+    paths, values, missing = [], [], []
+    for key, path, source in items:
+        try:
+            st = os.stat(source)
+        except OSError:
+            continue
+        stamp = (st.st_size, st.st_mtime)
+        hashes = store.get(key, stamp)
+        if hashes is None:
+            missing.append((key, path, stamp))
+        else:
+            paths.append(path)
+            values.append(hashes[column])
+
+    done = len(items) - len(missing)
+    for start in range(0, len(missing), chunk):
+        batch = missing[start:start + chunk]
+        decoded = list(decode_service.map(
+            [path for _, path, _ in batch], reduce=HASH_DECODE_REDUCE, max_side=HASH_DECODE_MAX_SIDE
+        ))
+        ok = [(entry, img) for entry, img in zip(batch, decoded) if img is not None]
+        if ok:
+            hashes = hash_images([img for _, img in ok])
+            for ((key, path, stamp), _), row in zip(ok, hashes):
+                store.put(key, stamp, row)
+                paths.append(path)
+                values.append(row[column])
+        done += len(batch)
+        if progress:
+            progress(done, len(items))
+    store.save()
+    logging.info(f"[중복 검색] {len(items)}개 중 {len(missing)}개 새로 계산")
+
+    index = HammingIndex(np.array(values, dtype=np.uint64), max_distance)
+    return [[paths[i] for i in group] for group in index.duplicate_groups()]
@@ -0,0 +1,242 @@
+"""
+파일 바이트 비동기 읽기 + 순차 미리 읽기.
+
+NFS/SMB 같은 네트워크 드라이브나 느린 USB 디스크에서는 파일을 여는 것과
+읽기 요청마다 왕복 지연이 붙습니다. 페이지를 넘길 때마다 이 지연을 그대로 기다리지 않도록,
+제한된 스레드 풀이 다음 페이지 파일들을 읽는 순서대로 큰 단위로 통째 읽어 공유 메모리에 두고,
+디코드 워커는 그 블록을 복사 없이 열어 메모리에서 바로 디코딩합니다 (cv2.imdecode, DecodeService.set_reader).
+
+    reader = ReadAheadReader(workers=4, budget_bytes=128 * 1024 ** 2)
+    reader.read_ahead(next_paths)          # 다음 페이지들 미리 읽기 (순서대로)
+    buf = reader.read(path).result()       # SharedBuffer (실패 시 None)
+
+느린 저장소를 흉내 내는 LatencyOpener로 로컬 디스크에서도 동작과 처리량을 확인할 수 있습니다.
+"""
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+from utils.perf_trace import tracer
+
+READ_CHUNK = 4 * 1024 ** 2  # 한 번의 read 요청 크기 (네트워크 왕복 횟수를 줄이도록 크게)
+
+
+class LatencyOpener:
+    """
+    느린 저장소 흉내 (테스트/벤치마크용): open과 read 호출마다 latency초,
+    bandwidth(byte/s)가 있으면 전송 시간만큼 더 기다립니다.
+    """
+
+    def __init__(self, latency=0.02, bandwidth=None):
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def __call__(self, path, mode="rb"):
+        time.sleep(self.latency)
+        return _SlowFile(open(path, mode), self)
+
+
+class _SlowFile:
+    def __init__(self, f, opener):
+        self.f = f
+        self.opener = opener
+
+    def _wait(self, n):
+        delay = self.opener.latency
+        if self.opener.bandwidth:
+            delay += n / self.opener.bandwidth
+        time.sleep(delay)
+
+    def fileno(self):
+        return self.f.fileno()
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self._wait(len(data))
+        return data
+
+    def readinto(self, buf):
+        n = self.f.readinto(buf)
+        self._wait(n or 0)
+        return n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.f.close()
+        return False
+
+
+class SharedBuffer:
+    """
+    공유 메모리 블록에 담긴 파일 바이트. 블록은 읽기 계층이 소유하고 (캐시에서 빠질 때 해제),
+    디코드 워커는 이름으로 열어 읽기만 합니다.
+    """
+    __slots__ = ("shm", "size")
+
+    def __init__(self, shm, size):
+        self.shm = shm
+        self.size = size
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __len__(self):
+        return self.size
+
+    def tobytes(self):
+        return bytes(self.shm.buf[:self.size])
+
+    def release(self):
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except (BufferError, FileNotFoundError):
+            pass
+
+
+class ReadAheadReader:
+    """
+    파일 바이트를 스레드 풀에서 읽어 두는 캐시.
+    같은 파일의 요청(미리보기 디코딩 + 전체 디코딩 등)은 한 번의 읽기를 공유하고,
+    완료된 버퍼는 budget_bytes 안에서 최근 요청 순으로 유지합니다.
+    """
+
+    def __init__(self, workers=4, budget_bytes=128 * 1024 ** 2, opener=open, chunk=READ_CHUNK):
+        self.workers = max(1, workers)
+        self.budget_bytes = budget_bytes
+        self.opener = opener
+        self.chunk = chunk
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="read_ahead")
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # path -> Future[bytes | None] (오래된 요청부터)
+        self._sizes = {}               # 읽기가 끝난 path -> byte 수
+
+    def _read_file(self, path):
+        with tracer.span("read_file"):
+            try:
+                with self.opener(path, "rb") as f:
+                    return self._read_into_shm(f)
+            except OSError as e:
+                logging.warning(f"[ReadAheadReader] 읽기 실패 {path}: {e}")
+                return None
+
+    def _read_into_shm(self, f):
+        """열린 파일 전체를 새 공유 메모리 블록으로 (크기를 알면 블록에 바로 읽어 복사 없음)"""
+        try:
+            size = os.fstat(f.fileno()).st_size
+        except (AttributeError, OSError):
+            size = None
+        if size is None:
+            data = f.read()
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+            shm.buf[:len(data)] = data
+            return SharedBuffer(shm, len(data))
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        view = shm.buf
+        filled = 0
+        try:
+            while filled < size:
+                n = f.readinto(view[filled:min(size, filled + self.chunk)])
+                if not n:
+                    break  # 읽는 사이 파일이 줄어든 경우
+                filled += n
+        except BaseException:
+            del view
+            SharedBuffer(shm, 0).release()
+            raise
+        del view
+        return SharedBuffer(shm, filled)
+
+    def read(self, path) -> Future:
+        """파일 전체를 읽을 Future (이미 읽었거나 읽는 중이면 그것을 공유)"""
+        with self._lock:
+            future = self._entries.get(path)
+            if future is not None and not future.cancelled():
+                self._entries.move_to_end(path)
+                tracer.count("read_ahead", hit=future.done())
+                return future
+            tracer.count("read_ahead", hit=False)
+            future = self._entries[path] = self._executor.submit(self._read_file, path)
+        future.add_done_callback(lambda f, p=path: self._on_read(p, f))
+        return future
+
+    def read_ahead(self, paths):
+        """paths를 순서대로 미리 읽습니다 (앞쪽 파일이 먼저 풀에 들어가므로 먼저 끝남)."""
+        for path in paths:
+            with self._lock:
+                known = path in self._entries
+            if not known:
+                self.read(path)
+
+    def _on_read(self, path, future):
+        if future.cancelled():
+            return
+        data = future.result()
+        with self._lock:
+            if self._entries.get(path) is not future:
+                # 읽는 동안 캐시에서 빠진 파일
+                if data is not None:
+                    data.release()
+                return
+            if data is None:
+                # 실패는 캐시하지 않음 (다음 요청에서 다시 시도)
+                del self._entries[path]
+                return
+            self._sizes[path] = len(data)
+        over = self.nbytes() - self.budget_bytes
+        if over > 0:
+            self.evict(over)
+
+    @staticmethod
+    def _release(future):
+        if future.cancel() or not future.done():
+            return
+        data = future.result()
+        if data is not None:
+            data.release()
+
+    def discard(self, path):
+        with self._lock:
+            future = self._entries.pop(path, None)
+            self._sizes.pop(path, None)
+        if future is not None:
+            self._release(future)
+
+    def nbytes(self):
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def evict(self, bytes_needed):
+        """오래전에 요청된 버퍼부터 해제 (읽는 중인 파일은 유지)"""
+        freed = 0
+        with self._lock:
+            for path in list(self._entries):
+                if freed >= bytes_needed:
+                    break
+                future = self._entries[path]
+                if not future.done():
+                    continue
+                del self._entries[path]
+                freed += self._sizes.pop(path, 0)
+                self._release(future)
+        return freed
+
+    def clear(self):
+        with self._lock:
+            futures = list(self._entries.values())
+            self._entries.clear()
+            self._sizes.clear()
+        for future in futures:
+            self._release(future)
+
+    def shutdown(self):
+        self.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
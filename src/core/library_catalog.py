@@ -0,0 +1,271 @@
+"""
+폴더/압축 파일 단위 이미지 카탈로그 (SQLite).
+
+    catalog = LibraryCatalog()
+    catalog.scan_folder(folder)                                   # 바뀐 파일만 헤더를 다시 읽음
+    names = catalog.list_pages(folder, sort="pixels", descending=True, filter_by="portrait")
+    name = catalog.first_page(folder, sort="pixels", descending=True)   # 가장 큰 이미지
+
+크기/해상도/형식/프레임 수는 픽셀을 디코딩하지 않고 PIL 헤더만 읽어 구합니다.
+정렬 열마다 (source_id, 열) 색인이 있어 10만 장 폴더도 정렬/필터/이동이 바로 끝납니다.
+"""
+import io
+import os
+import time
+import logging
+import sqlite3
+import threading
+
+from utils.image_utils import CACHE_DIR, is_image_file, natural_sort_key
+
+CATALOG_PATH = os.path.join(CACHE_DIR, "library.sqlite3")
+
+# 정렬 이름 -> 열 (이름 정렬은 자연 정렬 키)
+SORT_COLUMNS = {
+    "name": "natural_key",
+    "size": "size",
+    "pixels": "pixels",
+    "mtime": "mtime",
+}
+
+FILTERS = {
+    "": "",
+    "portrait": "AND height > width",
+    "landscape": "AND width >= height",
+    "animated": "AND frames > 1",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,          -- folder / archive
+    size INTEGER,
+    mtime REAL,
+    scanned_at REAL
+);
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,          -- 폴더 안 파일 이름 또는 압축 내부 멤버 이름
+    natural_key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    pixels INTEGER NOT NULL,
+    format TEXT,
+    frames INTEGER NOT NULL DEFAULT 1,
+    UNIQUE (source_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_images_name ON images(source_id, natural_key);
+CREATE INDEX IF NOT EXISTS idx_images_size ON images(source_id, size);
+CREATE INDEX IF NOT EXISTS idx_images_pixels ON images(source_id, pixels);
+CREATE INDEX IF NOT EXISTS idx_images_mtime ON images(source_id, mtime);
+"""
+
+
+def probe_image(fp):
+    """
+    픽셀 디코딩 없이 헤더만 읽어 (width, height, format, frames)를 반환합니다.
+
+    Args:
+        fp (str | file-like): 이미지 경로 또는 바이너리 스트림
+    """
+    from PIL import Image
+
+    with Image.open(fp) as im:
+        frames = getattr(im, "n_frames", 1) if getattr(im, "is_animated", False) else 1
+        return im.width, im.height, im.format, frames
+
+
+class LibraryCatalog:
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 스캔 워커와 UI 스레드가 같은 인스턴스를 쓸 수 있도록 잠금으로 직렬화
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    # ------------------------------------------------------------ 스캔
+
+    def _source(self, path, kind):
+        path = os.path.abspath(path)
+        row = self._conn.execute("SELECT id, size, mtime FROM sources WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            cur = self._conn.execute("INSERT INTO sources (path, kind) VALUES (?, ?)", (path, kind))
+            return cur.lastrowid, None
+        return row[0], (row[1], row[2])
+
+    def _apply(self, source_id, known, current, probe, stop=None):
+        """
+        known: {name: (size, mtime)} DB 내용, current: {name: (size, mtime)} 실제 내용
+        probe(name): (width, height, format, frames)
+        stop(): True를 반환하면 지금까지 읽은 것만 반영하고 중단 (다음 스캔이 나머지를 읽음)
+
+        Returns:
+            (int, bool): 새로 읽은 항목 수, 끝까지 읽었는지
+        """
+        removed = [(source_id, n) for n in known if n not in current]
+        changed = [n for n, stamp in current.items() if known.get(n) != stamp]
+
+        rows = []
+        complete = True
+        for name in changed:
+            if stop is not None and stop():
+                complete = False
+                break
+            try:
+                width, height, fmt, frames = probe(name)
+            except Exception as e:
+                logging.warning(f"[카탈로그] 헤더 읽기 실패: {name} ({e})")
+                continue
+            size, mtime = current[name]
+            rows.append((source_id, name, natural_sort_key(name), size, mtime,
+                         width, height, width * height, fmt, frames))
+
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM images WHERE source_id = ? AND name = ?", removed)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO images "
+                "(source_id, name, natural_key, size, mtime, width, height, pixels, format, frames) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            if complete:
+                self._conn.execute("UPDATE sources SET scanned_at = ? WHERE id = ?", (time.time(), source_id))
+        return len(rows), complete
+
+    def _known(self, source_id):
+        with self._lock:
+            rows = self._conn.execute("SELECT name, size, mtime FROM images WHERE source_id = ?", (source_id,))
+            return {name: (size, mtime) for name, size, mtime in rows}
+
+    def scan_folder(self, folder, stop=None):
+        """
+        폴더를 스캔해 추가/변경된 파일의 헤더만 읽고, 사라진 파일은 지웁니다.
+
+        Returns:
+            int: 새로 읽은 파일 수
+        """
+        with self._lock, self._conn:
+            source_id, _ = self._source(folder, "folder")
+
+        current = {}
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_file() and is_image_file(entry.name):
+                    st = entry.stat()
+                    current[entry.name] = (st.st_size, st.st_mtime)
+
+        count, _ = self._apply(
+            source_id, self._known(source_id), current, lambda n: probe_image(os.path.join(folder, n)), stop
+        )
+        return count
+
+    def scan_archive(self, archive_path, stop=None):
+        """
+        압축 파일을 스캔합니다. 압축 파일 크기/수정시각이 그대로면 아무것도 읽지 않습니다.
+
+        Returns:
+            int: 새로 읽은 멤버 수
+        """
+        from utils.archive_reader import open_archive
+
+        st = os.stat(archive_path)
+        stamp = (st.st_size, st.st_mtime)
+        with self._lock, self._conn:
+            source_id, known_stamp = self._source(archive_path, "archive")
+        if known_stamp == stamp:
+            return 0
+
+        reader = open_archive(archive_path)
+        try:
+            # 크기는 멤버 실제 크기, 수정시각은 압축 파일 것을 기록 (멤버는 압축 파일과 함께 바뀌므로
+            # 같은 압축 파일에서 이미 읽은 멤버는 건너뛰고, 압축 파일이 바뀌면 모두 다시 읽음)
+            current = {name: (reader.size(name), st.st_mtime) for name in reader.names()}
+            count, complete = self._apply(
+                source_id, self._known(source_id), current, lambda n: probe_image(io.BytesIO(reader.read(n))), stop
+            )
+        finally:
+            reader.close()
+        if not complete:
+            return count
+        # 끝까지 읽었을 때만 압축 파일 stamp를 기록 (이전 버전의 멤버는 삭제)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM images WHERE source_id = ? AND mtime != ?", (source_id, st.st_mtime))
+            self._conn.execute("UPDATE sources SET size = ?, mtime = ? WHERE id = ?", (*stamp, source_id))
+        return count
+
+    # ------------------------------------------------------------ 조회
+
+    def has_source(self, path):
+        """한 번 이상 끝까지 스캔한 폴더/압축 파일인지"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT scanned_at FROM sources WHERE path = ?", (os.path.abspath(path),)
+            ).fetchone()
+        return row is not None and row[0] is not None
+
+    def _query(self, source_path, sort, descending, filter_by, extra="", params=(), limit=None):
+        column = SORT_COLUMNS[sort]
+        order = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT name FROM images WHERE source_id = (SELECT id FROM sources WHERE path = ?) "
+            f"{FILTERS[filter_by]} {extra} ORDER BY {column} {order}, natural_key {order}"
+        )
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            return [r[0] for r in self._conn.execute(sql, (os.path.abspath(source_path), *params))]
+
+    def list_pages(self, source_path, sort="name", descending=False, filter_by=""):
+        """
+        정렬/필터된 이름 목록. 아직 스캔하지 않은 폴더/압축 파일이면 None.
+
+        Returns:
+            list[str] | None: 폴더면 파일 이름, 압축 파일이면 멤버 이름
+        """
+        if not self.has_source(source_path):
+            return None
+        return self._query(source_path, sort, descending, filter_by)
+
+    def first_page(self, source_path, sort="name", descending=False, filter_by=""):
+        """정렬/필터 조건의 첫 항목 (예: 가장 큰 이미지 = sort="pixels", descending=True)"""
+        names = self._query(source_path, sort, descending, filter_by, limit=1)
+        return names[0] if names else None
+
+    def next_page(self, source_path, after_name, filter_by=""):
+        """이름 순서로 after_name 다음에 오는, 필터 조건을 만족하는 첫 항목 (예: 다음 애니메이션)"""
+        names = self._query(
+            source_path, "name", False, filter_by,
+            extra="AND natural_key > ?", params=(natural_sort_key(after_name),), limit=1
+        )
+        return names[0] if names else None
+
+    def info(self, source_path, name):
+        """(width, height, format, frames, size) 또는 None"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT width, height, format, frames, size FROM images "
+                "WHERE source_id = (SELECT id FROM sources WHERE path = ?) AND name = ?",
+                (os.path.abspath(source_path), name)
+            ).fetchone()
+
+    def sizes(self, source_path):
+        """{이름: (width, height)} — 픽셀을 디코딩하지 않고 페이지 배치를 잡을 때 사용"""
+        with self._lock:
+            return {
+                name: (w, h) for name, w, h in self._conn.execute(
+                    "SELECT name, width, height FROM images "
+                    "WHERE source_id = (SELECT id FROM sources WHERE path = ?)",
+                    (os.path.abspath(source_path),)
+                )
+            }
@@ -0,0 +1,116 @@
+"""
+전역 메모리 예산 관리자.
+
+캐시/버퍼를 가진 객체는 크기 조회 함수와 해제 함수를 우선순위와 함께 등록합니다.
+enforce()는 전체 사용량이 예산을 넘거나 시스템 가용 메모리가 부족할 때,
+우선순위가 낮은 것부터 필요한 만큼만 해제를 요청합니다.
+
+    governor.register("prefetch", PRIORITY_PREFETCH, size_fn, evict_fn)
+    governor.enforce()
+
+evict_fn(bytes_needed)는 실제로 해제한 byte 수를 반환해야 합니다.
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable
+
+from utils.memory_info import read_meminfo
+
+# 숫자가 작을수록 먼저 해제됩니다
+PRIORITY_PREFETCH = 10        # 미리 디코딩한 다음 페이지
+PRIORITY_READ_AHEAD = 15      # 미리 읽어 둔 파일 바이트 (디코딩 결과보다 작고, 다시 읽기는 느린 저장소 왕복)
+PRIORITY_THUMBNAIL = 20       # 썸네일 픽스맵
+PRIORITY_REGION_TILES = 30    # 영역 업스케일 타일
+PRIORITY_GIF_LOOKAHEAD = 40   # 현재 프레임 외 GIF 프레임
+PRIORITY_STRIP_PAGES = 50     # 세로 연속 보기 페이지 (화면 밖 여유분부터 해제)
+PRIORITY_CURRENT_PAGE = 80    # 화면에 표시 중인 원본
+PRIORITY_MODEL = 90           # 상주 업스케일 모델
+
+
+@dataclass
+class _Owner:
+    name: str
+    priority: int
+    size_fn: Callable[[], int]
+    evict_fn: Callable[[int], int]
+
+
+class MemoryGovernor:
+    def __init__(self, budget_bytes=0, min_available_ratio=0.1):
+        """
+        Args:
+            budget_bytes (int): 등록된 캐시 전체의 예산 (0이면 전체 메모리의 절반)
+            min_available_ratio (float): 시스템 가용 메모리가 이 비율 아래면 압박 상태로 판단
+        """
+        self.budget_bytes = budget_bytes
+        self.min_available_ratio = min_available_ratio
+        self._owners = {}
+        self._lock = threading.Lock()
+
+    def configure(self, budget_bytes=None, min_available_ratio=None):
+        if budget_bytes is not None:
+            self.budget_bytes = budget_bytes
+        if min_available_ratio is not None:
+            self.min_available_ratio = min_available_ratio
+
+    def register(self, name, priority, size_fn, evict_fn):
+        with self._lock:
+            self._owners[name] = _Owner(name, priority, size_fn, evict_fn)
+
+    def unregister(self, name):
+        with self._lock:
+            self._owners.pop(name, None)
+
+    def usage(self):
+        """등록된 항목별 현재 사용량 (byte)"""
+        with self._lock:
+            owners = list(self._owners.values())
+        return {o.name: o.size_fn() for o in owners}
+
+    def effective_budget(self, meminfo=None):
+        if self.budget_bytes > 0:
+            return self.budget_bytes
+        meminfo = read_meminfo() if meminfo is None else meminfo
+        return meminfo.get("MemTotal", 4 * 1024 ** 3) // 2
+
+    def pressure_deficit(self, meminfo=None):
+        """시스템 가용 메모리가 기준치보다 얼마나 부족한지 (부족하지 않으면 0)"""
+        meminfo = read_meminfo() if meminfo is None else meminfo
+        total = meminfo.get("MemTotal")
+        available = meminfo.get("MemAvailable")
+        if not total or available is None:
+            return 0
+        return max(0, int(total * self.min_available_ratio) - available)
+
+    def enforce(self, meminfo=None):
+        """
+        예산 초과분과 시스템 부족분 중 큰 만큼을 우선순위 낮은 항목부터 해제합니다.
+
+        Returns:
+            dict[str, int]: 항목별 해제된 byte 수
+        """
+        meminfo = read_meminfo() if meminfo is None else meminfo
+        with self._lock:
+            owners = sorted(self._owners.values(), key=lambda o: o.priority)
+
+        total = sum(o.size_fn() for o in owners)
+        need = max(total - self.effective_budget(meminfo), self.pressure_deficit(meminfo))
+
+        freed = {}
+        for owner in owners:
+            if need <= 0:
+                break
+            if owner.size_fn() <= 0:
+                continue
+            released = owner.evict_fn(need) or 0
+            if released:
+                freed[owner.name] = released
+                need -= released
+
+        if freed:
+            logging.info(f"[메모리] 해제: { {k: f'{v / 1024 ** 2:.1f}MB' for k, v in freed.items()} }")
+        return freed
+
+
+governor = MemoryGovernor()
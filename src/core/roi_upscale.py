@@ -0,0 +1,152 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from utils.perf_trace import tracer
+
+
+class RegionTileCache:
+    """
+    영역 업스케일 결과를 (이미지 키, x, y, w, h) 단위로 보관하는 LRU 캐시.
+    타일 좌표가 고정 격자에 정렬되어 있어 패닝 시 겹치는 타일을 그대로 재사용합니다.
+    """
+
+    def __init__(self, max_tiles=64):
+        self.max_tiles = max_tiles
+        self.cache = OrderedDict()
+
+    def get(self, key):
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        return None
+
+    def put(self, key, tile):
+        self.cache[key] = tile
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.max_tiles:
+            self.cache.popitem(last=False)
+
+    def nbytes(self):
+        return sum(tile.nbytes for tile in self.cache.values())
+
+    def evict(self, bytes_needed):
+        freed = 0
+        while self.cache and freed < bytes_needed:
+            _, tile = self.cache.popitem(last=False)
+            freed += tile.nbytes
+        return freed
+
+    def clear(self):
+        self.cache.clear()
+
+
+def visible_region(img_w, img_h, zoom, center=(0.5, 0.5)):
+    """
+    확대 배율과 화면 중심(0~1 정규화 좌표)으로 현재 보이는 이미지 영역을 계산합니다.
+
+    Returns:
+        tuple[int, int, int, int]: (x, y, w, h)
+    """
+    zoom = max(1.0, zoom)
+    w = max(1, int(img_w / zoom))
+    h = max(1, int(img_h / zoom))
+    x = int(center[0] * img_w - w / 2)
+    y = int(center[1] * img_h - h / 2)
+    x = min(max(0, x), img_w - w)
+    y = min(max(0, y), img_h - h)
+    return x, y, w, h
+
+
+def grid_tiles(region, img_w, img_h, tile=256, margin=64):
+    """
+    보이는 영역에 여백(margin)을 더한 뒤, 고정 격자(tile 크기)에 맞춘 타일 목록을 반환합니다.
+
+    Returns:
+        tuple[tuple, list[tuple]]: (격자에 맞춘 전체 영역, 타일 (x, y, w, h) 목록)
+    """
+    x, y, w, h = region
+    x0 = max(0, x - margin) // tile * tile
+    y0 = max(0, y - margin) // tile * tile
+    x1 = min(img_w, x + w + margin)
+    y1 = min(img_h, y + h + margin)
+
+    tiles = []
+    for ty in range(y0, y1, tile):
+        for tx in range(x0, x1, tile):
+            tiles.append((tx, ty, min(tile, img_w - tx), min(tile, img_h - ty)))
+
+    covered_x1 = max(tx + tw for tx, _, tw, _ in tiles)
+    covered_y1 = max(ty + th for _, ty, _, th in tiles)
+    return (x0, y0, covered_x1 - x0, covered_y1 - y0), tiles
+
+
+def _padded_rect(img, rect, pad):
+    # 타일 경계 이음새를 막기 위해 주변 pad 픽셀을 포함한 영역
+    x, y, w, h = rect
+    img_h, img_w = img.shape[:2]
+    px0, py0 = max(0, x - pad), max(0, y - pad)
+    px1, py1 = min(img_w, x + w + pad), min(img_h, y + h + pad)
+    return px0, py0, px1, py1
+
+
+def _upscale_tiles(img, rects, upscaler, pad):
+    # 캐시에 없는 타일을 모아 upscale_batch 한 번으로 처리한 뒤 패딩 부분을 잘라냄
+    padded = [_padded_rect(img, rect, pad) for rect in rects]
+    crops = [np.ascontiguousarray(img[py0:py1, px0:px1]) for px0, py0, px1, py1 in padded]
+    outputs = upscaler.upscale_batch(crops)
+
+    tiles = []
+    for (x, y, w, h), (px0, py0, _, _), crop, out in zip(rects, padded, crops, outputs):
+        s = out.shape[0] / crop.shape[0]
+        ox, oy = int(round((x - px0) * s)), int(round((y - py0) * s))
+        tiles.append(out[oy:oy + int(round(h * s)), ox:ox + int(round(w * s))])
+    return tiles
+
+
+def upscale_region(img, region, upscaler, cache, image_key, tile=256, margin=64, pad=10):
+    """
+    보이는 영역(+여백)만 업스케일합니다. 이미 처리된 타일은 캐시에서 재사용합니다.
+
+    Args:
+        img (np.ndarray): 화면에 표시 중인 RGB 원본
+        region (tuple): 보이는 영역 (x, y, w, h)
+        upscaler (BaseUpscaler): 업스케일러 플러그인
+        cache (RegionTileCache): 타일 캐시
+        image_key (str): 이미지 식별자 (경로 + 변환 상태)
+
+    Returns:
+        tuple[np.ndarray, tuple]: (업스케일된 영역, 원본 좌표계의 해당 영역 (x, y, w, h))
+    """
+    img_h, img_w = img.shape[:2]
+    covered, tiles = grid_tiles(region, img_w, img_h, tile, margin)
+    cx, cy, cw, ch = covered
+
+    results = [(rect, cache.get((image_key, *rect))) for rect in tiles]
+    missing = [rect for rect, out in results if out is None]
+    for rect, out in results:
+        tracer.count("region_tiles", hit=out is not None)
+    if missing:
+        upscaled = dict(zip(missing, _upscale_tiles(img, missing, upscaler, pad)))
+        for rect, out in upscaled.items():
+            cache.put((image_key, *rect), out)
+        results = [(rect, out if out is not None else upscaled[rect]) for rect, out in results]
+
+    s = results[0][1].shape[0] / results[0][0][3]
+    canvas = np.zeros((int(round(ch * s)), int(round(cw * s)), img.shape[2]), dtype=img.dtype)
+    for (x, y, w, h), out in results:
+        ox, oy = int(round((x - cx) * s)), int(round((y - cy) * s))
+        th = min(out.shape[0], canvas.shape[0] - oy)
+        tw = min(out.shape[1], canvas.shape[1] - ox)
+        canvas[oy:oy + th, ox:ox + tw] = out[:th, :tw]
+
+    return canvas, covered
+
+
+def crop_upscaled(canvas, covered, region):
+    """업스케일된 영역(canvas)에서 현재 보이는 영역(region)만 잘라냅니다."""
+    cx, cy, cw, ch = covered
+    x, y, w, h = region
+    s = canvas.shape[0] / ch
+    x0, y0 = int(round((x - cx) * s)), int(round((y - cy) * s))
+    return canvas[y0:y0 + int(round(h * s)), x0:x0 + int(round(w * s))]
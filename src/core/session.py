@@ -0,0 +1,73 @@
+"""
+마지막으로 보던 위치 저장/복원 (이어 보기).
+
+종료할 때 폴더/압축 파일, 페이지, 보기 상태와 함께 화면에 그려져 있던 그림을
+화면 해상도 스냅샷(JPEG)으로 저장합니다. 다음 실행에서는 목록/디코딩을 기다리지 않고
+스냅샷부터 그린 뒤, 실제 페이지를 백그라운드에서 다시 엽니다.
+"""
+import os
+import json
+import logging
+from dataclasses import dataclass, asdict, field, fields
+
+from utils.image_utils import CACHE_DIR
+
+SESSION_PATH = os.path.join(CACHE_DIR, "session.json")
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, "session_snapshot.jpg")
+
+
+@dataclass
+class SessionState:
+    source: str                   # 폴더 또는 압축 파일 (절대 경로)
+    page: str                     # 폴더 안 파일 이름 또는 압축 내부 멤버 이름
+    index: int = 0                # 목록이 바뀌어 page를 못 찾을 때 사용할 위치
+    page_mode: str = "single"
+    zoom: float = 1.0
+    view_center: list = field(default_factory=lambda: [0.5, 0.5])
+    page_offset: float = 0.0      # 세로 연속 보기에서 페이지 안 스크롤 위치 (페이지 높이 비율)
+    rotation_angle: int = 0
+    flip_horizontal: bool = False
+    flip_vertical: bool = False
+    geometry: list = field(default_factory=list)  # 창 위치/크기 (스냅샷이 같은 크기로 그려지도록)
+    snapshot_mtime: float = 0.0   # 스냅샷을 저장한 시점 (다른 세션의 스냅샷과 섞이지 않도록)
+
+    @property
+    def is_archive(self):
+        return os.path.isfile(self.source)
+
+    def page_path(self):
+        """폴더 세션의 페이지 경로 (압축 세션은 None)"""
+        return None if self.is_archive else os.path.join(self.source, self.page)
+
+
+def load_session(path=SESSION_PATH):
+    """저장된 세션 (없거나 원본이 사라졌으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        names = {f.name for f in fields(SessionState)}
+        state = SessionState(**{k: v for k, v in data.items() if k in names})
+    except (OSError, ValueError, TypeError):
+        return None
+    if not os.path.exists(state.source):
+        return None
+    return state
+
+
+def save_session(state, path=SESSION_PATH):
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(state), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    except OSError as e:
+        logging.warning(f"[세션] 저장 실패: {e}")
+
+
+def snapshot_valid(state, snapshot_path=SNAPSHOT_PATH):
+    """스냅샷이 이 세션에서 저장한 것인지"""
+    try:
+        return abs(os.path.getmtime(snapshot_path) - state.snapshot_mtime) < 1e-3
+    except OSError:
+        return False
@@ -0,0 +1,117 @@
+"""
+슬라이드쇼 전환 시각 관리.
+
+    clock = SlideshowClock(interval=5.0)
+    deadline = clock.start()
+    ...                                   # 마감 전에 다음 페이지 디코딩/축소를 끝내 둠
+    missed = clock.record(shown_at, prepare_time)
+    service.submit(path, reduce=clock.reduce)
+
+마감은 이전 마감 + 간격으로 잡아 누적 지연이 생기지 않게 하고,
+준비 시간이 간격에 비해 빠듯하거나 마감을 놓치면 디코딩 품질 단계(축소 배율)를 낮춥니다.
+여유가 충분히 생기면 다시 원래 품질로 돌아갑니다.
+"""
+import time
+from collections import deque
+
+# cv2 축소 디코딩 배율 (클수록 빠르고 거침)
+QUALITY_TIERS = (1, 2, 4, 8)
+
+
+class SlideshowClock:
+    def __init__(self, interval, tolerance=0.016, max_tier=len(QUALITY_TIERS) - 1, clock=time.perf_counter):
+        """
+        Args:
+            interval (float): 기본 전환 간격 (초)
+            tolerance (float): 이 시간보다 늦게 표시되면 마감 초과로 기록 (기본: 60Hz 한 프레임)
+            max_tier (int): 허용할 가장 낮은 품질 단계 (QUALITY_TIERS 위치)
+        """
+        self.interval = interval
+        self.tolerance = tolerance
+        self.max_tier = max_tier
+        self.clock = clock
+        self.tier = 0
+        self.deadline = None
+        self.transitions = 0
+        self.misses = 0
+        self.lateness = deque(maxlen=200)
+        self._comfortable = 0
+
+    @property
+    def reduce(self):
+        return QUALITY_TIERS[self.tier]
+
+    def start(self, duration=None):
+        self.deadline = self.clock() + (duration or self.interval)
+        return self.deadline
+
+    def remaining(self):
+        """다음 마감까지 남은 시간 (초, 지났으면 음수)"""
+        return self.deadline - self.clock()
+
+    def record(self, shown_at, prepare_time, next_duration=None):
+        """
+        전환 결과를 기록하고 품질 단계와 다음 마감 시각을 갱신합니다.
+
+        Args:
+            shown_at (float): 새 페이지가 실제로 그려진 시각 (clock 기준)
+            prepare_time (float): 이 페이지의 디코딩/축소에 걸린 시간 (초)
+            next_duration (float, optional): 이번 페이지를 보여줄 시간 (세로로 긴 페이지 자동 스크롤 등)
+
+        Returns:
+            bool: 마감을 놓쳤는지
+        """
+        late = shown_at - self.deadline
+        missed = late > self.tolerance
+        self.transitions += 1
+        self.misses += missed
+        self.lateness.append(max(0.0, late))
+
+        if missed or prepare_time > 0.8 * self.interval:
+            # 따라가지 못하면 멈추는 대신 더 작게 디코딩
+            self.tier = min(self.tier + 1, self.max_tier)
+            self._comfortable = 0
+        elif self.tier > 0:
+            # 한 단계 올렸을 때 예상 준비 시간 (픽셀 수는 배율의 제곱에 비례)
+            ratio = (QUALITY_TIERS[self.tier] / QUALITY_TIERS[self.tier - 1]) ** 2
+            self._comfortable = self._comfortable + 1 if prepare_time * ratio < 0.5 * self.interval else 0
+            if self._comfortable >= 3:
+                self.tier -= 1
+                self._comfortable = 0
+
+        # 이전 마감 기준으로 다음 마감을 잡되, 한 주기 넘게 밀렸으면 현재 시각 기준으로 다시 맞춤
+        self.deadline += next_duration or self.interval
+        if self.deadline < shown_at:
+            self.deadline = shown_at + (next_duration or self.interval)
+        return missed
+
+    def stats(self):
+        late = sorted(self.lateness)
+        p95 = late[int((len(late) - 1) * 0.95)] if late else 0.0
+        return {
+            "transitions": self.transitions,
+            "misses": self.misses,
+            "miss_rate": self.misses / self.transitions if self.transitions else 0.0,
+            "p95_late_ms": p95 * 1000,
+            "reduce": self.reduce,
+        }
+
+
+def scroll_window(img_w, img_h, view_w, view_h, progress):
+    """
+    세로로 긴 페이지를 화면 너비에 맞춰 위에서 아래로 훑을 때 보이는 행 범위.
+
+    Args:
+        progress (float): 0(맨 위) ~ 1(맨 아래)
+
+    Returns:
+        tuple[int, int]: (y, h)
+    """
+    h = min(img_h, max(1, int(img_w * view_h / max(1, view_w))))
+    y = int((img_h - h) * min(max(progress, 0.0), 1.0))
+    return y, h
+
+
+def is_tall_page(img_w, img_h, view_w, view_h, min_aspect=2.0):
+    """세로가 가로의 min_aspect배 이상이고, 화면 너비에 맞추면 화면보다 길어지는 페이지 (웹툰 등)"""
+    return img_h >= min_aspect * img_w and img_h * view_w > view_h * img_w
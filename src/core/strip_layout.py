@@ -0,0 +1,77 @@
+"""
+세로 연속(웹툰) 보기의 페이지 배치 계산.
+
+페이지마다 원본 크기(헤더/카탈로그에서 얻은 값, 모르면 기본 비율)만 알고 있으면
+화면 너비에 맞춘 높이와 누적 위치를 계산할 수 있어, 픽셀을 디코딩하지 않고도
+전체 스크롤 길이와 화면에 걸친 페이지 범위를 구할 수 있습니다.
+"""
+from bisect import bisect_right
+from itertools import accumulate
+
+DEFAULT_ASPECT = 1.4  # 크기를 모르는 페이지의 세로/가로 비율 (일반적인 만화 페이지)
+
+
+class StripLayout:
+    def __init__(self, sizes, width, gap=0, default_aspect=DEFAULT_ASPECT):
+        """
+        Args:
+            sizes (list[tuple[int, int] | None]): 페이지별 원본 (width, height)
+            width (int): 화면 너비 (페이지를 이 너비에 맞춤)
+            gap (int): 페이지 사이 간격 (px)
+        """
+        self.width = max(1, width)
+        self.gap = gap
+        self.default_aspect = default_aspect
+        self._aspects = [self._aspect(size) for size in sizes]
+        self._offsets = None
+
+    def _aspect(self, size):
+        if not size or size[0] <= 0 or size[1] <= 0:
+            return self.default_aspect
+        return size[1] / size[0]
+
+    def __len__(self):
+        return len(self._aspects)
+
+    def _layout(self):
+        if self._offsets is None:
+            heights = (self.page_height(i) + self.gap for i in range(len(self._aspects)))
+            self._offsets = [0, *accumulate(heights)]
+        return self._offsets
+
+    def set_width(self, width):
+        width = max(1, width)
+        if width != self.width:
+            self.width = width
+            self._offsets = None
+
+    def set_size(self, index, width, height):
+        """실제 크기를 알게 된 페이지를 반영합니다. 높이가 바뀌었으면 True."""
+        aspect = self._aspect((width, height))
+        if abs(aspect - self._aspects[index]) < 1e-6:
+            return False
+        self._aspects[index] = aspect
+        self._offsets = None
+        return True
+
+    def page_height(self, index):
+        return max(1, round(self.width * self._aspects[index]))
+
+    def offset(self, index):
+        """페이지 윗변의 y 좌표"""
+        return self._layout()[index]
+
+    def total_height(self):
+        return self._layout()[-1] - (self.gap if self._aspects else 0)
+
+    def page_at(self, y):
+        """y 좌표가 속한 페이지 번호 (범위 밖이면 처음/마지막 페이지)"""
+        if not self._aspects:
+            return -1
+        return min(max(0, bisect_right(self._layout(), y) - 1), len(self._aspects) - 1)
+
+    def visible_range(self, top, bottom):
+        """[top, bottom) 구간에 걸치는 페이지 범위 (first, last), 없으면 (0, -1)"""
+        if not self._aspects or bottom <= top:
+            return 0, -1
+        return self.page_at(top), self.page_at(max(top, bottom - 1))
@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, asdict
+
+from utils.image_utils import CACHE_DIR
+from utils.memory_info import available_memory_bytes, process_rss_bytes
+
+CALIBRATION_PATH = os.path.join(CACHE_DIR, "tile_calibration.json")
+
+# 후보 타일 크기 (큰 것부터 시도)
+TILE_CANDIDATES = (1024, 768, 512, 384, 256, 192, 128, 96, 64)
+
+
+@dataclass
+class TilePlan:
+    tile: int            # 0이면 타일 분할 없이 통째로 처리
+    tile_pad: int
+    batch: int           # 한 번에 모델에 넣을 타일(이미지) 수
+    est_peak_bytes: int  # 예상 최대 작업 메모리
+
+
+@dataclass
+class Calibration:
+    bytes_per_megapixel: int
+    sec_per_megapixel: float
+
+
+def _pad_for(tile):
+    # 패딩이 너무 작으면 경계 이음새, 너무 크면 중복 연산 → 타일의 1/16 (8~32px)
+    return max(8, min(32, tile // 16))
+
+
+def plan_tiles(img_w, img_h, bytes_per_megapixel, max_batch=1, available=None, memory_ratio=0.5, pre_pad=10):
+    """
+    이미지 크기와 가용 메모리로 타일 크기 / 패딩 / 배치 수를 정합니다.
+
+    Args:
+        img_w, img_h (int): 입력 이미지 크기
+        bytes_per_megapixel (int): 입력 1MP 처리 시 모델 작업 메모리 (capabilities 또는 보정값)
+        max_batch (int): 플러그인이 허용하는 최대 배치
+        available (int, optional): 가용 메모리 (기본: 시스템 MemAvailable)
+        memory_ratio (float): 가용 메모리 중 업스케일에 쓸 비율
+
+    Returns:
+        TilePlan
+    """
+    if available is None:
+        available = available_memory_bytes()
+    budget = max(1, int(available * memory_ratio))
+    per_pixel = bytes_per_megapixel / 1e6
+
+    # 통째로 들어가면 타일 분할/패딩 오버헤드가 없는 쪽이 가장 빠름
+    whole = int((img_w + pre_pad) * (img_h + pre_pad) * per_pixel)
+    if whole <= budget:
+        batch = max(1, min(max_batch, budget // max(1, whole)))
+        return TilePlan(tile=0, tile_pad=0, batch=batch, est_peak_bytes=whole * batch)
+
+    for tile in TILE_CANDIDATES:
+        if tile >= max(img_w, img_h):
+            continue
+        pad = _pad_for(tile)
+        per_tile = int((tile + 2 * pad) ** 2 * per_pixel)
+        if per_tile <= budget:
+            batch = max(1, min(max_batch, budget // per_tile))
+            return TilePlan(tile=tile, tile_pad=pad, batch=batch, est_peak_bytes=per_tile * batch)
+
+    tile = TILE_CANDIDATES[-1]
+    pad = _pad_for(tile)
+    logging.warning(f"[타일 계획] 가용 메모리 부족 ({available / 1024 ** 2:.0f}MB), 최소 타일 {tile} 사용")
+    return TilePlan(tile=tile, tile_pad=pad, batch=1, est_peak_bytes=int((tile + 2 * pad) ** 2 * per_pixel))
+
+
+def calibrate(run_probe, sizes=(64, 128)):
+    """
+    짧은 실측으로 입력 1MP당 메모리/시간을 추정합니다.
+
+    Args:
+        run_probe (callable): run_probe(size)가 size x size 입력 하나를 업스케일
+        sizes (tuple[int]): 측정할 정사각 입력 크기 (작은 것 → 큰 것)
+
+    Returns:
+        Calibration
+    """
+    run_probe(sizes[0])  # 워밍업 (가중치 페이지 인, 스레드 풀 생성)
+
+    results = []
+    for size in sizes:
+        baseline = process_rss_bytes()
+        peak = [baseline]
+        done = threading.Event()
+
+        def _sample():
+            while not done.wait(0.005):
+                peak[0] = max(peak[0], process_rss_bytes())
+
+        sampler = threading.Thread(target=_sample, daemon=True)
+        sampler.start()
+        t0 = time.perf_counter()
+        run_probe(size)
+        elapsed = time.perf_counter() - t0
+        done.set()
+        sampler.join()
+        peak[0] = max(peak[0], process_rss_bytes())
+
+        megapixels = size * size / 1e6
+        results.append(((peak[0] - baseline) / megapixels, elapsed / megapixels))
+
+    # 큰 입력 쪽이 고정 오버헤드 영향이 적으므로 마지막 값 사용
+    bytes_per_mp, sec_per_mp = results[-1]
+    return Calibration(bytes_per_megapixel=max(1, int(bytes_per_mp)), sec_per_megapixel=sec_per_mp)
+
+
+def calibration_key(plugin_name, backend):
+    return f"{plugin_name}|{backend}|{os.cpu_count()}"
+
+
+def load_calibration(key, path=CALIBRATION_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return Calibration(**data[key])
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+
+
+def save_calibration(key, calibration, path=CALIBRATION_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+
+    data[key] = asdict(calibration)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
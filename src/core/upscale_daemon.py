@@ -0,0 +1,409 @@
+"""
+여러 뷰어 창/프로세스, 일괄 변환, 스크립트가 함께 쓰는 로컬 업스케일 서비스.
+
+모델 하나를 별도 프로세스에 상주시키고, 모든 클라이언트의 요청을 전역 큐 하나로 받아
+순서대로 (같은 크기끼리는 배치로) 추론합니다. 클라이언트가 몇 개든 모델 메모리와
+추론에 쓰는 코어 수는 그대로입니다. 픽셀은 공유 메모리로 주고받고, 소켓으로는
+블록 이름과 shape만 보냅니다.
+
+    python -m core.upscale_daemon serve                 # 서비스 실행 (설정의 모델)
+    python -m core.upscale_daemon status
+    python -m core.upscale_daemon upscale a.jpg b.png -o out/
+    python -m core.upscale_daemon stop
+
+뷰어는 upscale_daemon 설정을 켜면 create_upscaler가 RemoteUpscaler를 돌려주며,
+서비스가 없으면 자동으로 띄우고 연결할 수 없으면 프로세스 안의 모델로 돌아갑니다.
+주소는 Unix 소켓 경로 또는 "host:port" (Unix 소켓이 없는 환경은 로컬 TCP) 입니다.
+"""
+import os
+import sys
+import time
+import queue
+import socket
+import logging
+import argparse
+import threading
+import subprocess
+from multiprocessing.connection import Listener, Client, AuthenticationError
+
+from core.decode_service import share_array, attach_shared
+from plugins.base_upscaler import BaseUpscaler, UpscalerCapabilities
+from utils.image_utils import CACHE_DIR
+from utils.perf_trace import tracer
+
+DEFAULT_UNIX_ADDRESS = os.path.join(CACHE_DIR, "upscale_daemon.sock")
+DEFAULT_TCP_ADDRESS = "127.0.0.1:47621"
+AUTHKEY_PATH = os.path.join(CACHE_DIR, "upscale_daemon.key")
+AUTOSTART_IDLE_TIMEOUT = 600.0  # 자동 실행한 서비스는 클라이언트 없이 이 시간이 지나면 종료
+CONNECT_TIMEOUT = 30.0          # 자동 실행 후 모델 로드까지 기다릴 시간
+
+
+def parse_address(text=""):
+    """설정 문자열 -> multiprocessing.connection 주소 (빈 값이면 플랫폼 기본값)"""
+    if not text:
+        text = DEFAULT_UNIX_ADDRESS if hasattr(socket, "AF_UNIX") else DEFAULT_TCP_ADDRESS
+    host, sep, port = text.rpartition(":")
+    if sep and port.isdigit() and os.sep not in host:
+        return host or "127.0.0.1", int(port)
+    return os.path.abspath(text)
+
+
+def load_authkey(create=False):
+    """같은 사용자 프로세스끼리만 연결하도록 쓰는 인증 키 (권한 0600 파일)"""
+    try:
+        with open(AUTHKEY_PATH, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        if not create:
+            return None
+    os.makedirs(os.path.dirname(AUTHKEY_PATH), exist_ok=True)
+    key = os.urandom(32)
+    fd = os.open(AUTHKEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+class _Job:
+    __slots__ = ("request_id", "image", "conn", "send_lock")
+
+    def __init__(self, request_id, image, conn, send_lock):
+        self.request_id = request_id
+        self.image = image
+        self.conn = conn
+        self.send_lock = send_lock
+
+
+class UpscaleDaemon:
+    def __init__(self, upscaler, address, authkey, idle_timeout=0.0):
+        """
+        Args:
+            upscaler (BaseUpscaler): 상주시킬 업스케일러
+            address (str | tuple): Unix 소켓 경로 또는 (host, port)
+            authkey (bytes): 연결 인증 키
+            idle_timeout (float): 클라이언트 없이 이 시간(초)이 지나면 종료 (0이면 계속 실행)
+        """
+        self.upscaler = upscaler
+        self.address = address
+        self.authkey = authkey
+        self.idle_timeout = idle_timeout
+        self.jobs = queue.Queue()
+        self.clients = 0
+        self.served = 0
+        self.last_active = time.monotonic()
+        self.listener = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def info(self):
+        caps = self.upscaler.capabilities
+        return {
+            "model": self.upscaler.name,
+            "scale": caps.scale,
+            "supports_tiles": caps.supports_tiles,
+            "max_batch": caps.max_batch,
+            "bytes_per_megapixel": caps.bytes_per_megapixel,
+            "resident_bytes": self.upscaler.resident_bytes(),
+            "clients": self.clients,
+            "queued": self.jobs.qsize(),
+            "served": self.served,
+            "pid": os.getpid(),
+        }
+
+    def _prepare_address(self):
+        if not isinstance(self.address, str):
+            return
+        if os.path.exists(self.address):
+            # 이전 실행이 남긴 소켓 파일이면 지우고, 실제로 떠 있는 서비스면 중복 실행하지 않음
+            try:
+                Client(self.address, authkey=self.authkey).close()
+            except (OSError, EOFError, AuthenticationError):
+                os.remove(self.address)
+            else:
+                raise RuntimeError(f"이미 실행 중인 업스케일 서비스가 있습니다: {self.address}")
+        os.makedirs(os.path.dirname(self.address), exist_ok=True)
+
+    def start(self):
+        """소켓을 열고 추론/감시 스레드를 시작합니다 (serve_forever 전에 호출)."""
+        self._prepare_address()
+        self.listener = Listener(self.address, authkey=self.authkey)
+        if isinstance(self.address, str):
+            os.chmod(self.address, 0o600)
+        self.address = self.listener.address
+        threading.Thread(target=self._work_loop, name="upscale-daemon-worker", daemon=True).start()
+        if self.idle_timeout > 0:
+            threading.Thread(target=self._idle_watch, name="upscale-daemon-idle", daemon=True).start()
+
+    def serve_forever(self):
+        if self.listener is None:
+            self.start()
+        logging.info(f"[업스케일 서비스] {self.upscaler.name} 대기 중: {self.address}")
+        while not self._stopping.is_set():
+            try:
+                conn = self.listener.accept()
+            except AuthenticationError:
+                logging.warning("[업스케일 서비스] 인증 실패한 연결을 거부했습니다.")
+                continue
+            except OSError:
+                break
+            if self._stopping.is_set():
+                conn.close()
+                break
+            threading.Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+        self.listener.close()  # Unix 소켓 파일도 함께 삭제됨
+        logging.info("[업스케일 서비스] 종료")
+
+    def stop(self):
+        # 다른 스레드에서 소켓을 닫아도 accept()가 깨어나지 않으므로 자기 자신에게 한 번 연결
+        self._stopping.set()
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+
+    def _serve_client(self, conn):
+        send_lock = threading.Lock()
+        with self._lock:
+            self.clients += 1
+        try:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    break
+                op = request.get("op")
+                if op == "upscale":
+                    try:
+                        image = attach_shared(*request["image"])
+                    except (OSError, ValueError) as e:
+                        with send_lock:
+                            conn.send({"id": request["id"], "image": None, "error": str(e)})
+                        continue
+                    self.jobs.put(_Job(request["id"], image, conn, send_lock))
+                elif op == "info":
+                    with send_lock:
+                        conn.send(self.info())
+                elif op == "stop":
+                    with send_lock:
+                        conn.send({"stopping": True})
+                    self.stop()
+                    break
+        finally:
+            conn.close()
+            with self._lock:
+                self.clients -= 1
+                self.last_active = time.monotonic()
+
+    def _work_loop(self):
+        max_batch = max(1, self.upscaler.capabilities.max_batch)
+        while True:
+            jobs = [self.jobs.get()]
+            # 대기 중인 요청은 어느 클라이언트 것이든 모아서 한 번에 (같은 크기끼리는 배치 추론)
+            while len(jobs) < max_batch:
+                try:
+                    jobs.append(self.jobs.get_nowait())
+                except queue.Empty:
+                    break
+            error = None
+            try:
+                with tracer.span("daemon_upscale", batch=len(jobs)):
+                    results = self.upscaler.upscale_batch([job.image for job in jobs])
+            except Exception as e:
+                logging.error(f"[업스케일 서비스] 업스케일 실패: {e}")
+                results, error = [None] * len(jobs), str(e)
+            with self._lock:
+                self.served += len(jobs)
+                self.last_active = time.monotonic()
+            for job, result in zip(jobs, results):
+                self._reply(job, result, error)
+
+    def _reply(self, job, result, error):
+        job.image = None  # 입력 공유 메모리 해제
+        meta = share_array(result) if result is not None else None
+        try:
+            with job.send_lock:
+                job.conn.send({"id": job.request_id, "image": meta, "error": error})
+        except OSError:
+            # 응답 전에 클라이언트가 끊겼으면 결과 블록을 직접 정리
+            if meta is not None:
+                attach_shared(*meta)
+
+    def _idle_watch(self):
+        while not self._stopping.wait(5.0):
+            with self._lock:
+                idle = self.clients == 0 and self.jobs.empty()
+                idle_for = time.monotonic() - self.last_active
+            if idle and idle_for > self.idle_timeout:
+                logging.info(f"[업스케일 서비스] {self.idle_timeout:.0f}초 동안 클라이언트가 없어 종료합니다.")
+                self.stop()
+                return
+
+
+class DaemonClient:
+    """업스케일 서비스 연결 하나 (스레드 안전: 요청/응답 쌍 단위로 직렬화)"""
+
+    def __init__(self, address=None, authkey=None):
+        self.address = parse_address(address) if address is None or isinstance(address, str) else address
+        authkey = authkey if authkey is not None else load_authkey()
+        if authkey is None:
+            raise ConnectionError("업스케일 서비스 인증 키가 없습니다 (서비스가 실행된 적 없음).")
+        self.conn = Client(self.address, authkey=authkey)
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def info(self):
+        with self._lock:
+            self.conn.send({"op": "info"})
+            return self.conn.recv()
+
+    def upscale_batch(self, images):
+        """요청을 모두 보낸 뒤 응답을 받아 입력 순서대로 반환합니다 (실패한 항목은 예외)."""
+        with self._lock:
+            ids = []
+            for img in images:
+                self._next_id += 1
+                ids.append(self._next_id)
+                self.conn.send({"op": "upscale", "id": self._next_id, "image": share_array(img)})
+            results = {}
+            while len(results) < len(ids):
+                reply = self.conn.recv()
+                results[reply["id"]] = reply
+        outputs = []
+        for request_id in ids:
+            reply = results[request_id]
+            if reply["image"] is None:
+                raise RuntimeError(f"업스케일 서비스 오류: {reply['error']}")
+            outputs.append(attach_shared(*reply["image"]))
+        return outputs
+
+    def stop_daemon(self):
+        with self._lock:
+            self.conn.send({"op": "stop"})
+            return self.conn.recv()
+
+    def close(self):
+        self.conn.close()
+
+
+class RemoteUpscaler(BaseUpscaler):
+    """업스케일 서비스의 모델을 쓰는 업스케일러 (모델 메모리는 서비스 프로세스에만 있음)"""
+
+    def __init__(self, client, info):
+        self.client = client
+        self.name = info["model"]
+        self.capabilities = UpscalerCapabilities(
+            scale=info["scale"],
+            supports_tiles=info["supports_tiles"],
+            max_batch=info["max_batch"],
+            bytes_per_megapixel=info["bytes_per_megapixel"],
+        )
+
+    def upscale_batch(self, images):
+        with tracer.span("upscale_remote", batch=len(images)):
+            return self.client.upscale_batch(images)
+
+    def close(self):
+        self.client.close()
+
+
+def launch_daemon(address_text="", idle_timeout=AUTOSTART_IDLE_TIMEOUT):
+    """서비스를 백그라운드 프로세스로 실행합니다 (현재 작업 폴더의 설정 사용)."""
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    args = [sys.executable, "-m", "core.upscale_daemon", "serve", "--idle-timeout", str(idle_timeout)]
+    if address_text:
+        args += ["--address", address_text]
+    return subprocess.Popen(
+        args, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        start_new_session=os.name == "posix"
+    )
+
+
+def connect_upscaler(name, settings, autostart=True, timeout=CONNECT_TIMEOUT):
+    """
+    서비스에 연결한 RemoteUpscaler. 서비스가 없으면 띄워서 기다리고,
+    모델/배율이 요청과 다르거나 연결할 수 없으면 None (호출 측이 프로세스 안 모델 사용).
+    """
+    address_text = settings.upscale_daemon_address
+    deadline = time.monotonic() + timeout
+    process = None
+    while True:
+        try:
+            client = DaemonClient(address_text)
+            break
+        except (OSError, EOFError, ConnectionError, AuthenticationError) as e:
+            # 띄운 서비스가 모델 로드에 실패해 끝났으면 더 기다리지 않음
+            failed = process is not None and process.poll() is not None
+            if not autostart or failed or time.monotonic() > deadline:
+                logging.warning(f"[업스케일 서비스] 연결 실패: {e}")
+                return None
+            if process is None:
+                logging.info("[업스케일 서비스] 실행 중인 서비스가 없어 새로 시작합니다.")
+                process = launch_daemon(address_text)
+            time.sleep(0.2)
+
+    info = client.info()
+    if info["model"] != name or abs(info["scale"] - settings.scale_factor) > 1e-6:
+        logging.warning(
+            f"[업스케일 서비스] 서비스 모델({info['model']} x{info['scale']})이 "
+            f"요청({name} x{settings.scale_factor})과 달라 사용하지 않습니다."
+        )
+        client.close()
+        return None
+    return RemoteUpscaler(client, info)
+
+
+def main(argv=None):
+    from config.settings_loader import AppSettings
+
+    parser = argparse.ArgumentParser(description="로컬 업스케일 서비스")
+    parser.add_argument("command", choices=["serve", "status", "stop", "upscale"])
+    parser.add_argument("inputs", nargs="*", help="upscale: 입력 이미지")
+    parser.add_argument("--settings", default="config/settings.json")
+    parser.add_argument("--address", default=None, help="Unix 소켓 경로 또는 host:port (기본: 설정값)")
+    parser.add_argument("--model", default="real-esrgan")
+    parser.add_argument("--idle-timeout", type=float, default=0.0, help="serve: 클라이언트 없이 이 시간(초)이 지나면 종료")
+    parser.add_argument("-o", "--output-dir", default=".", help="upscale: 결과 저장 폴더")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    settings = AppSettings.load_from_json(args.settings)
+    address_text = args.address if args.address is not None else settings.upscale_daemon_address
+
+    if args.command == "serve":
+        from plugins.plugin_loader import load_plugin
+        upscaler = load_plugin(args.model)(settings)  # 서비스 자신은 항상 프로세스 안 모델 사용
+        daemon = UpscaleDaemon(upscaler, parse_address(address_text), load_authkey(create=True), args.idle_timeout)
+        daemon.serve_forever()
+        return 0
+
+    try:
+        client = DaemonClient(address_text)
+    except (OSError, EOFError, ConnectionError, AuthenticationError) as e:
+        print(f"업스케일 서비스에 연결할 수 없습니다: {e}")
+        return 1
+    if args.command == "status":
+        for key, value in client.info().items():
+            print(f"{key:<20}{value}")
+    elif args.command == "stop":
+        client.stop_daemon()
+    else:
+        import cv2
+        from core.decode_service import decode_rgb
+        os.makedirs(args.output_dir, exist_ok=True)
+        for path in args.inputs:
+            img = decode_rgb(path)
+            if img is None:
+                print(f"[!] 이미지를 읽을 수 없습니다: {path}")
+                continue
+            result = client.upscale_batch([img])[0]
+            out_path = os.path.join(args.output_dir, os.path.splitext(os.path.basename(path))[0] + "_upscaled.png")
+            cv2.imwrite(out_path, cv2.cvtColor(result, cv2.COLOR_RGB2BGR))
+            print(out_path)
+    client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
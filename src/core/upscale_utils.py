@@ -1,5 +1,19 @@
+import os
+import cv2
 from plugins.plugin_loader import create_upscaler
+from core.decode_service import decode_rgb
+from utils.image_utils import get_cache_path
 
-def upscale_image(image_path: str, model_name="real-esrgan") -> str:
-    upscaler = create_upscaler(model_name)
-    return upscaler.upscale(image_path)
\ No newline at end of file
+def upscale_image(image_path: str, settings, model_name="real-esrgan") -> str:
+    """이미지 파일을 업스케일해 캐시에 저장하고, 저장된 파일 경로를 반환합니다."""
+    img = decode_rgb(image_path)
+    if img is None:
+        raise ValueError(f"이미지를 읽을 수 없습니다: {image_path}")
+
+    upscaler = create_upscaler(model_name, settings)
+    result = upscaler.upscale(img)
+
+    cache_path = get_cache_path(image_path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    cv2.imwrite(cache_path, cv2.cvtColor(result, cv2.COLOR_RGB2BGR))
+    return cache_path
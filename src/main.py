@@ -1,12 +1,42 @@
 import sys
+import argparse
 from PySide6.QtWidgets import QApplication
-from ui.viewer_window import ImageViewer
+from config.settings_loader import AppSettings
+from utils.single_instance import send_to_running, InstanceServer
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="AI Image Viewer")
+    parser.add_argument("paths", nargs="*", help="열 이미지/압축 파일")
+    parser.add_argument("--new-instance", action="store_true", help="실행 중인 뷰어가 있어도 새 창으로 실행")
+    # Qt 옵션(-style 등)은 QApplication이 처리
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
 
 def main():
+    args = parse_args(sys.argv)
+    settings = AppSettings.load_from_json("config/settings.json")
+    single = settings.single_instance and not args.new_instance
+
+    # 실행 중인 뷰어에 경로만 넘기고 종료 (Qt 위젯/뷰어/모델 초기화 없음)
+    if single and send_to_running(args.paths):
+        sys.exit(0)
+
     app = QApplication(sys.argv)
+    from ui.viewer_window import ImageViewer  # 넘기고 끝나는 실행은 뷰어 모듈을 import하지 않음
     viewer = ImageViewer()
+
+    if single:
+        server = InstanceServer(parent=app)
+        server.filesReceived.connect(viewer.open_files)
+        server.listen()
+
+    # 열 파일이 없으면 마지막으로 보던 페이지의 스냅샷부터 그리고 이어서 엶
+    if not args.paths:
+        viewer.restore_session()
     viewer.show()
+    if args.paths:
+        viewer.open_files(args.paths)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
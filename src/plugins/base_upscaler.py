@@ -1,9 +1,31 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import numpy as np
+
+@dataclass(frozen=True)
+class UpscalerCapabilities:
+    """스케줄러가 작업을 묶고 메모리를 계획할 때 참고하는 플러그인 특성"""
+    scale: float                 # 출력 / 입력 배율
+    supports_tiles: bool         # 이미지 일부(타일)를 따로 넣어도 되는지
+    max_batch: int               # upscale_batch 한 번에 넣을 수 있는 최대 개수
+    bytes_per_megapixel: int     # 입력 1MP 처리 시 필요한 작업 메모리 추정치
 
 class BaseUpscaler(ABC):
+    name = ""
+    capabilities = UpscalerCapabilities(scale=1.0, supports_tiles=True, max_batch=1, bytes_per_megapixel=0)
+
     @abstractmethod
-    def upscale(self, image_path: str) -> str:
+    def upscale_batch(self, images: list[np.ndarray]) -> list[np.ndarray]:
         """
-        이미지를 업스케일링한 후 저장된 파일 경로를 반환합니다.
+        RGB uint8 (H, W, 3) 배열 목록을 업스케일해 같은 순서로 반환합니다.
+        입력은 수정하지 않으며 크기가 서로 달라도 됩니다.
+        반환 배열은 C 연속 메모리가 아닐 수 있습니다.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def upscale(self, image: np.ndarray) -> np.ndarray:
+        return self.upscale_batch([image])[0]
+
+    def resident_bytes(self) -> int:
+        """모델 가중치 등 상주 메모리 크기 (메모리 관리자 보고용)"""
+        return 0
@@ -0,0 +1,126 @@
+"""
+CPU 추론 백엔드 모음.
+
+각 백엔드는 eval 상태의 torch 모델을 받아, 같은 입출력(Nx3xHxW float 텐서)을 갖는
+호출 가능한 객체를 반환합니다. RealESRGANer.model 자리에 그대로 끼워 넣어 사용합니다.
+
+    fp32        : 원본 모델 그대로 (기준)
+    torchscript : trace + freeze + optimize_for_inference (연산 융합, 파이썬 오버헤드 제거)
+    compile     : torch.compile (PyTorch 2.x, 첫 호출 시 컴파일 비용 발생)
+    int8        : FX 정적 양자화 (Conv2d 위주 모델이라 동적 양자화로는 효과가 없음)
+    onnx        : ONNX 내보내기 후 ONNX Runtime CPU 실행
+"""
+import os
+import logging
+
+import numpy as np
+import torch
+
+BACKENDS = {}
+
+
+def register_backend(name):
+    def decorator(fn):
+        BACKENDS[name] = fn
+        return fn
+    return decorator
+
+
+def build_backend(name, model, settings):
+    """
+    Args:
+        name (str): 백엔드 이름 (BACKENDS 키)
+        model (torch.nn.Module): 가중치가 로드된 eval 모델
+        settings (AppSettings): model_path, inference_threads 등 참조
+
+    Returns:
+        callable: model(x)와 동일하게 동작하는 객체
+    """
+    name = (name or "fp32").lower()
+    if name not in BACKENDS:
+        logging.error(f"지원하지 않는 추론 백엔드: {name}")
+        raise ValueError(f"지원하지 않는 추론 백엔드: {name}")
+
+    if settings.inference_threads > 0:
+        torch.set_num_threads(settings.inference_threads)
+
+    try:
+        return BACKENDS[name](model.eval(), settings)
+    except Exception as e:
+        # 백엔드 준비 실패 시 기준 모델로 동작 (onnxruntime 미설치 등)
+        logging.warning(f"[추론 백엔드] {name} 준비 실패, fp32로 대체합니다: {e}")
+        return model
+
+
+def _example_input(size=64):
+    return torch.rand(1, 3, size, size)
+
+
+@register_backend("fp32")
+def _fp32(model, settings):
+    return model
+
+
+@register_backend("torchscript")
+def _torchscript(model, settings):
+    with torch.no_grad():
+        traced = torch.jit.trace(model, _example_input())
+        traced = torch.jit.freeze(traced)
+        return torch.jit.optimize_for_inference(traced)
+
+
+@register_backend("compile")
+def _compile(model, settings):
+    # 타일 크기가 이미지마다 달라지므로 dynamic shape로 컴파일
+    return torch.compile(model, dynamic=True)
+
+
+@register_backend("int8")
+def _int8(model, settings):
+    from torch.ao.quantization import get_default_qconfig_mapping
+    from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+
+    example = _example_input()
+    prepared = prepare_fx(model, get_default_qconfig_mapping("x86"), (example,))
+
+    # 활성값 범위 보정: 실제 이미지 분포에 가깝도록 저주파 노이즈 타일을 사용
+    with torch.no_grad():
+        for _ in range(8):
+            x = torch.nn.functional.interpolate(torch.rand(1, 3, 16, 16), size=(64, 64), mode="bilinear")
+            prepared(x)
+    return convert_fx(prepared)
+
+
+class _OnnxRuntimeModel:
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def __call__(self, x):
+        out = self.session.run(None, {self.input_name: x.detach().cpu().numpy().astype(np.float32)})[0]
+        return torch.from_numpy(out)
+
+
+@register_backend("onnx")
+def _onnx(model, settings):
+    import onnxruntime as ort
+
+    onnx_path = os.path.splitext(settings.model_path)[0] + ".onnx"
+    if not os.path.exists(onnx_path):
+        logging.info(f"[추론 백엔드] ONNX 내보내기: {onnx_path}")
+        torch.onnx.export(
+            model, _example_input(), onnx_path,
+            input_names=["input"], output_names=["output"],
+            dynamic_axes={
+                "input": {0: "batch", 2: "height", 3: "width"},
+                "output": {0: "batch", 2: "height", 3: "width"},
+            },
+            opset_version=17,
+        )
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if settings.inference_threads > 0:
+        options.intra_op_num_threads = settings.inference_threads
+    session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+    return _OnnxRuntimeModel(session)
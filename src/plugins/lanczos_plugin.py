@@ -0,0 +1,34 @@
+from .base_upscaler import BaseUpscaler, UpscalerCapabilities
+import numpy as np
+import cv2
+
+class LanczosUpscaler(BaseUpscaler):
+    """
+    모델 없이 OpenCV Lanczos 보간 + 언샤프 마스크로 업스케일하는 경량 플러그인.
+    수 ms 안에 끝나므로 무거운 모델이 도는 동안 미리보기로 사용합니다.
+    """
+    name = "lanczos"
+
+    def __init__(self, settings):
+        self.scale_factor = settings.scale_factor  # 💡 RealESRGAN과 같은 출력 배율
+        self.sharpen = 0.6
+        self.capabilities = UpscalerCapabilities(
+            scale=self.scale_factor,
+            supports_tiles=True,
+            max_batch=64,
+            bytes_per_megapixel=int(3 * 2 * max(1.0, self.scale_factor) ** 2 * 1024 ** 2),  # 결과 + 블러 버퍼
+        )
+
+    def upscale_batch(self, images: list[np.ndarray]) -> list[np.ndarray]:
+        return [self._upscale_one(img) for img in images]
+
+    def _upscale_one(self, img_np: np.ndarray) -> np.ndarray:
+        h, w = img_np.shape[:2]
+        out_size = (max(1, int(w * self.scale_factor)), max(1, int(h * self.scale_factor)))
+        result_np = cv2.resize(img_np, out_size, interpolation=cv2.INTER_LANCZOS4)
+
+        # 보간으로 뭉개진 경계를 살짝 복원 (result = (1 + a) * img - a * blur)
+        if self.sharpen > 0:
+            blur = cv2.GaussianBlur(result_np, (0, 0), 1.0)
+            result_np = cv2.addWeighted(result_np, 1 + self.sharpen, blur, -self.sharpen, 0)
+        return result_np
@@ -1,17 +1,38 @@
 import logging
-from .real_esrgan_plugin import RealESRGANUpscaler
-# from .waifu2x_plugin import Waifu2xUpscaler
+import importlib
+from typing import NamedTuple
 
+class PluginSpec(NamedTuple):
+    module: str
+    cls: str
+    resident_model: bool  # 로드 비용이 큰 모델을 상주시키는지 (업스케일 서비스로 공유할 대상)
+
+# 무거운 의존성(torch, basicsr)은 실제로 업스케일러를 만들 때 import
 PLUGINS = {
-    "real-esrgan": RealESRGANUpscaler,
-    # "waifu2x": Waifu2xUpscaler,
+    "real-esrgan": PluginSpec(".real_esrgan_plugin", "RealESRGANUpscaler", True),
+    "lanczos": PluginSpec(".lanczos_plugin", "LanczosUpscaler", False),  # 경량 미리보기용
+    # "waifu2x": PluginSpec(".waifu2x_plugin", "Waifu2xUpscaler", True),
 }
 
+def load_plugin(name: str):
+    """플러그인 이름 -> 업스케일러 클래스"""
+    spec = PLUGINS[name.lower()]
+    return getattr(importlib.import_module(spec.module, __package__), spec.cls)
+
 def create_upscaler(name: str, settings):
     name = name.lower()
     if name not in PLUGINS:
         logging.error(f"지원하지 않는 업스케일러: {name}")
         raise ValueError(f"지원하지 않는 업스케일러: {name}")
-    
-    print(f"[DEBUG] RealESRGAN 사용 tile={settings.tile}, tile_pad={settings.tile_pad}, half={settings.half}")
-    return PLUGINS[name](settings)
\ No newline at end of file
+
+    if getattr(settings, "upscale_daemon", False) and PLUGINS[name].resident_model:
+        # 무거운 모델은 여러 뷰어/스크립트가 업스케일 서비스의 모델 하나를 공유
+        from core.upscale_daemon import connect_upscaler
+        upscaler = connect_upscaler(name, settings)
+        if upscaler is not None:
+            logging.debug(f"업스케일 서비스 사용: {name}")
+            return upscaler
+        logging.warning(f"업스케일 서비스를 사용할 수 없어 프로세스 안에서 모델을 로드합니다: {name}")
+
+    logging.debug(f"업스케일러 생성: {name}")
+    return load_plugin(name)(settings)
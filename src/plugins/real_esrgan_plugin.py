@@ -1,10 +1,29 @@
-from .base_upscaler import BaseUpscaler
+from .base_upscaler import BaseUpscaler, UpscalerCapabilities
+from .inference_backends import build_backend
 from basicsr.archs.rrdbnet_arch import RRDBNet
 from realesrgan import RealESRGANer
-from PIL import Image
 import numpy as np
+import torch
+import cv2
+import logging
+from utils.perf_trace import tracer
+from core.tile_planner import plan_tiles, calibrate, calibration_key, load_calibration, save_calibration
+
+MODEL_SCALE = 4
+
+class _TracedModel:
+    """모델 호출(타일 1개 또는 배치 1개)마다 upscale_tile 구간을 기록"""
+
+    def __init__(self, model):
+        self.model = model
+
+    def __call__(self, x):
+        with tracer.span("upscale_tile", shape=list(x.shape)):
+            return self.model(x)
 
 class RealESRGANUpscaler(BaseUpscaler):
+    name = "real-esrgan"
+
     def __init__(self, settings):
         model = RRDBNet(
             num_in_ch=3,
@@ -12,23 +31,138 @@ class RealESRGANUpscaler(BaseUpscaler):
             num_feat=64,
             num_block=23,
             num_grow_ch=32,
-            scale=4  # ⚠️ 고정: 모델 학습 스케일과 일치
+            scale=MODEL_SCALE  # ⚠️ 고정: 모델 학습 스케일과 일치
         )
 
         self.upscaler = RealESRGANer(
             model_path=settings.model_path,
             model=model,
-            scale=4,  # ⚠️ 고정
+            scale=MODEL_SCALE,  # ⚠️ 고정
             tile=settings.tile,
             tile_pad=settings.tile_pad,
             half=settings.half
         )
 
+        self.param_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+
+        # CPU 추론 백엔드 교체 (가중치 로드/eval 이후의 모델을 감쌈)
+        self.backend = settings.inference_backends.get(self.name, "fp32")
+        self.upscaler.model = _TracedModel(build_backend(self.backend, self.upscaler.model, settings))
+
         self.scale_factor = settings.scale_factor  # 💡 output 배율 조정용
 
-        print(f"[DEBUG] RealESRGAN 사용 tile={settings.tile}, tile_pad={settings.tile_pad}, half={settings.half}")
+        self.capabilities = UpscalerCapabilities(
+            scale=self.scale_factor,
+            supports_tiles=True,
+            max_batch=4,
+            # RRDBNet 업샘플 단계의 64ch fp32 특징맵(입력의 16배 픽셀)이 최대치 → 입력 픽셀당 약 9.5KB
+            bytes_per_megapixel=int(9.5 * 1024 ** 3),
+        )
+
+        # 자동 타일 계획: 보정값(실측)이 있으면 capabilities 추정치 대신 사용
+        self.auto_tile = settings.auto_tile
+        self.memory_ratio = settings.tile_memory_ratio
+        self.bytes_per_megapixel = self.capabilities.bytes_per_megapixel
+        if self.auto_tile:
+            key = calibration_key(self.name, self.backend)
+            calibration = load_calibration(key)
+            if calibration is None and settings.tile_calibrate:
+                calibration = calibrate(self._run_probe)
+                save_calibration(key, calibration)
+            if calibration is not None:
+                self.bytes_per_megapixel = calibration.bytes_per_megapixel
+
+        logging.debug(f"RealESRGAN 사용 tile={settings.tile}, tile_pad={settings.tile_pad}, half={settings.half}, backend={self.backend}")
+
+    def upscale_batch(self, images: list[np.ndarray]) -> list[np.ndarray]:
+        results = [None] * len(images)
+
+        # 타일 크기 이하이면서 shape이 같은 이미지끼리 묶어 한 번에 추론
+        groups = {}
+        for i, img in enumerate(images):
+            tile, tile_pad, batch = self._plan(img.shape)
+            if tile and max(img.shape[:2]) > tile:
+                # 큰 이미지는 타일로 나눠 계획된 배치 수만큼씩 추론
+                results[i] = self._enhance_tiled(img, tile, tile_pad, batch)
+            else:
+                groups.setdefault(img.shape, []).append(i)
+
+        for shape, indices in groups.items():
+            batch = self._plan(shape)[2]
+            for start in range(0, len(indices), batch):
+                chunk = indices[start:start + batch]
+                for i, out in zip(chunk, self._infer_batch(np.stack([images[i] for i in chunk]))):
+                    results[i] = out
+        return results
+
+    def resident_bytes(self) -> int:
+        return self.param_bytes
+
+    def _plan(self, shape):
+        """(tile, tile_pad, batch) — 자동 계획이 꺼져 있으면 설정값 그대로"""
+        if not self.auto_tile:
+            return self.upscaler.tile, self.upscaler.tile_pad, self.capabilities.max_batch
+        plan = plan_tiles(
+            shape[1], shape[0], self.bytes_per_megapixel, self.capabilities.max_batch,
+            memory_ratio=self.memory_ratio, pre_pad=self.upscaler.pre_pad
+        )
+        return plan.tile, plan.tile_pad, plan.batch
+
+    def _run_probe(self, size):
+        probe = np.random.randint(0, 256, (1, size, size, 3), dtype=np.uint8)
+        self._infer_batch(probe)
+
+    def _enhance_tiled(self, img, tile, tile_pad, batch):
+        """
+        RealESRGANer.tile_process와 같은 방식 (타일마다 주변 tile_pad 픽셀 포함, 결과에서 패딩 제거)이지만
+        공유 RealESRGANer의 tile/tile_pad를 바꾸지 않아 동시 호출에 안전하고, 같은 크기 타일은 batch개씩 묶어 추론합니다.
+        """
+        h, w = img.shape[:2]
+        s = MODEL_SCALE
+        canvas = np.empty((h * s, w * s, 3), dtype=np.uint8)
+
+        # 패딩 포함 크기가 같은 타일끼리 묶음 (가장자리 타일만 크기가 다름)
+        groups = {}
+        for y in range(0, h, tile):
+            for x in range(0, w, tile):
+                x1, y1 = min(w, x + tile), min(h, y + tile)
+                px0, py0 = max(0, x - tile_pad), max(0, y - tile_pad)
+                px1, py1 = min(w, x1 + tile_pad), min(h, y1 + tile_pad)
+                groups.setdefault((py1 - py0, px1 - px0), []).append((x, y, x1, y1, px0, py0, px1, py1))
+
+        for rects in groups.values():
+            for start in range(0, len(rects), batch):
+                chunk = rects[start:start + batch]
+                crops = np.stack([img[py0:py1, px0:px1] for _, _, _, _, px0, py0, px1, py1 in chunk])
+                for (x, y, x1, y1, px0, py0, _, _), out in zip(chunk, self._forward(crops)):
+                    ox, oy = (x - px0) * s, (y - py0) * s
+                    canvas[y * s:y1 * s, x * s:x1 * s] = out[oy:oy + (y1 - y) * s, ox:ox + (x1 - x) * s]
+
+        if self.scale_factor != MODEL_SCALE:
+            size = (int(w * self.scale_factor), int(h * self.scale_factor))
+            canvas = cv2.resize(canvas, size, interpolation=cv2.INTER_LANCZOS4)
+        return canvas
+
+    def _infer_batch(self, batch: np.ndarray) -> np.ndarray:
+        out = self._forward(batch)
+        if self.scale_factor != MODEL_SCALE:
+            h, w = batch.shape[1:3]
+            size = (int(w * self.scale_factor), int(h * self.scale_factor))
+            out = np.stack([cv2.resize(o, size, interpolation=cv2.INTER_LANCZOS4) for o in out])
+        return out
+
+    def _forward(self, batch: np.ndarray) -> np.ndarray:
+        """(N, H, W, 3) uint8 -> 모델 배율(MODEL_SCALE) 그대로의 (N, H*4, W*4, 3) uint8"""
+        # RealESRGANer.pre_process와 같은 방식으로 오른쪽/아래를 reflect 패딩
+        n, h, w, _ = batch.shape
+        pad = min(self.upscaler.pre_pad, h - 1, w - 1)  # reflect 패딩은 입력보다 작아야 함 (가장자리 타일)
+        x = torch.from_numpy(batch).permute(0, 3, 1, 2).float().div_(255.0).to(self.upscaler.device)
+        if pad:
+            x = torch.nn.functional.pad(x, (0, pad, 0, pad), "reflect")
+        if self.upscaler.half:
+            x = x.half()
 
-    def upscale(self, image: Image.Image) -> Image.Image:
-        img_np = np.array(image)
-        result_np, _ = self.upscaler.enhance(img_np, outscale=self.scale_factor)  # ✅ 적용
-        return Image.fromarray(result_np)
\ No newline at end of file
+        with torch.no_grad():
+            y = self.upscaler.model(x)
+        y = y[:, :, :h * MODEL_SCALE, :w * MODEL_SCALE]
+        return y.float().clamp_(0, 1).mul_(255.0).round_().byte().permute(0, 2, 3, 1).cpu().numpy()
@@ -0,0 +1,39 @@
+import os
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem
+from PySide6.QtCore import Qt, Signal
+
+class DuplicateDialog(QDialog):
+    imageSelected = Signal(str)
+
+    def __init__(self, groups, label_fn=os.path.basename, parent=None):
+        """
+        Args:
+            groups (list[list[str]]): 중복으로 판단된 경로 묶음
+            label_fn (callable): 경로 -> 표시 이름 (압축 내부 페이지는 멤버 이름)
+        """
+        super().__init__(parent)
+        self.setWindowTitle("중복 이미지")
+        self.resize(500, 400)
+
+        layout = QVBoxLayout(self)
+        total = sum(len(g) for g in groups)
+        layout.addWidget(QLabel(f"{len(groups)}개 묶음, {total}장 (더블클릭으로 열기)"))
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderHidden(True)
+        for i, group in enumerate(groups, 1):
+            group_item = QTreeWidgetItem([f"묶음 {i} ({len(group)}장)"])
+            for path in group:
+                child = QTreeWidgetItem([label_fn(path)])
+                child.setData(0, Qt.UserRole, path)
+                group_item.addChild(child)
+            self.tree.addTopLevelItem(group_item)
+        self.tree.expandAll()
+        self.tree.itemDoubleClicked.connect(self.emit_and_close)
+        layout.addWidget(self.tree)
+
+    def emit_and_close(self, item, column=0):
+        path = item.data(0, Qt.UserRole)
+        if path:
+            self.imageSelected.emit(path)
+            self.accept()
@@ -0,0 +1,115 @@
+import os
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QComboBox, QCheckBox, QSpinBox,
+    QDoubleSpinBox, QLineEdit, QPushButton, QFileDialog, QDialogButtonBox
+)
+from core.batch_export import ExportPipeline, EXPORT_FORMATS
+
+class ExportDialog(QDialog):
+    # 내보낼 범위 (콤보 순서와 같음)
+    SCOPES = ("page", "list", "folder", "archive")
+
+    def __init__(self, default_target="", has_page=True, parent=None):
+        """
+        Args:
+            default_target (str): 처음 표시할 출력 위치
+            has_page (bool): 열려 있는 페이지가 있는지 (없으면 다른 폴더/압축 파일만 선택 가능)
+        """
+        super().__init__(parent)
+        self.setWindowTitle("일괄 내보내기")
+        self.resize(420, 0)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.cmb_scope = QComboBox()
+        self.cmb_scope.addItems(["현재 페이지", "현재 목록 전체 (정렬/필터 적용)", "다른 폴더 선택...", "다른 압축 파일 선택..."])
+        if not has_page:
+            self.cmb_scope.setCurrentIndex(2)
+        form.addRow("범위", self.cmb_scope)
+
+        self.cmb_rotation = QComboBox()
+        self.cmb_rotation.addItems(["0°", "90°", "180°", "270°"])
+        form.addRow("회전", self.cmb_rotation)
+        self.chk_flip_h = QCheckBox("좌우 반전")
+        self.chk_flip_v = QCheckBox("상하 반전")
+        flips = QHBoxLayout()
+        flips.addWidget(self.chk_flip_h)
+        flips.addWidget(self.chk_flip_v)
+        form.addRow("반전", flips)
+
+        self.cmb_upscale = QComboBox()
+        self.cmb_upscale.addItem("사용 안 함", "")
+        from plugins.plugin_loader import PLUGINS
+        for name in PLUGINS:
+            self.cmb_upscale.addItem(name, name)
+        form.addRow("업스케일", self.cmb_upscale)
+
+        self.spn_scale = QDoubleSpinBox()
+        self.spn_scale.setRange(0.05, 8.0)
+        self.spn_scale.setSingleStep(0.25)
+        self.spn_scale.setValue(1.0)
+        form.addRow("배율", self.spn_scale)
+        self.spn_max_w = QSpinBox()
+        self.spn_max_h = QSpinBox()
+        for spin in (self.spn_max_w, self.spn_max_h):
+            spin.setRange(0, 32768)
+            spin.setSpecialValueText("제한 없음")
+        form.addRow("최대 너비", self.spn_max_w)
+        form.addRow("최대 높이", self.spn_max_h)
+
+        self.cmb_format = QComboBox()
+        self.cmb_format.addItem("원본 유지", "")
+        for fmt in EXPORT_FORMATS:
+            self.cmb_format.addItem(fmt.upper(), fmt)
+        form.addRow("형식", self.cmb_format)
+        self.spn_quality = QSpinBox()
+        self.spn_quality.setRange(1, 100)
+        self.spn_quality.setValue(90)
+        form.addRow("품질", self.spn_quality)
+
+        self.txt_target = QLineEdit(default_target)
+        btn_folder = QPushButton("폴더...")
+        btn_cbz = QPushButton("CBZ...")
+        btn_folder.clicked.connect(self.choose_folder)
+        btn_cbz.clicked.connect(self.choose_cbz)
+        target = QHBoxLayout()
+        target.addWidget(self.txt_target)
+        target.addWidget(btn_folder)
+        target.addWidget(btn_cbz)
+        form.addRow("출력 (폴더 또는 .cbz)", target)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "출력 폴더 선택", self.txt_target.text())
+        if folder:
+            self.txt_target.setText(folder)
+
+    def choose_cbz(self):
+        path, _ = QFileDialog.getSaveFileName(self, "CBZ로 저장", self.txt_target.text(), "Comic Book (*.cbz)")
+        if path:
+            self.txt_target.setText(path if path.lower().endswith(".cbz") else path + ".cbz")
+
+    def scope(self):
+        return self.SCOPES[self.cmb_scope.currentIndex()]
+
+    def target(self):
+        return os.path.expanduser(self.txt_target.text().strip())
+
+    def pipeline(self) -> ExportPipeline:
+        return ExportPipeline(
+            rotation=self.cmb_rotation.currentIndex() * 90,
+            flip_horizontal=self.chk_flip_h.isChecked(),
+            flip_vertical=self.chk_flip_v.isChecked(),
+            scale=self.spn_scale.value(),
+            max_width=self.spn_max_w.value(),
+            max_height=self.spn_max_h.value(),
+            upscale=self.cmb_upscale.currentData(),
+            format=self.cmb_format.currentData(),
+            quality=self.spn_quality.value(),
+        )
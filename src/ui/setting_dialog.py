@@ -63,18 +63,29 @@ class SettingDialog(QDialog):
         self.spn_tile = QSpinBox()
         self.spn_tile.setRange(0, 1024)
         self.spn_tile.setValue(self.settings.get("tile", 128))
+        self.chk_auto_tile = QCheckBox("타일 크기 자동 (메모리 기준)")
+        self.chk_auto_tile.setChecked(self.settings.get("auto_tile", True))
 
         self.model_path = QLineEdit(self.settings.get("model_path", ""))
         self.btn_model_path = QPushButton("모델 경로 찾기")
         self.btn_model_path.clicked.connect(self.browse_model)
 
+        # torch를 불러오므로 뷰어 시작 시가 아니라 대화상자를 열 때 import
+        from plugins.inference_backends import BACKENDS
+        self.cmb_backend = QComboBox()
+        self.cmb_backend.addItems(list(BACKENDS))
+        self.cmb_backend.setCurrentText(self.settings.inference_backends.get("real-esrgan", "fp32"))
+
         p_layout.addWidget(QLabel("업스케일 배율 (scale)"))
         p_layout.addWidget(self.spn_scale)
         p_layout.addWidget(QLabel("타일 사이즈 (tile)"))
         p_layout.addWidget(self.spn_tile)
+        p_layout.addWidget(self.chk_auto_tile)
         p_layout.addWidget(QLabel("모델 파일 경로"))
         p_layout.addWidget(self.model_path)
         p_layout.addWidget(self.btn_model_path)
+        p_layout.addWidget(QLabel("CPU 추론 백엔드 (real-esrgan)"))
+        p_layout.addWidget(self.cmb_backend)
         p_layout.addStretch()
         self.stack.addWidget(processing)
         self.section_list.addItem(QListWidgetItem("영상처리"))
@@ -117,7 +128,9 @@ class SettingDialog(QDialog):
             "enabled_upscale": self.chk_upscale.isChecked(),
             "scale": self.spn_scale.value(),
             "tile": self.spn_tile.value(),
+            "auto_tile": self.chk_auto_tile.isChecked(),
             "model_path": self.model_path.text(),
+            "inference_backend": self.cmb_backend.currentText(),
             "theme": self.cmb_theme.currentText(),
             "font_size": self.spn_font.value(),
             "language": self.cmb_lang.currentText()
@@ -130,9 +143,13 @@ class SettingDialog(QDialog):
         self.spn_scale.setValue(4)
         self.spn_tile.setValue(128)
         self.model_path.setText("src/models/RealESRNET_x4plus.pth")
+        self.cmb_backend.setCurrentText("fp32")
+        self.chk_auto_tile.setChecked(True)
 
     def accept(self):
         self.modified.enabled_thumbnails = self.chk_thumbnails.isChecked()
         self.modified.enabled_upscale = self.chk_upscale.isChecked()
+        self.modified.auto_tile = self.chk_auto_tile.isChecked()
+        self.modified.inference_backends = {**self.settings.inference_backends, "real-esrgan": self.cmb_backend.currentText()}
         self.modified.save_to_json("config/settings.json")
         super().accept()
\ No newline at end of file
@@ -0,0 +1,289 @@
+"""
+세로 연속(웹툰) 보기.
+
+전체 페이지를 화면 너비에 맞춰 위아래로 이어 붙인 것처럼 스크롤하지만,
+실제로 픽스맵을 가진 페이지는 화면에 걸친 페이지와 위아래 여유분(margin)뿐입니다.
+배치는 헤더에서 읽은 크기(StripLayout)로 미리 계산하므로 페이지 수와 관계없이
+스크롤/그리기 비용이 일정하고, 창 밖으로 벗어난 페이지는 픽스맵과 디코딩 요청을 바로 버립니다.
+"""
+from PySide6.QtWidgets import QAbstractScrollArea
+from PySide6.QtGui import QPainter, QPixmap, QImage, QColor
+from PySide6.QtCore import Qt, Signal, QTimer
+
+from core.strip_layout import StripLayout
+from utils.perf_trace import tracer
+
+
+def _pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+ASPECT_TOLERANCE = 0.02  # 배치 높이와 이만큼 넘게 다르면 다른 비율로 디코딩된 픽스맵으로 봄
+
+
+class StripView(QAbstractScrollArea):
+    pageChanged = Signal(int)
+    # 디코드 서비스 콜백 스레드 -> GUI 스레드 (index, generation, ndarray)
+    _decoded = Signal(int, int, object)
+
+    def __init__(self, decode_service_fn, prepare=None, margin=1.0, parent=None):
+        """
+        Args:
+            decode_service_fn (callable): 디코드 서비스를 반환하는 함수
+            prepare (callable): path -> 디코딩 가능한 파일이 준비됐는지 (압축 내부 페이지 해제 등)
+            margin (float): 화면 위아래로 미리 디코딩해 둘 범위 (화면 높이 배수)
+        """
+        super().__init__(parent)
+        self.decode_service_fn = decode_service_fn
+        self.prepare = prepare or (lambda path: True)
+        self.margin = margin
+        self.paths = []
+        self.sizes = []       # 페이지별 원본 크기 (모르면 None)
+        self.layout = StripLayout([], 1)
+        self.pixmaps = {}     # index -> 화면 너비로 맞춘 QPixmap
+        self.pending = {}     # index -> Future
+        self.failed = set()
+        self.generation = 0
+        self.current = -1
+
+        self.setFrameShape(QAbstractScrollArea.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.viewport().setStyleSheet("background-color: black;")
+        self.verticalScrollBar().setSingleStep(60)
+        self._decoded.connect(self.on_decoded)
+
+        # 솔리드 압축처럼 아직 풀리지 않은 페이지는 잠시 후 다시 요청
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.setInterval(250)
+        self.retry_timer.timeout.connect(self.update_window)
+
+    # ------------------------------------------------------------ 페이지 목록
+
+    def set_pages(self, paths, sizes=None):
+        """
+        Args:
+            paths (list[str]): 페이지 경로
+            sizes (list[tuple[int, int] | None]): 헤더/카탈로그에서 읽은 원본 크기 (모르면 None)
+        """
+        if sizes and list(paths) == self.paths:
+            # 같은 목록이면 새로 알게 된 크기만 반영 (디코딩해 둔 페이지와 보던 위치 유지)
+            def change():
+                self.sizes = list(sizes)
+                self.layout = StripLayout(self.sizes, self.layout.width)
+                return True
+            self.relayout(change)
+            return
+
+        anchor = self.paths[self.current] if 0 <= self.current < len(self.paths) else None
+        self.clear()
+        self.paths = list(paths)
+        self.sizes = list(sizes) if sizes else [None] * len(self.paths)
+        self.layout = StripLayout(self.sizes, self.viewport().width())
+        self.current = -1
+        self.update_scroll_range()
+        if anchor in self.paths:
+            self.scroll_to_page(self.paths.index(anchor))
+        else:
+            self.update_window()
+
+    def set_page_size(self, index, width, height):
+        """카탈로그 스캔 등으로 실제 크기를 알게 된 페이지를 반영 (보고 있는 위치 유지)"""
+        self.sizes[index] = (width, height)
+        self.relayout(lambda: self.layout.set_size(index, width, height))
+
+    def clear(self):
+        self.generation += 1
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        self.pixmaps.clear()
+        self.failed.clear()
+
+    def scroll_to_page(self, index):
+        if not 0 <= index < len(self.paths):
+            return
+        self.verticalScrollBar().setValue(self.layout.offset(index))
+        self.update_window()
+
+    def current_page(self):
+        return self.current
+
+    def scroll_by(self, dy):
+        bar = self.verticalScrollBar()
+        bar.setValue(bar.value() + dy)
+
+    # ------------------------------------------------------------ 배치/스크롤
+
+    def update_scroll_range(self):
+        bar = self.verticalScrollBar()
+        view_h = self.viewport().height()
+        bar.setPageStep(view_h)
+        bar.setRange(0, max(0, self.layout.total_height() - view_h))
+
+    def relayout(self, change):
+        """change()가 배치를 바꾸면, 보고 있던 페이지의 같은 비율 위치로 스크롤을 옮깁니다."""
+        top = self.verticalScrollBar().value()
+        index = self.layout.page_at(top)
+        fraction = (top - self.layout.offset(index)) / self.layout.page_height(index) if index >= 0 else 0.0
+        if not change():
+            return False
+        # 이전 비율로 디코딩한 픽스맵은 버리고 새 배치에 맞춰 다시 요청
+        for index in [i for i, pixmap in self.pixmaps.items() if not self.fits(i, pixmap)]:
+            del self.pixmaps[index]
+        self.update_scroll_range()
+        if index >= 0:
+            self.verticalScrollBar().setValue(
+                self.layout.offset(index) + round(fraction * self.layout.page_height(index))
+            )
+        self.update_window()
+        return True
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        width = self.viewport().width()
+
+        def change():
+            if width == self.layout.width:
+                return False
+            self.layout.set_width(width)
+            # 이전 너비로 디코딩한 픽스맵은 새 너비에 맞춰 다시 요청
+            self.clear()
+            return True
+
+        if not self.relayout(change):
+            self.update_scroll_range()
+            self.update_window()
+
+    def scrollContentsBy(self, dx, dy):
+        self.update_window()
+        self.viewport().update()
+
+    def window_range(self):
+        """픽스맵을 유지할 페이지 범위 (화면 + 위아래 여유분)"""
+        top = self.verticalScrollBar().value()
+        view_h = self.viewport().height()
+        extra = int(view_h * self.margin)
+        return self.layout.visible_range(top - extra, top + view_h + extra)
+
+    # ------------------------------------------------------------ 디코딩
+
+    def decode_params(self, index):
+        """화면 너비로 디코딩할 (reduce, max_side)"""
+        width = self.layout.width
+        size = self.sizes[index]
+        if not size:
+            # 크기를 모르면 추정 비율로 줄일 수 없음 (긴 웹툰 페이지가 뭉개짐) → 원본 크기로 디코딩
+            return 1, None
+        # 축소 디코딩해도 화면 너비 이상이 남는 가장 큰 배율 (JPEG는 DCT 단계에서 축소)
+        reduce = next((r for r in (8, 4, 2) if size[0] // r >= width), 1)
+        return reduce, max(width, self.layout.page_height(index))
+
+    def fits(self, index, pixmap):
+        """픽스맵이 현재 배치의 페이지 비율과 맞는지"""
+        expected = self.layout.page_height(index)
+        return abs(pixmap.height() - expected) <= max(2, expected * ASPECT_TOLERANCE)
+
+    def update_window(self):
+        if not self.paths:
+            return
+        top = self.verticalScrollBar().value()
+        # 화면 윗변에 걸친 페이지가 현재 페이지
+        current = self.layout.page_at(top)
+        if current != self.current:
+            self.current = current
+            self.pageChanged.emit(current)
+
+        first, last = self.window_range()
+        # 창 밖 페이지는 픽스맵/요청 재활용
+        for index in [i for i in self.pixmaps if not first <= i <= last]:
+            del self.pixmaps[index]
+        for index in [i for i in self.pending if not first <= i <= last]:
+            self.pending.pop(index).cancel()
+
+        # 화면 가운데에서 가까운 페이지부터 요청
+        service = None
+        waiting = False
+        for index in sorted(range(first, last + 1), key=lambda i: abs(i - current)):
+            if index in self.pixmaps or index in self.pending or index in self.failed:
+                continue
+            path = self.paths[index]
+            if not self.prepare(path):
+                waiting = True
+                continue
+            service = service or self.decode_service_fn()
+            future = self.pending[index] = service.submit(path, *self.decode_params(index))
+            generation = self.generation
+            future.add_done_callback(
+                lambda f, i=index, g=generation: None if f.cancelled() else self._decoded.emit(i, g, f.result())
+            )
+        if waiting and not self.retry_timer.isActive():
+            self.retry_timer.start()
+
+    def on_decoded(self, index, generation, img):
+        if generation != self.generation or self.pending.pop(index, None) is None:
+            return
+        if img is None:
+            self.failed.add(index)
+            self.viewport().update()
+            return
+
+        with tracer.span("strip_page"):
+            h, w, ch = img.shape
+            qimg = QImage(img.data, w, h, ch * w, QImage.Format_RGB888)
+            width = self.layout.width
+            if w != width:
+                qimg = qimg.scaledToWidth(width, Qt.SmoothTransformation)
+            pixmap = QPixmap.fromImage(qimg)
+
+        if self.sizes[index] is not None and not self.fits(index, pixmap):
+            # 알던 크기와 실제 비율이 다르면 잘못된 max_side로 축소됐을 수 있으므로
+            # 실제 비율로 배치를 고치고 다시 요청 (relayout -> update_window)
+            self.set_page_size(index, w, h)
+            return
+        self.pixmaps[index] = pixmap
+        # 헤더 정보가 없었던 페이지는 디코딩한 비율로 배치를 고침 (창 밖으로 밀려나면 여기서 정리됨)
+        if self.sizes[index] is None:
+            self.set_page_size(index, w, h)
+        self.viewport().update()
+
+    # ------------------------------------------------------------ 그리기
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        view_w = self.viewport().width()
+        top = self.verticalScrollBar().value()
+        rect = event.rect()
+        first, last = self.layout.visible_range(top + rect.top(), top + rect.bottom() + 1)
+        for index in range(first, last + 1):
+            y = self.layout.offset(index) - top
+            h = self.layout.page_height(index)
+            pixmap = self.pixmaps.get(index)
+            if pixmap is not None:
+                painter.drawPixmap((view_w - pixmap.width()) // 2, y, pixmap)
+                continue
+            # 아직 디코딩되지 않은 페이지는 자리만 표시
+            painter.fillRect(0, y, view_w, h, QColor(24, 24, 24))
+            painter.setPen(QColor(110, 110, 110))
+            label = f"{index + 1}" if index not in self.failed else f"{index + 1} (표시 불가)"
+            painter.drawText(0, y, view_w, min(h, self.viewport().height()), Qt.AlignCenter, label)
+        painter.end()
+
+    # ------------------------------------------------------------ 메모리 관리
+
+    def nbytes(self):
+        return sum(_pixmap_bytes(p) for p in self.pixmaps.values())
+
+    def evict(self, bytes_needed):
+        """화면에 보이지 않는 여유분 페이지부터 해제합니다 (보이는 페이지는 유지)."""
+        top = self.verticalScrollBar().value()
+        first, last = self.layout.visible_range(top, top + self.viewport().height())
+        current = self.current
+        freed = 0
+        for index in sorted(self.pixmaps, key=lambda i: -abs(i - current)):
+            if freed >= bytes_needed:
+                break
+            if first <= index <= last:
+                continue
+            freed += _pixmap_bytes(self.pixmaps.pop(index))
+        return freed
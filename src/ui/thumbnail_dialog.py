@@ -1,89 +1,177 @@
 import os
+from collections import OrderedDict
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QListWidget, QListWidgetItem, QStyledItemDelegate
+    QDialog, QVBoxLayout, QListView, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QSize, QRect
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, Signal, QSize, QAbstractListModel, QModelIndex
 from utils.pixmap_cache import QPixmapLRUCache
+from utils.image_utils import list_image_files
+from core.decode_service import get_decode_service
+from core.memory_governor import governor, PRIORITY_THUMBNAIL
+
+# 썸네일 QPixmap (파일명 목록은 이 역할을 조회하지 않으므로 디코딩을 일으키지 않음)
+ThumbnailRole = Qt.UserRole + 1
+
+
+class ThumbnailModel(QAbstractListModel):
+    """
+    썸네일/파일명 두 뷰가 함께 쓰는 경로 목록 모델.
+    항목 객체를 만들지 않고, 썸네일은 뷰가 실제로 그리는 행에서만 캐시를 조회해
+    없으면 워커 프로세스에 축소 디코딩을 요청합니다 (완료되면 해당 행만 갱신).
+    """
+    # 디코드 서비스 콜백 스레드 -> GUI 스레드 (path, ndarray)
+    _decoded = Signal(str, object)
+
+    def __init__(self, paths, pixmap_cache, prepare=None, label_fn=os.path.basename, max_pending=64, parent=None):
+        """
+        Args:
+            paths (list[str]): 이미지 경로 목록
+            pixmap_cache (QPixmapLRUCache): 썸네일 캐시
+            prepare (callable): path -> 디코딩 가능한 파일이 준비됐는지 (압축 내부 페이지 해제 등)
+            label_fn (callable): 경로 -> 표시 이름
+            max_pending (int): 동시에 유지할 디코딩 요청 수 (빠르게 스크롤해 지나간 요청은 취소)
+        """
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.rows = {p: i for i, p in enumerate(self.paths)}
+        self.pixmap_cache = pixmap_cache
+        self.prepare = prepare or (lambda path: True)
+        self.label_fn = label_fn
+        self.max_pending = max_pending
+        self.pending = OrderedDict()  # path -> Future
+        self.failed = set()
+        self._decoded.connect(self.on_decoded)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def row_of(self, path):
+        return self.rows.get(path, -1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self.paths[index.row()]
+        if role == Qt.DisplayRole:
+            return self.label_fn(path)
+        if role == Qt.UserRole:
+            return path
+        if role == ThumbnailRole:
+            pixmap = self.pixmap_cache.peek(path)
+            if pixmap is None:
+                self.request(path)
+            return pixmap
+        return None
+
+    def request(self, path):
+        if path in self.pending or path in self.failed or not self.prepare(path):
+            return
+        future = self.pending[path] = get_decode_service().submit(path, max_side=max(self.pixmap_cache.thumb_size))
+        future.add_done_callback(lambda f, p=path: None if f.cancelled() else self._decoded.emit(p, f.result()))
+        while len(self.pending) > self.max_pending:
+            self.pending.popitem(last=False)[1].cancel()
+
+    def on_decoded(self, path, img):
+        if self.pending.pop(path, None) is None:
+            return
+        if img is None:
+            self.failed.add(path)
+            return
+        self.pixmap_cache.put(path, img)
+        index = self.index(self.rows[path])
+        self.dataChanged.emit(index, index, [ThumbnailRole])
+
+    def cancel(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
 
 class ThumbnailDialog(QDialog):
     imageSelected = Signal(str)
 
-    def __init__(self, image_dir, parent=None):
+    def __init__(self, image_dir, parent=None, image_paths=None, prepare=None, label_fn=os.path.basename):
+        """
+        Args:
+            image_dir (str): 이미지 폴더 (image_paths가 없을 때 목록을 읽음)
+            image_paths (list[str], optional): 보여줄 경로 목록 (뷰어의 현재 정렬/필터/압축 파일 목록)
+            prepare (callable): path -> 디코딩 가능한 파일이 준비됐는지
+            label_fn (callable): 경로 -> 표시 이름 (압축 내부 페이지는 멤버 이름)
+        """
         super().__init__(parent)
         self.image_dir = image_dir
         self.setWindowTitle("썸네일 보기")
         self.resize(800, 400)
 
         self.pixmap_cache = QPixmapLRUCache(max_size=100, thumb_size=(150, 150))
+        governor.register("thumbnails", PRIORITY_THUMBNAIL, self.pixmap_cache.nbytes, self.pixmap_cache.evict)
+
+        # 🔄 이미지 목록 (두 뷰가 모델 하나를 공유)
+        if image_paths is None:
+            image_paths = list_image_files(self.image_dir)
+        self.model = ThumbnailModel(image_paths, self.pixmap_cache, prepare, label_fn, parent=self)
 
         layout = QVBoxLayout(self)
 
         # ✅ 썸네일 리스트 (가로 스크롤)
-        self.thumbnail_list_widget = QListWidget()
-        self.thumbnail_list_widget.setViewMode(QListWidget.IconMode)
-        self.thumbnail_list_widget.setMovement(QListWidget.Static)
-        self.thumbnail_list_widget.setResizeMode(QListWidget.Adjust)
-        self.thumbnail_list_widget.setFlow(QListWidget.LeftToRight)
-        self.thumbnail_list_widget.setWrapping(False)
-        self.thumbnail_list_widget.setSpacing(10)
-        self.thumbnail_list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.thumbnail_list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.thumbnail_list_widget.setFixedHeight(180)
-
         thumb_size = QSize(150, 150)
-        self.thumbnail_list_widget.setIconSize(thumb_size)
-        self.thumbnail_list_widget.setItemDelegate(CenteredIconDelegate(thumb_size))
+        self.thumbnail_view = QListView()
+        self.thumbnail_view.setViewMode(QListView.IconMode)
+        self.thumbnail_view.setMovement(QListView.Static)
+        self.thumbnail_view.setResizeMode(QListView.Adjust)
+        self.thumbnail_view.setFlow(QListView.LeftToRight)
+        self.thumbnail_view.setWrapping(False)
+        self.thumbnail_view.setSpacing(10)
+        self.thumbnail_view.setUniformItemSizes(True)  # 항목마다 크기를 묻지 않음 (대량 목록 배치 비용 제거)
+        self.thumbnail_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.thumbnail_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.thumbnail_view.setFixedHeight(180)
+        self.thumbnail_view.setItemDelegate(CenteredIconDelegate(thumb_size, self.thumbnail_view))
+        self.thumbnail_view.setModel(self.model)
 
         # ✅ 파일명 리스트 (세로 리스트)
-        self.filename_list_widget = QListWidget()
-        self.filename_list_widget.setSelectionMode(QListWidget.SingleSelection)
-        self.filename_list_widget.setViewMode(QListWidget.ListMode)
-
-        # 🔄 이미지 로드 및 리스트 구성
-        for image_file in sorted(os.listdir(self.image_dir)):
-            if image_file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
-                full_path = os.path.join(self.image_dir, image_file)
-
-                # 썸네일 항목
-                thumb = self.pixmap_cache.get(full_path)
-                thumb_item = QListWidgetItem(QIcon(thumb), "")
-                thumb_item.setData(Qt.UserRole, full_path)
-                thumb_item.setSizeHint(QSize(160, 160))
-                self.thumbnail_list_widget.addItem(thumb_item)
-
-                # 파일명 항목
-                file_item = QListWidgetItem(image_file)
-                file_item.setData(Qt.UserRole, full_path)
-                self.filename_list_widget.addItem(file_item)
+        self.filename_view = QListView()
+        self.filename_view.setSelectionMode(QListView.SingleSelection)
+        self.filename_view.setViewMode(QListView.ListMode)
+        self.filename_view.setUniformItemSizes(True)
+        self.filename_view.setModel(self.model)
 
         # 🔗 이벤트 연결
-        self.thumbnail_list_widget.itemDoubleClicked.connect(self.emit_and_close)
-        self.filename_list_widget.itemClicked.connect(self.sync_thumbnail_selection)
-        self.filename_list_widget.itemDoubleClicked.connect(self.emit_and_close)
+        self.thumbnail_view.doubleClicked.connect(self.emit_and_close)
+        self.filename_view.clicked.connect(self.sync_thumbnail_selection)
+        self.filename_view.doubleClicked.connect(self.emit_and_close)
 
-        layout.addWidget(self.thumbnail_list_widget)
-        layout.addWidget(self.filename_list_widget)
+        layout.addWidget(self.thumbnail_view)
+        layout.addWidget(self.filename_view)
 
         self.imageSelected.connect(self.parent().load_image)
 
-    def closeEvent(self, event):
+    def done(self, result):
+        # accept / reject / Esc / 창 닫기 모두 여기를 거침 (closeEvent만으로는 Esc가 빠짐)
+        self.model.cancel()
         self.pixmap_cache.cache.clear()
-        super().closeEvent(event)
-
-    def sync_thumbnail_selection(self, item):
-        """텍스트 리스트 클릭 시 썸네일 리스트에서 동일 항목을 선택만 한다 (emit 없음)."""
-        target_path = item.data(Qt.UserRole)
-        for i in range(self.thumbnail_list_widget.count()):
-            thumb_item = self.thumbnail_list_widget.item(i)
-            if thumb_item.data(Qt.UserRole) == target_path:
-                self.thumbnail_list_widget.setCurrentRow(i)
-                self.thumbnail_list_widget.scrollToItem(thumb_item, QListWidget.PositionAtCenter)
-                break
-
-    def emit_and_close(self, item):
+        governor.unregister("thumbnails")
+        super().done(result)
+
+    def select_path(self, path):
+        """경로에 해당하는 항목을 두 목록에서 선택하고 보이게 합니다 (없으면 False)."""
+        row = self.model.row_of(path)
+        if row < 0:
+            return False
+        index = self.model.index(row)
+        self.filename_view.setCurrentIndex(index)
+        self.filename_view.scrollTo(index, QListView.PositionAtCenter)
+        self.sync_thumbnail_selection(index)
+        return True
+
+    def sync_thumbnail_selection(self, index):
+        """텍스트 리스트 클릭 시 썸네일 리스트에서 같은 행을 선택만 한다 (emit 없음)."""
+        self.thumbnail_view.setCurrentIndex(index)
+        self.thumbnail_view.scrollTo(index, QListView.PositionAtCenter)
+
+    def emit_and_close(self, index):
         """더블 클릭 시 이미지 로드 및 창 닫기"""
-        path = item.data(Qt.UserRole)
+        path = index.data(Qt.UserRole)
         self.imageSelected.emit(path)
         self.close()
 
@@ -93,13 +181,14 @@ class CenteredIconDelegate(QStyledItemDelegate):
         self.icon_size = icon_size
 
     def paint(self, painter, option, index):
-        icon = index.data(Qt.DecorationRole)
-        if icon:
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        pixmap = index.data(ThumbnailRole)
+        if pixmap:
             rect = option.rect
-            icon_size = self.icon_size
-            x = rect.x() + (rect.width() - icon_size.width()) // 2
-            y = rect.y() + (rect.height() - icon_size.height()) // 2
-            icon.paint(painter, QRect(x, y, icon_size.width(), icon_size.height()), Qt.AlignCenter)
+            x = rect.x() + (rect.width() - pixmap.width()) // 2
+            y = rect.y() + (rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
 
     def sizeHint(self, option, index):
-        return QSize(self.icon_size.width() + 20, self.icon_size.height() + 20)
\ No newline at end of file
+        return QSize(self.icon_size.width() + 20, self.icon_size.height() + 20)
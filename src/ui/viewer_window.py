@@ -1,10 +1,9 @@
 import os
 import cv2
+import time
 import hashlib
 import numpy as np
-from PIL import Image
 import logging
-import time
 
 
 try:
@@ -20,21 +19,51 @@ logging.basicConfig(
 )
 
 from PySide6.QtWidgets import (
-    QMainWindow, QLabel, QFileDialog, QMenuBar, QMenu, QMessageBox, QToolBar, QSizePolicy, QCheckBox
+    QMainWindow, QLabel, QFileDialog, QMenuBar, QMenu, QMessageBox, QToolBar, QSizePolicy, QCheckBox,
+    QStackedWidget, QApplication
 )
 from PySide6.QtGui import QPixmap, QImage, QWheelEvent, QContextMenuEvent, QAction, QActionGroup
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal, QEvent
 
 from config.settings_loader import AppSettings
 from plugins.plugin_loader import create_upscaler
-from utils.image_utils import is_image_file, extract_archive, get_file_extension
+from utils.image_utils import list_image_files
+from utils.image_formats import FORMATS, IMAGE_EXTENSIONS, detect_format, is_animated
+from utils.archive_reader import open_archive, is_archive_file
 from ui.setting_dialog import SettingDialog
 from ui.thumbnail_dialog import ThumbnailDialog
+from ui.duplicate_dialog import DuplicateDialog
+from ui.export_dialog import ExportDialog
+from ui.strip_view import StripView
 from utils.gif_player import GifPlayer
 from core.image_transform import apply_rotation, apply_flip, apply_scaling
-from core.async_workers import AsyncUpscaleWorker
+from core.async_workers import AsyncUpscaleWorker, AsyncRegionUpscaleWorker, AsyncDuplicateWorker, CatalogScanWorker, BatchExportWorker
+from core.library_catalog import LibraryCatalog
+from core.slideshow import SlideshowClock, scroll_window, is_tall_page
+from core.roi_upscale import RegionTileCache, visible_region, crop_upscaled
+from utils.perf_trace import tracer
+from core.memory_governor import (
+    governor, PRIORITY_PREFETCH, PRIORITY_READ_AHEAD, PRIORITY_THUMBNAIL, PRIORITY_REGION_TILES, PRIORITY_GIF_LOOKAHEAD, PRIORITY_STRIP_PAGES,
+    PRIORITY_CURRENT_PAGE, PRIORITY_MODEL
+)
+from core.decode_service import decode_rgb, get_decode_service, shutdown_decode_service
+from core.idle_upscale import IdleUpscaler, ProgressStore, plan_queue
+from core.io_service import ReadAheadReader
+from core.session import SessionState, load_session, save_session, snapshot_valid, SNAPSHOT_PATH
+
+PROGRESSIVE_REDUCE = 8  # 점진 표시 미리보기의 축소 디코딩 배율
+PREVIEW_MAX_SIDE = 480  # 미리 만들어 두는 미리보기의 긴 변
+PREVIEW_AHEAD = 8       # 미리보기를 만들어 둘 다음 페이지 수 (직전 2장 포함)
+# 미리 업스케일을 멈추게 하는 사용자 입력
+USER_INPUT_EVENTS = frozenset((
+    QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.MouseMove, QEvent.Wheel,
+    QEvent.TouchBegin, QEvent.TouchUpdate,
+))
 
 class ImageViewer(QMainWindow):
+    # 디코드 서비스 콜백 스레드 -> GUI 스레드 (path, 세대, ndarray)
+    refined = Signal(str, int, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AI Image Viewer")
@@ -47,13 +76,23 @@ class ImageViewer(QMainWindow):
         self.upscale_queue = []
         self.upscale_processing = False
 
-        self.upscaler = create_upscaler("real-esrgan", self.settings)
+        self.upscaler = None  # 무거운 모델은 처음 업스케일할 때 로드 (ensure_upscaler)
+        self.preview_upscaler = self.create_preview_upscaler()
 
         self.image_label = QLabel("이미지를 불러오세요", self)
         self.image_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.image_label.setScaledContents(True)
         self.image_label.setAlignment(Qt.AlignCenter)
-        self.setCentralWidget(self.image_label)
+
+        # 세로 연속(웹툰) 보기: 화면 근처 페이지만 디코딩하는 가상화 스트립
+        self.strip_view = StripView(lambda: get_decode_service(self.settings.decode_workers), prepare=self.prepare_page)
+        self.strip_view.setFocusPolicy(Qt.NoFocus)
+        self.strip_view.pageChanged.connect(self.on_strip_page_changed)
+
+        self.view_stack = QStackedWidget(self)
+        self.view_stack.addWidget(self.image_label)
+        self.view_stack.addWidget(self.strip_view)
+        self.setCentralWidget(self.view_stack)
 
         self.rotation_angle = 0
         self.flip_horizontal = False
@@ -65,7 +104,16 @@ class ImageViewer(QMainWindow):
 
         self.image_list = []
         self.current_index = -1
-        self.archive_tempdir = None
+        self.archive = None        # 열려 있는 ArchiveReader
+        self.archive_pages = {}    # 임시 경로 -> 압축 내부 멤버 이름
+        self.page_index = {}       # 페이지 경로 -> image_list 위치
+        self.animated_pages = {}   # 페이지 경로 -> 애니메이션 여부 (헤더 판별 결과)
+        self.page_source = None    # 현재 목록의 폴더 또는 압축 파일 경로
+
+        # 폴더/압축 파일 메타데이터 카탈로그 (정렬/필터/이동)
+        self.catalog = LibraryCatalog()
+        self.catalog_worker = None
+
         self.scale_factor = self.settings.scale_factor
         self.fit_to_window = self.settings.fit_to_window
         self.enabled_thumbnails = self.settings.enabled_thumbnails
@@ -78,8 +126,143 @@ class ImageViewer(QMainWindow):
         self.gif_delays = []
         self.gif_index = 0
 
+        # 파일 바이트 비동기 읽기 + 다음 페이지 미리 읽기 (느린/네트워크 저장소 대기 숨김)
+        self.reader = None
+        if self.settings.io_threads > 0:
+            self.reader = ReadAheadReader(self.settings.io_threads, self.settings.read_ahead_mb * 1024 ** 2)
+            get_decode_service(self.settings.decode_workers).set_reader(self.reader)
+
+        # 다음 페이지 미리 디코딩 (path -> Future[np.ndarray])
+        self.prefetched = {}
+        # 점진 표시용 축소 미리보기 (path -> Future[np.ndarray])
+        self.previews = {}
+
+        self.duplicate_worker = None
+        self.export_worker = None
+
+        # 슬라이드쇼 (전환 마감 시각에 맞춰 다음 페이지를 미리 디코딩/축소)
+        self.slideshow_clock = None
+        self.slideshow_timer = QTimer(self)
+        self.slideshow_timer.setSingleShot(True)
+        self.slideshow_timer.setTimerType(Qt.PreciseTimer)
+        self.slideshow_timer.timeout.connect(self.advance_slideshow)
+        self.decode_timing = {}  # path -> [요청 시각, 완료 시각]
+
+        # 세로로 긴 페이지 자동 스크롤
+        self.scroll_path = None
+        self.scroll_progress = 0.0
+        self.scroll_started = 0.0
+        self.scroll_duration = 0.0
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setInterval(33)
+        self.scroll_timer.timeout.connect(self.update_auto_scroll)
+
+        # 확대/영역 업스케일 상태
+        self.zoom = 1.0
+        self.view_center = (0.5, 0.5)
+        self.current_rgb = None
+        self.presented_path = None  # current_rgb가 전체 해상도로 그려진 페이지
+        self.resume_key = None      # 이어 보기 스냅샷이 그려져 있는 페이지 키 (축소 미리보기로 덮지 않음)
+        self.region_cache = RegionTileCache()
+
+        # 점진 표시: 미리보기 후 전체 해상도로 교체 (세대가 바뀌면 늦게 온 결과는 버림)
+        self.refine_future = None
+        self.refine_generation = 0
+        self.refined.connect(self.on_refined)
+        self.region_worker = None
+        self.region_pending = False
+        self.region_request_id = 0
+        self.region_timer = QTimer(self)
+        self.region_timer.setSingleShot(True)
+        self.region_timer.setInterval(250)  # 패닝/확대 중 연속 요청 방지
+        self.region_timer.timeout.connect(self.request_region_upscale)
+
+        self.init_memory_governor()
+
+        # 유휴 시간 미리 업스케일 (입력이 idle_upscale_delay초 동안 없으면 진행, 입력이 오면 즉시 일시 정지)
+        self.idle_upscaler = None
+        self.idle_progress = ProgressStore()
+        self.idle_cached = set()  # 업스케일 캐시가 있는 것으로 확인한 경로 (매번 파일을 확인하지 않도록)
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self.on_user_idle)
+        self.idle_poll_timer = QTimer(self)
+        self.idle_poll_timer.setInterval(200)
+        self.idle_poll_timer.timeout.connect(self.poll_idle_upscale)
+        self.idle_filter_installed = False
+        self.set_idle_upscale(self.settings.idle_upscale)
+
+        # 성능 오버레이 (프레임 시간 / 캐시 적중률)
+        tracer.enable(self.settings.enabled_trace)
+        self.perf_overlay = QLabel(self.image_label)
+        self.perf_overlay.setStyleSheet("background: rgba(0, 0, 0, 160); color: #7CFC00; font-family: monospace; padding: 4px;")
+        self.perf_overlay.setVisible(self.settings.enabled_trace)
+
         self.init_menu_bar()
 
+    def init_memory_governor(self):
+        # 캐시/버퍼를 전역 예산에 등록 (우선순위 낮은 것부터 회수)
+        governor.configure(budget_bytes=self.settings.memory_budget_mb * 1024 ** 2)
+        governor.register("prefetch", PRIORITY_PREFETCH, self.prefetch_nbytes, self.evict_prefetch)
+        if self.reader is not None:
+            governor.register("read_ahead", PRIORITY_READ_AHEAD, self.reader.nbytes, self.reader.evict)
+        governor.register("previews", PRIORITY_THUMBNAIL, self.preview_nbytes, self.evict_previews)
+        governor.register("region_tiles", PRIORITY_REGION_TILES, self.region_cache.nbytes, self.region_cache.evict)
+        governor.register("gif_frames", PRIORITY_GIF_LOOKAHEAD, self.gif_player.nbytes, self.gif_player.evict)
+        governor.register("strip_pages", PRIORITY_STRIP_PAGES, self.strip_view.nbytes, self.strip_view.evict)
+        governor.register("current_page", PRIORITY_CURRENT_PAGE, self.current_page_nbytes, self.evict_current_page)
+        governor.register("model", PRIORITY_MODEL, self.model_nbytes, self.evict_model)
+
+        self.memory_timer = QTimer(self)
+        self.memory_timer.setInterval(2000)
+        self.memory_timer.timeout.connect(governor.enforce)
+        self.memory_timer.start()
+
+    def prefetch_nbytes(self):
+        return sum(f.result().nbytes for f in self.prefetched.values()
+                   if f.done() and not f.cancelled() and f.result() is not None)
+
+    def evict_prefetch(self, bytes_needed):
+        freed = self.prefetch_nbytes()
+        for future in self.prefetched.values():
+            future.cancel()
+        self.prefetched.clear()
+        return freed
+
+    def preview_nbytes(self):
+        return sum(f.result().nbytes for f in self.previews.values()
+                   if f.done() and not f.cancelled() and f.result() is not None)
+
+    def evict_previews(self, bytes_needed):
+        freed = self.preview_nbytes()
+        for future in self.previews.values():
+            future.cancel()
+        self.previews.clear()
+        return freed
+
+    def current_page_nbytes(self):
+        return self.current_rgb.nbytes if self.current_rgb is not None else 0
+
+    def evict_current_page(self, bytes_needed):
+        # 화면의 픽스맵은 그대로 두고 확대/영역 업스케일용 원본만 해제 (필요 시 다시 디코딩)
+        freed = self.current_page_nbytes()
+        self.current_rgb = None
+        return freed
+
+    def model_nbytes(self):
+        return self.upscaler.resident_bytes() if self.upscaler else 0
+
+    def evict_model(self, bytes_needed):
+        freed = self.model_nbytes()
+        self.upscaler = None
+        return freed
+
+    def ensure_upscaler(self):
+        # 시작 시에는 로드하지 않고, 메모리 회수로 내려간 모델도 다음 사용 시 다시 로드
+        if self.upscaler is None:
+            self.upscaler = create_upscaler("real-esrgan", self.settings)
+        return self.upscaler
+
     def init_menu_bar(self):
         menu_bar = QMenuBar(self)
         self.setMenuBar(menu_bar)
@@ -104,6 +287,14 @@ class ImageViewer(QMainWindow):
         thumbs_action.triggered.connect(self.toggle_thumbnails)
         file_menu.addAction(thumbs_action)
 
+        duplicate_action = QAction("중복 이미지 찾기", self)
+        duplicate_action.triggered.connect(self.find_duplicates)
+        file_menu.addAction(duplicate_action)
+
+        export_action = QAction("일괄 내보내기...", self)
+        export_action.triggered.connect(self.batch_export)
+        file_menu.addAction(export_action)
+
         file_menu.addSeparator()
         file_menu.addAction("종료", self.close)
 
@@ -116,6 +307,21 @@ class ImageViewer(QMainWindow):
         self.upscale_action.triggered.connect(lambda: self.request_upscale(self.current_image_path))
         settings_menu.addAction(self.upscale_action)
 
+        idle_upscale_action = QAction("유휴 시간에 다음 페이지 미리 업스케일", self, checkable=True)
+        idle_upscale_action.setChecked(self.settings.idle_upscale)
+        idle_upscale_action.triggered.connect(self.toggle_idle_upscale)
+        settings_menu.addAction(idle_upscale_action)
+
+        settings_menu.addSeparator()
+        overlay_action = QAction("성능 오버레이", self, checkable=True)
+        overlay_action.setChecked(self.settings.enabled_trace)
+        overlay_action.triggered.connect(self.toggle_perf_overlay)
+        settings_menu.addAction(overlay_action)
+
+        export_trace_action = QAction("성능 트레이스 내보내기", self)
+        export_trace_action.triggered.connect(self.export_trace)
+        settings_menu.addAction(export_trace_action)
+
         view_menu = menu_bar.addMenu("보기")
         view_mode_group = QActionGroup(self)
         view_mode_group.setExclusive(True)
@@ -148,6 +354,54 @@ class ImageViewer(QMainWindow):
         page_mode_group.addAction(double_page_action)
         view_menu.addAction(double_page_action)
 
+        strip_page_action = QAction("세로 연속 보기", self, checkable=True)
+        strip_page_action.setChecked(self.settings.page_mode == "strip")
+        strip_page_action.triggered.connect(lambda: self.set_page_mode("strip"))
+        page_mode_group.addAction(strip_page_action)
+        view_menu.addAction(strip_page_action)
+
+        # 카탈로그 정렬 / 필터 / 이동
+        view_menu.addSeparator()
+        sort_menu = view_menu.addMenu("정렬")
+        sort_group = QActionGroup(self)
+        sort_group.setExclusive(True)
+        for sort, label in (("name", "이름"), ("size", "파일 크기"), ("pixels", "해상도"), ("mtime", "수정 시각")):
+            action = QAction(label, self, checkable=True)
+            action.setChecked(self.settings.catalog_sort == sort)
+            action.triggered.connect(lambda checked, s=sort: self.set_catalog_sort(s))
+            sort_group.addAction(action)
+            sort_menu.addAction(action)
+        sort_menu.addSeparator()
+        descending_action = QAction("역순", self, checkable=True)
+        descending_action.setChecked(self.settings.catalog_descending)
+        descending_action.triggered.connect(self.set_catalog_descending)
+        sort_menu.addAction(descending_action)
+
+        filter_menu = view_menu.addMenu("필터")
+        filter_group = QActionGroup(self)
+        filter_group.setExclusive(True)
+        for filter_by, label in (("", "전체"), ("portrait", "세로 이미지"), ("landscape", "가로 이미지"), ("animated", "애니메이션")):
+            action = QAction(label, self, checkable=True)
+            action.setChecked(self.settings.catalog_filter == filter_by)
+            action.triggered.connect(lambda checked, f=filter_by: self.set_catalog_filter(f))
+            filter_group.addAction(action)
+            filter_menu.addAction(action)
+
+        view_menu.addSeparator()
+        self.slideshow_action = QAction("슬라이드쇼", self, checkable=True)
+        self.slideshow_action.setShortcut("F5")
+        self.slideshow_action.triggered.connect(self.toggle_slideshow)
+        view_menu.addAction(self.slideshow_action)
+
+        auto_scroll_action = QAction("긴 페이지 자동 스크롤", self, checkable=True)
+        auto_scroll_action.setChecked(self.settings.slideshow_auto_scroll)
+        auto_scroll_action.triggered.connect(self.set_slideshow_auto_scroll)
+        view_menu.addAction(auto_scroll_action)
+
+        jump_menu = view_menu.addMenu("이동")
+        jump_menu.addAction("가장 큰 이미지", self.jump_to_largest)
+        jump_menu.addAction("다음 애니메이션", self.jump_to_next_animated)
+
     def toggle_thumbnails(self, checked):
         if checked and self.current_image_path:
             dialog = ThumbnailDialog(os.path.dirname(self.current_image_path), parent=self)
@@ -175,7 +429,8 @@ class ImageViewer(QMainWindow):
             self.open_image(self.image_list[self.current_index])
 
     def open_file_dialog(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "파일 열기", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif *.zip *.cbz)")
+        image_patterns = " ".join(f"*{ext}" for ext in IMAGE_EXTENSIONS)
+        file_path, _ = QFileDialog.getOpenFileName(self, "파일 열기", "", f"Images ({image_patterns} *.zip *.cbz *.cbt *.tar *.cb7 *.7z *.cbr *.rar)")
         if file_path:
             self.open_image(file_path)
 
@@ -184,7 +439,9 @@ class ImageViewer(QMainWindow):
         if dialog.exec():
             self.settings = dialog.modified
             self.settings.save_to_json("config/settings.json")
-            self.upscaler = create_upscaler("real-esrgan", self.settings)
+            self.upscaler = None  # 바뀐 설정으로 다음 사용 시 다시 로드
+            self.region_cache.clear()  # 이전 모델/배율로 만든 타일은 재사용하지 않음
+            self.preview_upscaler = self.create_preview_upscaler()
             self.scale_factor = self.settings.scale_factor
             self.fit_to_window = self.settings.fit_to_window
             self.enabled_thumbnails = self.settings.enabled_thumbnails
@@ -194,117 +451,530 @@ class ImageViewer(QMainWindow):
     def set_page_mode(self, mode):
         self.settings.page_mode = mode
         self.settings.save_to_json("config/settings.json")
+        if mode != "strip":
+            self.strip_view.set_pages([])
         self.refresh_image()
 
+    def show_strip(self):
+        self.view_stack.setCurrentWidget(self.strip_view)
+        if self.strip_view.paths != self.image_list:
+            self.strip_view.set_pages(self.image_list, self.page_sizes())
+        if self.strip_view.current_page() != self.current_index:
+            self.strip_view.scroll_to_page(self.current_index)
+        self.update_title()
+
+    def page_sizes(self):
+        """카탈로그에 기록된 (헤더에서 읽은) 페이지 크기. 아직 스캔 전이면 None으로 두고 디코딩 후 보정"""
+        if self.page_source is None:
+            return None
+        known = self.catalog.sizes(self.page_source)
+        return [known.get(self.archive_pages.get(p, os.path.basename(p))) for p in self.image_list]
+
+    def prepare_page(self, path):
+        # 세로 연속 보기/썸네일용: 솔리드 압축에서 아직 풀리지 않은 페이지는 기다리지 않고 다음에 다시 요청
+        name = self.archive_pages.get(path)
+        if name is not None and not self.archive.ready(name):
+            return False
+        self.materialize(path)
+        return True
+
+    def on_strip_page_changed(self, index):
+        # 스크롤로 화면 가운데 페이지가 바뀌면 현재 위치만 갱신 (다시 그리지 않음)
+        if 0 <= index < len(self.image_list):
+            self.current_index = index
+            self.current_image_path = self.image_list[index]
+            self.update_title()
+            self.read_ahead()
+
     def get_cached_path(self, image_path: str) -> str:
         import os
         import hashlib
 
         cache_dir = os.path.join(os.path.dirname(__file__), "../cache")
         os.makedirs(cache_dir, exist_ok=True)
-        name_hash = hashlib.md5(image_path.encode()).hexdigest()
+        key, _ = self.page_key(image_path)
+        name_hash = hashlib.md5(key.encode()).hexdigest()
         ext = os.path.splitext(image_path)[1].lower()
         cache_name = f"{name_hash}{ext}"
         return os.path.join(cache_dir, cache_name)
 
+    def page_key(self, path):
+        """
+        페이지의 캐시/색인 키와 변경 여부를 확인할 원본 파일 경로.
+        압축 내부 페이지는 임시 경로가 매번 바뀌므로 (압축 파일, 멤버 이름)으로 키를 만듦
+        """
+        name = self.archive_pages.get(path)
+        if name is not None:
+            archive_path = os.path.abspath(self.archive.path)
+            return f"{archive_path}::{name}", archive_path
+        return path, path
+
     def open_image(self, path):
-        folder = os.path.dirname(path)
-        self.image_list = sorted([
-            os.path.join(folder, f) for f in os.listdir(folder)
-            if f.lower().endswith((".jpg", ".jpeg", ".png", ".bmp", ".gif"))
-        ])
-        path = os.path.abspath(path)
-
-        if path in map(os.path.abspath, self.image_list):
-            self.current_index = list(map(os.path.abspath, self.image_list)).index(path)
-        else:
-            self.image_list.insert(0, path)
-            self.current_index = 0
+        if is_archive_file(path):
+            self.open_archive(path)
+            return
 
-        self.current_index = max(0, min(self.current_index, len(self.image_list) - 1))
+        if path not in self.page_index and path not in self.archive_pages:
+            # 현재 목록 밖의 파일이면 그 폴더로 목록을 새로 구성 (목록 안 이동은 폴더를 다시 읽지 않음)
+            self.close_archive()
+            path = os.path.abspath(path)
+            self.page_source = os.path.dirname(path)
+            self.set_page_list(self.list_pages())
+        if path not in self.page_index:
+            # 필터로 빠진 페이지도 열 수 있도록 맨 앞에 추가
+            self.set_page_list([path] + self.image_list)
+
+        self.current_index = self.page_index[path]
         self.current_image_path = path
+        self.view_center = (0.5, 0.5)
         self.display_image(path)
 
+    def set_page_list(self, paths):
+        self.image_list = paths
+        self.page_index = {p: i for i, p in enumerate(paths)}
+        self.animated_pages = {}
+        if self.settings.page_mode == "strip":
+            self.strip_view.set_pages(paths, self.page_sizes())
+
+    def is_animated_page(self, path):
+        # 매직 바이트로 판별한 결과를 목록이 바뀔 때까지 유지 (아직 풀리지 않은 압축 페이지는 다음에 다시 확인)
+        animated = self.animated_pages.get(path)
+        if animated is None:
+            animated = is_animated(path)
+            if os.path.exists(path):
+                self.animated_pages[path] = animated
+        return animated
+
+    def list_pages(self):
+        """
+        현재 폴더/압축 파일의 페이지 경로 목록.
+        카탈로그에 있으면 설정된 정렬/필터를 적용하고, 없으면 자연 정렬 목록을 쓴 뒤 백그라운드에서 스캔합니다.
+        """
+        source = self.page_source
+        names = self.catalog.list_pages(
+            source, sort=self.settings.catalog_sort, descending=self.settings.catalog_descending,
+            filter_by=self.settings.catalog_filter
+        )
+        self.start_catalog_scan(source)
+
+        if self.archive is not None:
+            if names is None:
+                names = self.archive.names()
+            return [self.archive.target_path(n) for n in names if self.archive.has(n)]
+        if names is None:
+            return list_image_files(source)
+        return [os.path.join(source, n) for n in names]
+
+    def refresh_listing(self):
+        # 정렬/필터 변경이나 스캔 완료 후 목록만 다시 구성 (현재 페이지는 유지)
+        if self.page_source is None:
+            return
+        self.set_page_list(self.list_pages())
+        if self.current_image_path in self.page_index:
+            self.current_index = self.page_index[self.current_image_path]
+        else:
+            self.current_index = max(0, min(self.current_index, len(self.image_list) - 1))
+        self.update_title()
+
+    def start_catalog_scan(self, source):
+        if self.catalog_worker is not None and self.catalog_worker.isRunning():
+            if self.catalog_worker.source == source:
+                return
+            self.catalog_worker.requestInterruption()
+            self.catalog_worker.wait()
+        self.catalog_worker = CatalogScanWorker(self.catalog, source, is_archive_file(source))
+        self.catalog_worker.finished.connect(self.on_catalog_scanned)
+        self.catalog_worker.start()
+
+    def on_catalog_scanned(self, source, changed):
+        if source != self.page_source:
+            return
+        if changed or self.image_list_from_fallback():
+            self.refresh_listing()
+
+    def image_list_from_fallback(self):
+        # 스캔 전 목록은 정렬/필터가 적용되지 않았으므로 기본 설정이 아니면 다시 구성해야 함
+        return (self.settings.catalog_sort, self.settings.catalog_descending, self.settings.catalog_filter) != ("name", False, "")
+
+    def set_slideshow_auto_scroll(self, checked):
+        self.settings.slideshow_auto_scroll = checked
+        self.settings.save_to_json("config/settings.json")
+
+    def set_catalog_sort(self, sort):
+        self.settings.catalog_sort = sort
+        self.refresh_listing()
+        self.settings.save_to_json("config/settings.json")
+
+    def set_catalog_descending(self, checked):
+        self.settings.catalog_descending = checked
+        self.refresh_listing()
+        self.settings.save_to_json("config/settings.json")
+
+    def set_catalog_filter(self, filter_by):
+        self.settings.catalog_filter = filter_by
+        self.refresh_listing()
+        self.settings.save_to_json("config/settings.json")
+
+    def page_path(self, name):
+        # 카탈로그 이름 -> 현재 목록의 경로
+        if self.archive is not None:
+            return self.archive.target_path(name) if self.archive.has(name) else None
+        return os.path.join(self.page_source, name)
+
+    def jump_to_largest(self):
+        if self.page_source is None:
+            return
+        name = self.catalog.first_page(
+            self.page_source, sort="pixels", descending=True, filter_by=self.settings.catalog_filter
+        )
+        self.jump_to(name)
+
+    def jump_to_next_animated(self):
+        if self.page_source is None or not self.current_image_path:
+            return
+        current = self.archive_pages.get(self.current_image_path, os.path.basename(self.current_image_path))
+        self.jump_to(self.catalog.next_page(self.page_source, current, filter_by="animated"))
+
+    def jump_to(self, name):
+        path = self.page_path(name) if name else None
+        if path is None or path not in self.page_index:
+            self.statusBar().showMessage("해당하는 이미지가 없습니다.", 3000)
+            return
+        self.open_image(path)
+
     def display_image(self, path):
+        with tracer.span("frame", path=os.path.basename(path)):
+            self._display_image(path)
+        self.update_perf_overlay()
+
+    def _display_image(self, path):
         self.gif_player.stop()  # 다른 이미지 열 때 GIF 재생 중단
 
-        if not os.path.exists(path):
+        if self.settings.page_mode == "strip":
+            self.show_strip()
+            return
+        self.view_stack.setCurrentWidget(self.image_label)
+
+        if not self.materialize(path):
             QMessageBox.warning(self, "경고", "이미지를 찾을 수 없습니다.")
             return
 
-        ext = get_file_extension(path)
-        if ext == ".gif":
+        # GIF / 애니메이션 WebP / APNG / AVIF 시퀀스는 애니메이션 엔진으로
+        if self.is_animated_page(path):
             if self.gif_player.load(path):
                 self.gif_player.start()
             self.update_title()
             return
 
-        img = cv2.imread(path)
+        self.cancel_refine()
+        if self.start_progressive(path):
+            self.update_title()
+            self.prefetch_neighbors()
+            return
+
+        img = self.load_rgb(path)
         if img is None:
             QMessageBox.warning(self, "경고", "이미지를 열 수 없습니다.")
             return
+        self.present_rgb(path, img)
 
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-
+    def present_rgb(self, path, img):
         # 두 장 보기 조건: 페이지 모드 + 너비 제한
         if self.settings.page_mode == "double" and img.shape[1] < 1200:
             if self.current_index + 1 < len(self.image_list):
                 next_path = self.image_list[self.current_index + 1]
-                next_img = cv2.imread(next_path)
+                next_img = self.load_rgb(next_path) if self.materialize(next_path) else None
                 if next_img is not None:
-                    next_img = cv2.cvtColor(next_img, cv2.COLOR_BGR2RGB)
                     if next_img.shape[0] != img.shape[0]:
                         next_img = cv2.resize(next_img, (int(next_img.shape[1] * (img.shape[0] / next_img.shape[0])), img.shape[0]))
                     img = np.concatenate((img, next_img), axis=1)
                     self.setWindowTitle(self.windowTitle() + " [2장 보기]")
 
+        self.current_rgb = self.transformed(img)
+        self.presented_path = path
 
-        # 회전 및 반전
-        if self.rotation_angle != 0 or self.flip_horizontal or self.flip_vertical:
-            img = apply_rotation(img, self.rotation_angle)
-            img = apply_flip(img, self.flip_horizontal, self.flip_vertical)
-
-        # ✅ 업스케일링은 메뉴에서 직접 클릭 시에만 진행
-        if self.enabled_upscale:
+        # ✅ 업스케일링은 메뉴에서 직접 클릭 시에만 진행 (확대 중이면 보이는 영역만 처리)
+        if self.enabled_upscale and not self.roi_active():
             self.request_upscale(path)
             return
 
+        self.render_current()
+        self.update_title()
+        self.prefetch_neighbors()
+
+    def transformed(self, img):
+        # 회전 및 반전
+        if self.rotation_angle != 0 or self.flip_horizontal or self.flip_vertical:
+            with tracer.span("transform"):
+                img = apply_rotation(img, self.rotation_angle)
+                img = apply_flip(img, self.flip_horizontal, self.flip_vertical)
+        return img
+
+    def start_progressive(self, path):
+        """
+        큰 이미지는 축소 디코딩한 미리보기를 먼저 그리고, 전체 해상도는 워커 프로세스에서
+        디코딩해 준비되면 교체합니다 (on_refined). 점진 표시를 시작했으면 True.
+        """
+        if not self.settings.progressive_display or self.settings.page_mode != "single":
+            return False
+        if path == self.presented_path:
+            return False  # 회전/메모리 회수 복구 등 같은 페이지를 다시 그릴 때는 미리보기 불필요
+        future = self.prefetched.get(path)
+        if future is not None and future.done() and not future.cancelled():
+            return False  # 이미 준비된 결과는 바로 사용
+        try:
+            if os.path.getsize(path) < self.settings.progressive_min_kb * 1024:
+                return False
+        except OSError:
+            return False
+
+        # 미리 디코딩 중이면 그 결과를 기다리고, 없으면 새로 요청
+        self.prefetched.pop(path, None)
+        tracer.count("prefetch", hit=future is not None)
+        if future is None or future.cancelled():
+            future = get_decode_service(self.settings.decode_workers).submit(path, *self.decode_params())
+
+        # 미리보기는 화면에 맞춰 볼 때만 그림 (원래 크기 보기/확대는 전체 해상도를 기다림)
+        if self.fit_to_window and self.zoom <= 1.0 and self.scroll_path != path:
+            coarse = self.coarse_preview(path)
+            if coarse is not None:
+                self.show_array(self.transformed(coarse))
+
+        self.current_rgb = None
+        self.presented_path = None
+        self.refine_future = future
+        self.refine_generation += 1
+        generation = self.refine_generation
+        future.add_done_callback(
+            lambda f, g=generation: None if f.cancelled() else self.refined.emit(path, g, f.result())
+        )
+        return True
+
+    def coarse_preview(self, path):
+        """
+        미리 만들어 둔 미리보기, 없으면 JPEG 등 디코딩 단계에서 축소되는 형식의 1/8 축소 디코딩 결과.
+        (PNG 등은 축소 디코딩도 전체를 풀어야 하므로 이전 화면을 유지한 채 전체 해상도만 기다림)
+        """
+        if self.resume_key is not None and self.page_key(path)[0] == self.resume_key:
+            return None  # 같은 페이지의 화면 해상도 스냅샷이 이미 그려져 있음
+        future = self.previews.get(path)
+        tracer.count("preview", hit=future is not None and future.done())
+        if future is not None and future.done() and not future.cancelled() and future.result() is not None:
+            return future.result()
+        fmt = FORMATS.get(detect_format(path))
+        if fmt is None or not fmt.fast_reduce:
+            return None
+        with tracer.span("coarse"):
+            return decode_rgb(path, PROGRESSIVE_REDUCE)
+
+    def on_refined(self, path, generation, img):
+        if generation != self.refine_generation or path != self.current_image_path:
+            return  # 이미 다른 페이지로 넘어감
+        self.refine_future = None
+        if img is None:
+            img = decode_rgb(path, *self.decode_params())
+            if img is None:
+                QMessageBox.warning(self, "경고", "이미지를 열 수 없습니다.")
+                return
+        with tracer.span("refine", path=os.path.basename(path)):
+            self.present_rgb(path, img)
+        self.update_perf_overlay()
+
+    def cancel_refine(self):
+        # 다른 페이지로 넘어가면 아직 끝나지 않은 전체 해상도 디코딩은 버림
+        if self.refine_future is not None:
+            self.refine_future.cancel()
+            self.refine_future = None
+        self.refine_generation += 1
+
+    def render_current(self):
+        # 확대 상태면 보이는 영역만 잘라서 표시
+        img = self.current_rgb
+        if img is None:
+            if self.refine_future is not None:
+                return  # 전체 해상도 디코딩이 끝나면 다시 그림
+            if self.current_image_path:
+                self.display_image(self.current_image_path)  # 메모리 회수된 원본 복구
+            return
+        if self.scroll_path is not None and self.scroll_path == self.current_image_path:
+            size = self.image_label.size()
+            y, h = scroll_window(img.shape[1], img.shape[0], size.width(), size.height(), self.scroll_progress)
+            img = img[y:y + h]
+        elif self.zoom > 1.0:
+            x, y, w, h = visible_region(img.shape[1], img.shape[0], self.zoom, self.view_center)
+            img = img[y:y + h, x:x + w]
+            if self.roi_active():
+                self.region_timer.start()
+        self.show_array(img)
+
+    def show_array(self, img):
         # QImage로 변환
-        h, w, ch = img.shape
-        bytes_per_line = ch * w
         if not img.flags['C_CONTIGUOUS']:
             img = np.ascontiguousarray(img)
+        h, w, ch = img.shape
+        bytes_per_line = ch * w
         qimg = QImage(img.data, w, h, bytes_per_line, QImage.Format_RGB888)
         pixmap = QPixmap.fromImage(qimg)
 
         # ✅ 스케일 조정 (fit_to_window 활성화 여부에 따라)
-        if self.fit_to_window:
-            scaled = apply_scaling(pixmap, self.scale_factor, self.image_label.size())
-        else:
-            scaled = apply_scaling(pixmap, self.scale_factor)
+        with tracer.span("scale"):
+            if self.fit_to_window:
+                scaled = apply_scaling(pixmap, self.scale_factor, self.image_label.size())
+            else:
+                scaled = apply_scaling(pixmap, self.scale_factor)
+
+        with tracer.span("paint"):
+            self.image_label.setPixmap(scaled)
+            if tracer.enabled:
+                self.image_label.repaint()  # 계측 시에만 즉시 그려 paint 비용을 구간에 포함
+
+    def load_rgb(self, path):
+        # 미리 디코딩된 결과가 있으면 사용, 없으면 직접 디코딩
+        future = self.prefetched.pop(path, None)
+        tracer.count("prefetch", hit=future is not None)
+        if future is not None and not future.cancelled():
+            with tracer.span("prefetch_wait"):
+                img = future.result()
+            if img is not None:
+                return img
+        if self.reader is not None:
+            # 미리 읽는 중인 파일이면 그 읽기를 기다림 (같은 파일을 다시 읽지 않음)
+            return get_decode_service(self.settings.decode_workers).decode(path, *self.decode_params())
+        return decode_rgb(path, *self.decode_params())
+
+    def decode_params(self):
+        """
+        (reduce, max_side) 디코딩 조건. 슬라이드쇼 중에는 품질 단계만큼 축소하고,
+        화면에 맞춰 볼 때는 워커에서 화면 크기로 미리 줄여 전환 시점의 축소 비용을 없앱니다.
+        """
+        if self.slideshow_clock is None:
+            return 1, None
+        max_side = None
+        if self.fit_to_window and self.zoom <= 1.0 and not self.enabled_upscale and not self.settings.slideshow_auto_scroll:
+            size = self.image_label.size()
+            max_side = max(size.width(), size.height())
+        return self.slideshow_clock.reduce, max_side
+
+    def toggle_perf_overlay(self, checked):
+        tracer.enable(checked)
+        self.perf_overlay.setVisible(checked)
+        self.settings.enabled_trace = checked
+        self.settings.save_to_json("config/settings.json")
+        self.update_perf_overlay()
+
+    def update_perf_overlay(self):
+        if not self.perf_overlay.isVisible():
+            return
+        lines = [f"{name:<14}{ms:8.1f} ms" for name, ms in sorted(tracer.last_durations.items())]
+        lines += [f"{name:<14}{tracer.hit_rate(name) * 100:7.0f} % hit" for name in sorted(tracer.counters)]
+        self.perf_overlay.setText("\n".join(lines))
+        self.perf_overlay.adjustSize()
+        self.perf_overlay.raise_()
+
+    def export_trace(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "트레이스 저장", "trace.json", "Chrome Trace (*.json)")
+        if file_path:
+            tracer.export_chrome_trace(file_path)
+            logging.info(f"트레이스 저장: {file_path} ({len(tracer.events)}개 구간)")
+
+    def prefetch_neighbors(self):
+        # 현재 위치 기준 다음 페이지들과 직전 페이지를 워커 프로세스에서 미리 디코딩
+        count = self.settings.prefetch_count
+        if count <= 0 or self.current_index < 0:
+            return
+
+        step = 2 if self.settings.page_mode == "double" else 1
+        start = max(0, self.current_index - 1)
+        end = self.current_index + 1 + count * step
+        wanted = [
+            p for i, p in enumerate(self.image_list[start:end], start)
+            if i != self.current_index and not self.is_animated_page(p)
+        ]
+
+        for p in list(self.prefetched):
+            if p not in wanted:
+                self.prefetched.pop(p).cancel()
+
+        service = get_decode_service(self.settings.decode_workers)
+        for p in wanted:
+            if p in self.prefetched:
+                continue
+            # 솔리드 압축은 아직 풀리지 않은 페이지를 기다리지 않고 다음 기회에 요청
+            name = self.archive_pages.get(p)
+            if name is not None and not self.archive.ready(name):
+                continue
+            if self.materialize(p):
+                future = self.prefetched[p] = service.submit(p, *self.decode_params())
+                if self.slideshow_clock is not None:
+                    timing = self.decode_timing[p] = [time.perf_counter(), None]
+                    future.add_done_callback(lambda f, t=timing: t.__setitem__(1, time.perf_counter()))
+
+        self.prefetch_previews(step)
+        self.read_ahead()
+
+    def read_ahead(self):
+        # 디코딩 범위보다 먼 다음 페이지들은 파일 바이트만 순서대로 읽어 둠 (압축 내부 페이지는 로컬 임시 파일이므로 제외)
+        if self.reader is None or self.current_index < 0:
+            return
+        step = 2 if self.settings.page_mode == "double" else 1
+        end = self.current_index + 1 + self.settings.read_ahead_count * step
+        self.reader.read_ahead([p for p in self.image_list[self.current_index + 1:end] if p not in self.archive_pages])
+
+    def prefetch_previews(self, step):
+        # 점진 표시용 작은 미리보기를 전체 디코딩보다 넓은 범위로 만들어 둠 (첫 화면은 조회만으로 그림)
+        if not self.settings.progressive_display or self.settings.page_mode != "single":
+            return
+        start = max(0, self.current_index - 2)
+        end = self.current_index + 1 + PREVIEW_AHEAD * step
+        wanted = [p for p in self.image_list[start:end] if not self.is_animated_page(p)]
+
+        for p in list(self.previews):
+            if p not in wanted:
+                self.previews.pop(p).cancel()
+
+        service = get_decode_service(self.settings.decode_workers)
+        for p in wanted:
+            if p in self.previews or p in self.archive_pages and not self.archive.ready(self.archive_pages[p]):
+                continue
+            if not self.materialize(p) or os.path.getsize(p) < self.settings.progressive_min_kb * 1024:
+                continue
+            self.previews[p] = service.submit(p, PROGRESSIVE_REDUCE, PREVIEW_MAX_SIDE)
 
-        self.image_label.setPixmap(scaled)
-        self.update_title()
-        
     def update_title(self):
         if 0 <= self.current_index < len(self.image_list):
             base = os.path.basename(self.image_list[self.current_index])
             folder = os.path.basename(os.path.dirname(self.image_list[self.current_index]))
+            if self.archive is not None:
+                base = self.archive_pages.get(self.image_list[self.current_index], base)
+                folder = os.path.basename(self.archive.path)
             total = len(self.image_list)
             self.setWindowTitle(f"{folder} - {base} [{self.current_index+1}/{total}]")
 
     def keyPressEvent(self, event):
-        if event.key() in (Qt.Key_Right, Qt.Key_Down):
+        if event.modifiers() & Qt.ShiftModifier and self.zoom > 1.0:
+            self.pan_view(event.key())
+        elif self.settings.page_mode == "strip" and event.key() in (Qt.Key_Down, Qt.Key_Up, Qt.Key_Space):
+            # 화면 높이의 80%씩 (겹치는 부분으로 읽던 위치를 놓치지 않게)
+            step = int(self.strip_view.viewport().height() * 0.8)
+            self.strip_view.scroll_by(-step if event.key() == Qt.Key_Up else step)
+        elif event.key() in (Qt.Key_Right, Qt.Key_Down):
             self.load_next_image()
         elif event.key() in (Qt.Key_Left, Qt.Key_Up):
             self.load_previous_image()
+        elif event.key() == Qt.Key_Escape and self.slideshow_clock is not None:
+            self.stop_slideshow()
         elif event.key() == Qt.Key_Escape:
             self.close()
         elif event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
             self.open_thumbnail_dialog()
 
     def wheelEvent(self, event: QWheelEvent):
-        if event.angleDelta().y() > 0:
+        if self.settings.page_mode == "strip":
+            # 세로 연속 보기는 페이지 단위가 아니라 픽셀 단위로 스크롤
+            self.strip_view.scroll_by(-event.angleDelta().y())
+        elif event.modifiers() & Qt.ControlModifier:
+            self.set_zoom(self.zoom * (1.25 if event.angleDelta().y() > 0 else 0.8))
+        elif event.angleDelta().y() > 0:
             self.load_previous_image()
         else:
             self.load_next_image()
@@ -321,6 +991,191 @@ class ImageViewer(QMainWindow):
         elif self.current_index != -1:
             self.refresh_image()
 
+    def set_zoom(self, zoom):
+        self.zoom = min(max(1.0, zoom), 16.0)
+        self.render_current()
+
+    def pan_view(self, key):
+        # Shift + 방향키: 보이는 영역의 10%씩 이동
+        step = 0.1 / self.zoom
+        dx = {Qt.Key_Left: -step, Qt.Key_Right: step}.get(key, 0.0)
+        dy = {Qt.Key_Up: -step, Qt.Key_Down: step}.get(key, 0.0)
+        cx, cy = self.view_center
+        half = 0.5 / self.zoom
+        self.view_center = (min(max(half, cx + dx), 1 - half), min(max(half, cy + dy), 1 - half))
+        self.render_current()
+
+    def roi_active(self):
+        # 영역 업스케일도 메뉴에서 업스케일을 켠 경우에만 (확대만으로 모델을 로드하지 않음)
+        return self.enabled_upscale and self.settings.roi_upscale and self.zoom >= self.settings.roi_min_zoom
+
+    def region_image_key(self):
+        # 배율/모델/백엔드가 다르면 타일 크기와 결과가 달라지므로 키에 포함
+        backend = self.settings.inference_backends.get("real-esrgan", "")
+        return (
+            f"{self.current_image_path}|{self.settings.page_mode}|"
+            f"{self.rotation_angle}|{self.flip_horizontal}|{self.flip_vertical}|"
+            f"{self.settings.scale_factor}|{self.settings.model_path}|{backend}"
+        )
+
+    def request_region_upscale(self):
+        if self.refine_future is not None or not self.roi_active():
+            return
+        if self.current_rgb is None and self.current_image_path:
+            self.display_image(self.current_image_path)  # 메모리 회수된 원본 복구
+        if self.current_rgb is None or not self.ensure_upscaler():
+            return
+        # 이미 처리 중이면 끝난 뒤 최신 영역으로 다시 요청
+        if self.region_worker is not None:
+            self.region_pending = True
+            return
+
+        img = self.current_rgb
+        region = visible_region(img.shape[1], img.shape[0], self.zoom, self.view_center)
+        self.region_request_id += 1
+        self.region_worker = AsyncRegionUpscaleWorker(
+            img, region, self.upscaler, self.region_cache, self.region_image_key(),
+            self.region_request_id, tile=self.settings.roi_tile, margin=self.settings.roi_margin
+        )
+        self.region_worker.finished.connect(self.on_region_upscale_done)
+        self.region_worker.start()
+
+    def on_region_upscale_done(self, canvas, covered, request_id):
+        self.region_worker = None
+        if self.region_pending:
+            self.region_pending = False
+            self.request_region_upscale()
+            return
+
+        if canvas is None or request_id != self.region_request_id or self.current_rgb is None:
+            return
+
+        img = self.current_rgb
+        x, y, w, h = visible_region(img.shape[1], img.shape[0], self.zoom, self.view_center)
+        cx, cy, cw, ch = covered
+        if x < cx or y < cy or x + w > cx + cw or y + h > cy + ch:
+            return  # 그 사이 화면이 영역 밖으로 이동함
+        self.show_array(crop_upscaled(canvas, covered, (x, y, w, h)))
+
+    def toggle_slideshow(self, checked):
+        if checked:
+            self.start_slideshow()
+        else:
+            self.stop_slideshow()
+
+    def start_slideshow(self):
+        if not self.image_list or self.slideshow_clock is not None:
+            self.slideshow_action.setChecked(self.slideshow_clock is not None)
+            return
+        self.slideshow_clock = SlideshowClock(self.settings.slideshow_interval)
+        # 전체 해상도로 받아둔 프리페치는 버리고 슬라이드쇼 조건으로 다시 요청
+        self.evict_prefetch(0)
+        self.decode_timing.clear()
+        self.prefetch_neighbors()
+        self.begin_auto_scroll()
+        self.slideshow_clock.start(self.page_duration())
+        self.slideshow_timer.start(max(0, int(self.slideshow_clock.remaining() * 1000)))
+        self.slideshow_action.setChecked(True)
+
+    def stop_slideshow(self):
+        if self.slideshow_clock is None:
+            return
+        stats = self.slideshow_clock.stats()
+        logging.info(
+            f"[슬라이드쇼] 전환 {stats['transitions']}회, 마감 초과 {stats['misses']}회 "
+            f"(p95 {stats['p95_late_ms']:.1f}ms), 마지막 품질 1/{stats['reduce']}"
+        )
+        self.statusBar().showMessage(f"슬라이드쇼 종료: 마감 초과 {stats['misses']}/{stats['transitions']}", 5000)
+        self.slideshow_timer.stop()
+        self.scroll_timer.stop()
+        self.scroll_path = None
+        self.slideshow_clock = None
+        self.slideshow_action.setChecked(False)
+        # 축소 디코딩한 페이지를 원래 품질로 다시 표시
+        self.evict_prefetch(0)
+        self.refresh_image()
+
+    def advance_slideshow(self):
+        clock = self.slideshow_clock
+        if clock is None:
+            return
+        step = 2 if self.settings.page_mode == "double" else 1
+        next_index = self.current_index + step
+        if next_index >= len(self.image_list):
+            self.stop_slideshow()
+            return
+
+        next_path = self.image_list[next_index]
+        future = self.prefetched.get(next_path)
+        if future is not None and not future.done():
+            # 준비가 덜 끝났으면 잠깐 뒤 다시 확인 (늦어진 만큼 마감 초과로 기록되고 품질 단계가 내려감)
+            self.slideshow_timer.start(5)
+            return
+
+        timing = self.decode_timing.pop(next_path, None)
+        prepare_time = timing[1] - timing[0] if timing and timing[1] else 0.0
+        img = future.result() if future is not None and not future.cancelled() else None
+        size = self.image_label.size()
+        tall = (self.settings.slideshow_auto_scroll and img is not None
+                and is_tall_page(img.shape[1], img.shape[0], size.width(), size.height()))
+        # 세로로 긴 페이지는 처음부터 맨 위 부분만 그림
+        self.scroll_path = next_path if tall else None
+        self.scroll_progress = 0.0
+
+        with tracer.span("slide", reduce=clock.reduce):
+            self.load_next_image()
+            self.image_label.repaint()
+        shown_at = time.perf_counter()
+        late = shown_at - clock.deadline
+        reduce_before = clock.reduce
+        missed = clock.record(shown_at, prepare_time, self.page_duration())
+
+        tracer.count("slide_deadline", hit=not missed)
+        tracer.last_durations["slide_late"] = max(0.0, late) * 1000
+        if missed:
+            self.statusBar().showMessage(f"슬라이드 마감 초과 {late * 1000:.0f}ms (품질 1/{clock.reduce})", 3000)
+        if clock.reduce != reduce_before:
+            logging.info(f"[슬라이드쇼] 디코딩 품질 1/{reduce_before} → 1/{clock.reduce}")
+
+        self.begin_auto_scroll()
+        self.update_perf_overlay()
+        self.slideshow_timer.start(max(0, int(clock.remaining() * 1000)))
+
+    def page_duration(self):
+        # 세로로 긴 페이지는 화면 한 장 분량마다 interval만큼 머무르며 스크롤
+        img = self.current_rgb
+        if not self.settings.slideshow_auto_scroll or img is None:
+            return None
+        size = self.image_label.size()
+        if not is_tall_page(img.shape[1], img.shape[0], size.width(), size.height()):
+            return None
+        _, visible_h = scroll_window(img.shape[1], img.shape[0], size.width(), size.height(), 0.0)
+        return self.settings.slideshow_interval * img.shape[0] / visible_h
+
+    def begin_auto_scroll(self):
+        duration = self.page_duration()
+        if self.slideshow_clock is None or duration is None:
+            self.scroll_timer.stop()
+            if self.scroll_path is not None:
+                self.scroll_path = None
+                self.render_current()
+            return
+        self.scroll_path = self.current_image_path
+        self.scroll_progress = 0.0
+        self.scroll_started = time.perf_counter()
+        self.scroll_duration = duration
+        self.scroll_timer.start()
+        self.render_current()
+
+    def update_auto_scroll(self):
+        if self.scroll_path != self.current_image_path:
+            self.scroll_timer.stop()
+            return
+        self.scroll_progress = min(1.0, (time.perf_counter() - self.scroll_started) / self.scroll_duration)
+        self.render_current()
+        if self.scroll_progress >= 1.0:
+            self.scroll_timer.stop()
+
     def load_next_image(self):
         step = 2 if self.settings.page_mode == "double" else 1
         if self.current_index + step < len(self.image_list):
@@ -336,12 +1191,101 @@ class ImageViewer(QMainWindow):
     def open_thumbnail_dialog(self):
         if self.current_image_path:
             current_dir = os.path.dirname(self.current_image_path)
-            dialog = ThumbnailDialog(current_dir, parent=self)
+            # 현재 목록(정렬/필터, 압축 파일 페이지)을 그대로 보여줌
+            dialog = ThumbnailDialog(
+                current_dir, parent=self, image_paths=self.image_list, prepare=self.prepare_page,
+                label_fn=lambda p: self.archive_pages.get(p, os.path.basename(p))
+            )
+            dialog.select_path(self.current_image_path)
             dialog.imageSelected.connect(self.show_thumbnail)
             dialog.exec_()
         else:
             QMessageBox.warning(self, "경고", "이미지 폴더를 찾을 수 없습니다.")
 
+    def find_duplicates(self):
+        # 현재 폴더(또는 압축 파일)의 페이지 목록에서 지각 해시로 중복/유사 이미지 검색
+        if not self.image_list:
+            QMessageBox.warning(self, "경고", "이미지 폴더를 찾을 수 없습니다.")
+            return
+        if self.duplicate_worker is not None and self.duplicate_worker.isRunning():
+            return
+
+        items = [(key, p, source) for p in self.image_list for key, source in [self.page_key(p)]]
+        self.duplicate_worker = AsyncDuplicateWorker(
+            items, get_decode_service(self.settings.decode_workers),
+            kind=self.settings.duplicate_hash, max_distance=self.settings.duplicate_distance,
+            prepare=self.materialize if self.archive is not None else None
+        )
+        self.duplicate_worker.progress.connect(
+            lambda done, total: self.statusBar().showMessage(f"중복 검색 중... {done}/{total}")
+        )
+        self.duplicate_worker.finished.connect(self.on_duplicates_found)
+        self.duplicate_worker.start()
+
+    def on_duplicates_found(self, groups):
+        self.statusBar().clearMessage()
+        if not groups:
+            QMessageBox.information(self, "중복 이미지", "중복 이미지가 없습니다.")
+            return
+        label = lambda p: self.archive_pages.get(p, os.path.basename(p))
+        dialog = DuplicateDialog(groups, label_fn=label, parent=self)
+        dialog.imageSelected.connect(self.load_image)
+        dialog.exec()
+
+    def batch_export(self):
+        # 현재 페이지/목록 또는 다른 폴더·압축 파일을 변환해 폴더나 새 CBZ로 내보내기
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.information(self, "일괄 내보내기", "이미 내보내는 중입니다.")
+            return
+
+        has_page = 0 <= self.current_index < len(self.image_list)
+        default_target = ""
+        if self.page_source:
+            base = os.path.splitext(self.page_source)[0] if self.archive is not None else self.page_source
+            default_target = base.rstrip(os.sep) + "_export"
+        dialog = ExportDialog(default_target, has_page, parent=self)
+        if not dialog.exec():
+            return
+        target = dialog.target()
+        scope = dialog.scope()
+
+        names = None
+        reader = None
+        if scope in ("page", "list"):
+            if not has_page:
+                QMessageBox.warning(self, "경고", "열려 있는 페이지가 없습니다.")
+                return
+            source = self.page_source
+            paths = [self.image_list[self.current_index]] if scope == "page" else list(self.image_list)
+            names = [self.archive_pages.get(p, os.path.basename(p)) for p in paths]
+            reader = self.archive
+        elif scope == "folder":
+            source = QFileDialog.getExistingDirectory(self, "내보낼 폴더 선택")
+        else:
+            source, _ = QFileDialog.getOpenFileName(self, "내보낼 압축 파일 선택", "", "Archives (*.zip *.cbz *.cbt *.tar *.cb7 *.7z *.cbr *.rar)")
+        if not source or not target:
+            return
+        if os.path.abspath(target) == os.path.abspath(source):
+            QMessageBox.warning(self, "경고", "원본과 다른 출력 위치를 선택하세요.")
+            return
+
+        self.export_worker = BatchExportWorker(
+            source, dialog.pipeline(), target, names=names, reader=reader,
+            workers=self.settings.export_workers, settings=self.settings
+        )
+        self.export_worker.progress.connect(
+            lambda done, total: self.statusBar().showMessage(f"내보내는 중... {done}/{total}")
+        )
+        self.export_worker.finished.connect(lambda done, failed: self.on_export_finished(target, done, failed))
+        self.export_worker.start()
+
+    def on_export_finished(self, target, done, failed):
+        self.statusBar().clearMessage()
+        message = f"{done}장을 내보냈습니다.\n{target}"
+        if failed:
+            message += f"\n(실패 {failed}장)"
+        QMessageBox.information(self, "일괄 내보내기", message)
+
     def contextMenuEvent(self, event: QContextMenuEvent):
         menu = QMenu(self)
         info_action = menu.addAction("이미지 정보 보기")
@@ -353,7 +1297,7 @@ class ImageViewer(QMainWindow):
         if 0 <= self.current_index < len(self.image_list):
             path = self.image_list[self.current_index]
             size_kb = os.path.getsize(path) / 1024
-            img = cv2.imread(path)
+            img = decode_rgb(path)
             h, w = img.shape[:2] if img is not None else ("?", "?")
             msg = (
                 f"파일명: {os.path.basename(path)}\n"
@@ -363,7 +1307,7 @@ class ImageViewer(QMainWindow):
             QMessageBox.information(self, "이미지 정보", msg)
 
     def start_upscaling(self, path):
-        if not self.upscaler:
+        if not self.ensure_upscaler():
             QMessageBox.warning(self, "오류", "업스케일러가 초기화되지 않았습니다.")
             return
 
@@ -377,9 +1321,8 @@ class ImageViewer(QMainWindow):
         if self.settings.page_mode == "double" and img.shape[1] < 1200:
             if self.current_index + 1 < len(self.image_list):
                 next_path = self.image_list[self.current_index + 1]
-                next_img = cv2.imread(next_path)
+                next_img = decode_rgb(next_path) if self.materialize(next_path) else None
                 if next_img is not None:
-                    next_img = cv2.cvtColor(next_img, cv2.COLOR_BGR2RGB)
                     if next_img.shape[0] != img.shape[0]:
                         next_img = cv2.resize(next_img, (int(next_img.shape[1] * (img.shape[0] / next_img.shape[0])), img.shape[0]))
                     img = np.concatenate((img, next_img), axis=1)
@@ -388,35 +1331,156 @@ class ImageViewer(QMainWindow):
             self.on_upscale_done(img)
             return
         
-        self.image_label.setText("업스케일링 중...")  # 로딩 표시
-        self.upscale_worker = AsyncUpscaleWorker(path, self.upscaler, cache_path)
+        # 화면에 필요한 업스케일에 코어를 모두 넘김 (입력이 멈추면 미리 업스케일 재개)
+        if self.idle_upscaler is not None:
+            self.idle_upscaler.pause()
+
+        # 가벼운 업스케일러 결과를 먼저 보여주고, 모델 결과가 끝나면 교체
+        if os.path.exists(cache_path) or not self.show_upscale_preview(path):
+            self.image_label.setText("업스케일링 중...")  # 로딩 표시
+        self.upscale_worker = AsyncUpscaleWorker(path, self.ensure_upscaler(), cache_path)
         self.upscale_worker.finished.connect(self.on_upscale_done)
         self.upscale_worker.start()
 
+    # ------------------------------------------------------------ 유휴 시간 미리 업스케일
+
+    def toggle_idle_upscale(self, checked):
+        self.settings.idle_upscale = checked
+        self.settings.save_to_json("config/settings.json")
+        self.set_idle_upscale(checked)
+
+    def set_idle_upscale(self, enabled):
+        app = QApplication.instance()
+        if enabled and not self.idle_filter_installed:
+            app.installEventFilter(self)
+            self.idle_filter_installed = True
+            self.idle_timer.start(int(self.settings.idle_upscale_delay * 1000))
+        elif not enabled:
+            if self.idle_filter_installed:
+                app.removeEventFilter(self)
+                self.idle_filter_installed = False
+            self.idle_timer.stop()
+            self.stop_idle_upscale()
+
+    def eventFilter(self, obj, event):
+        if event.type() in USER_INPUT_EVENTS:
+            self.on_user_activity()
+        return super().eventFilter(obj, event)
+
+    def on_user_activity(self):
+        if self.idle_upscaler is not None:
+            self.idle_upscaler.pause()
+        self.idle_timer.start(int(self.settings.idle_upscale_delay * 1000))
+
+    def foreground_busy(self):
+        return any(
+            worker is not None and worker.isRunning()
+            for worker in (self.upscale_worker, self.region_worker)
+        )
+
+    def on_user_idle(self):
+        # 화면에 필요한 업스케일이 진행 중이면 끝날 때까지 양보
+        if self.foreground_busy():
+            self.idle_timer.start(int(self.settings.idle_upscale_delay * 1000))
+            return
+        if self.idle_upscaler is None:
+            if not self.idle_queue(limit=1):
+                return
+            self.idle_upscaler = IdleUpscaler(self.settings, cores=self.settings.idle_upscale_cores)
+            self.idle_poll_timer.start()
+        self.idle_upscaler.resume()
+        self.feed_idle_upscale()
+
+    def is_upscale_cached(self, path):
+        if path in self.idle_cached:
+            return True
+        if os.path.exists(self.get_cached_path(path)):
+            self.idle_cached.add(path)
+            return True
+        return False
+
+    def idle_queue(self, limit=0):
+        if not 0 <= self.current_index < len(self.image_list):
+            return []
+        return plan_queue(
+            self.image_list, self.current_index, self.is_upscale_cached, self.settings.idle_upscale_ahead,
+            animated=self.is_animated_page, limit=limit
+        )
+
+    def feed_idle_upscale(self):
+        upscaler = self.idle_upscaler
+        if upscaler is None or upscaler.busy() or upscaler.paused:
+            return
+        # 한 번에 한 장만 맡기므로 처음 만나는 캐시 없는 페이지에서 탐색을 멈춤 (GUI 스레드에서 실행)
+        pending = self.idle_queue(limit=1)
+        self.save_idle_progress()
+        if not pending:
+            # 다 채웠으면 모델 메모리를 돌려줌 (다른 폴더를 열면 다시 시작)
+            self.stop_idle_upscale()
+            return
+        # 솔리드 압축처럼 아직 풀리지 않았으면 다음 폴링에서 다시 시도
+        if self.prepare_page(pending[0]):
+            upscaler.submit(pending[0], self.get_cached_path(pending[0]))
+
+    def poll_idle_upscale(self):
+        upscaler = self.idle_upscaler
+        if upscaler is None:
+            return
+        upscaler.poll()
+        if upscaler.failed:
+            self.stop_idle_upscale()
+            return
+        self.feed_idle_upscale()
+
+    def save_idle_progress(self):
+        if self.page_source is None:
+            return
+        # 현재 위치가 아니라 캐시가 있는 것으로 확인된 페이지 수 (건너뛴 앞쪽 페이지는 세지 않음)
+        total = len(self.image_list)
+        done = sum(1 for p in self.image_list if p in self.idle_cached)
+        if self.idle_progress.get(self.page_source) != {"done": done, "total": total}:
+            self.idle_progress.update(self.page_source, done, total)
+            self.idle_progress.save()
+
+    def stop_idle_upscale(self):
+        self.idle_poll_timer.stop()
+        if self.idle_upscaler is not None:
+            self.idle_upscaler.stop()
+            self.idle_upscaler = None
+
+    def create_preview_upscaler(self):
+        if not self.settings.preview_upscaler:
+            return None
+        try:
+            return create_upscaler(self.settings.preview_upscaler, self.settings)
+        except ValueError:
+            return None
+
+    def show_upscale_preview(self, path):
+        if self.preview_upscaler is None:
+            return False
+        img = self.load_rgb(path)
+        if img is None:
+            return False
+        self.show_array(self.preview_upscaler.upscale(img))
+        return True
+
     def on_upscale_done(self, img):
         if img is None:
             QMessageBox.warning(self, "오류", "업스케일링 실패: 원본 이미지를 표시합니다.")
             self.display_image(self.current_image_path)
             return
 
-        if not img.flags['C_CONTIGUOUS']:
-            img = np.ascontiguousarray(img)
-        h, w, ch = img.shape
-        bytes_per_line = ch * w
-        qimg = QImage(img.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        pixmap = QPixmap.fromImage(qimg)
-
-        if self.fit_to_window:
-            scaled = apply_scaling(pixmap, self.scale_factor, self.image_label.size())
-        else:
-            scaled = apply_scaling(pixmap, self.scale_factor)
-
-        self.image_label.setPixmap(scaled)
+        self.show_array(img)
         self.update_title()
         self.upscale_processing = False
         self._process_next_upscale()
 
     def request_upscale(self, path):
+        if self.roi_active():
+            self.request_region_upscale()
+            return
+
         if not self.settings.sequential_upscale:
             self.start_upscaling(path)
             return
@@ -438,6 +1502,16 @@ class ImageViewer(QMainWindow):
     def load_image(self, path):
         self.open_image(path)
 
+    def open_files(self, paths):
+        """다른 실행에서 넘겨받은 파일 열기 (단일 인스턴스): 이미 로드된 캐시/모델을 그대로 사용"""
+        paths = [p for p in paths if os.path.exists(p)]
+        if paths:
+            self.open_image(paths[0])
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
     def toggle_ui_visibility(self, checked):
         self.auto_ui_hidden = checked
         self.menuBar().setVisible(not checked)
@@ -454,11 +1528,117 @@ class ImageViewer(QMainWindow):
                 self.menuBar().setVisible(False)
         super().mouseMoveEvent(event)
 
+    # ------------------------------------------------------------ 이어 보기
+
+    def save_session_state(self):
+        if not self.settings.restore_session or self.page_source is None or self.current_image_path is None:
+            return
+        page = self.archive_pages.get(self.current_image_path, os.path.basename(self.current_image_path))
+        page_offset = 0.0
+        if self.settings.page_mode == "strip" and self.current_index >= 0:
+            layout = self.strip_view.layout
+            top = self.strip_view.verticalScrollBar().value()
+            page_offset = (top - layout.offset(self.current_index)) / layout.page_height(self.current_index)
+            snapshot = self.strip_view.viewport().grab()
+        else:
+            snapshot = self.image_label.grab() if not self.image_label.pixmap().isNull() else None
+
+        state = SessionState(
+            source=self.page_source, page=page, index=self.current_index, page_mode=self.settings.page_mode,
+            zoom=self.zoom, view_center=list(self.view_center), page_offset=page_offset,
+            rotation_angle=self.rotation_angle, flip_horizontal=self.flip_horizontal, flip_vertical=self.flip_vertical,
+            geometry=[self.x(), self.y(), self.width(), self.height()],
+        )
+        # 화면에 그려진 그대로 (화면 해상도) 저장 → 다음 실행에서 디코딩 없이 바로 그림
+        if snapshot is not None and not snapshot.isNull():
+            os.makedirs(os.path.dirname(SNAPSHOT_PATH), exist_ok=True)
+            if snapshot.save(SNAPSHOT_PATH, "JPG", 85):
+                state.snapshot_mtime = os.path.getmtime(SNAPSHOT_PATH)
+        save_session(state)
+
+    def restore_session(self):
+        """
+        마지막으로 보던 페이지의 스냅샷을 바로 그리고, 실제 목록/디코딩은 이벤트 루프가 돈 뒤에 진행합니다.
+        Returns:
+            bool: 복원할 세션이 있었는지
+        """
+        if not self.settings.restore_session:
+            return False
+        state = load_session()
+        if state is None:
+            return False
+        if state.geometry:
+            self.setGeometry(*state.geometry)
+        if snapshot_valid(state):
+            with tracer.span("session_snapshot"):
+                pixmap = QPixmap(SNAPSHOT_PATH)
+            if not pixmap.isNull():
+                self.view_stack.setCurrentWidget(self.image_label)
+                self.image_label.setPixmap(pixmap)
+                self.setWindowTitle(f"{os.path.basename(state.source)} - {state.page}")
+        QTimer.singleShot(0, lambda: self.resume_session(state))
+        return True
+
+    def resume_session(self, state):
+        self.rotation_angle = state.rotation_angle
+        self.flip_horizontal = state.flip_horizontal
+        self.flip_vertical = state.flip_vertical
+        self.zoom = state.zoom
+        self.settings.page_mode = state.page_mode
+
+        if state.is_archive:
+            self.resume_key = f"{state.source}::{state.page}"
+            self.open_archive(state.source, start_name=state.page, start_index=state.index)
+        else:
+            path = state.page_path()
+            if not os.path.exists(path):
+                # 페이지가 지워졌으면 같은 폴더의 같은 위치
+                self.page_source = state.source
+                self.set_page_list(self.list_pages())
+                if not self.image_list:
+                    return
+                path = self.image_list[min(state.index, len(self.image_list) - 1)]
+            else:
+                self.resume_key = path
+            self.open_image(path)
+        self.resume_key = None
+
+        if self.settings.page_mode == "strip":
+            layout = self.strip_view.layout
+            if 0 <= self.current_index < len(layout):
+                top = layout.offset(self.current_index) + round(state.page_offset * layout.page_height(self.current_index))
+                self.strip_view.verticalScrollBar().setValue(top)
+        elif self.zoom > 1.0:
+            self.view_center = tuple(state.view_center)
+            if self.current_rgb is not None:
+                self.render_current()
+
     def closeEvent(self, event): 
+        self.save_session_state()
         # 윈도우가 닫히기 직전에 호출되는 이벤트 핸들러
         # GIF 재생 중일 경우 self.gif_player.stop()으로 재생 정지 처리
         if self.gif_player:
             self.gif_player.stop()
+        for future in self.prefetched.values():
+            future.cancel()
+        self.prefetched.clear()
+        self.evict_previews(0)
+        self.cancel_refine()
+        self.slideshow_timer.stop()
+        self.scroll_timer.stop()
+        self.strip_view.clear()
+        if self.export_worker is not None and self.export_worker.isRunning():
+            self.export_worker.requestInterruption()
+            self.export_worker.wait()
+        self.close_archive()
+        if self.catalog_worker is not None and self.catalog_worker.isRunning():
+            self.catalog_worker.requestInterruption()
+            self.catalog_worker.wait()
+        self.catalog.close()
+        self.set_idle_upscale(False)
+        shutdown_decode_service()
+        if self.reader is not None:
+            self.reader.shutdown()
         event.accept()
 
     def showEvent(self, event):
@@ -482,12 +1662,11 @@ class ImageViewer(QMainWindow):
             QMessageBox.warning(self, "경고", "썸네일을 찾을 수 없습니다.")
             return
 
-        img = cv2.imread(path)
+        img = decode_rgb(path)
         if img is None:
             QMessageBox.warning(self, "경고", "썸네일을 열 수 없습니다.")
             return
 
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         h, w, ch = img.shape
         bytes_per_line = ch * w
         qimg = QImage(img.data, w, h, bytes_per_line, QImage.Format_RGB888)
@@ -495,27 +1674,55 @@ class ImageViewer(QMainWindow):
 
         self.image_label.setPixmap(pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio))
 
-    def extract_archive(self, path):
-        #.zip, .cbz 등 압축 파일의 내용을 임시 폴더에 풀고, 이미지 리스트로 갱신
-        # archive_tempdir를 사용해 중복 압축 해제 방지 및 기존 캐시 삭제
+    def open_archive(self, path, start_name=None, start_index=0):
+        # 압축 파일을 열어 내부 이미지 목록으로 갱신 (페이지는 표시할 때 필요한 것만 풀림)
         if not os.path.exists(path):
             QMessageBox.warning(self, "경고", "압축 파일을 찾을 수 없습니다.")
             return
 
-        if self.archive_tempdir:
-            extract_archive(self.archive_tempdir)
-            self.archive_tempdir = None
-        else:
-            self.archive_tempdir = extract_archive(path)
-            if not self.archive_tempdir:
-                QMessageBox.warning(self, "경고", "압축 해제에 실패했습니다.")
-                return
+        self.close_archive()
+        try:
+            self.archive = open_archive(path)
+        except Exception as e:
+            logging.error(f"압축 파일 열기 실패: {e}")
+            QMessageBox.warning(self, "경고", "압축 파일을 열 수 없습니다.")
+            return
+
+        names = self.archive.names()
+        if not names:
+            QMessageBox.warning(self, "경고", "압축 파일에 이미지가 없습니다.")
+            self.close_archive()
+            return
 
-        self.image_list = sorted([
-            os.path.join(self.archive_tempdir, f) for f in os.listdir(self.archive_tempdir)
-            if is_image_file(f)
-        ])
-        self.current_index = 0
+        self.archive_pages = {self.archive.target_path(n): n for n in names}
+        self.page_source = os.path.abspath(path)
+        self.set_page_list(self.list_pages() or list(self.archive_pages))
+        start = self.archive.target_path(start_name) if start_name is not None else None
+        self.current_index = self.page_index.get(start, min(start_index, len(self.image_list) - 1))
         self.open_image(self.image_list[self.current_index])
 
-    
\ No newline at end of file
+    def close_archive(self):
+        if self.archive is None:
+            return
+        for p in [p for p in self.prefetched if p in self.archive_pages]:
+            self.prefetched.pop(p).cancel()
+        if self.export_worker is not None and self.export_worker.isRunning() and self.export_worker.reader is self.archive:
+            # 내보내기가 같은 리더를 쓰는 중이면 끝난 뒤에 닫음
+            self.export_worker.finished.connect(self.archive.close)
+        else:
+            self.archive.close()
+        self.archive = None
+        self.archive_pages = {}
+        self.page_source = None
+        self.set_page_list([])
+
+    def materialize(self, path):
+        """압축 내부 페이지면 풀어서 파일로 만들고, 표시 가능한 파일이 있는지 반환"""
+        name = self.archive_pages.get(path)
+        if name is not None:
+            try:
+                self.archive.extract(name)
+            except Exception as e:
+                logging.error(f"압축 해제 실패: {name} ({e})")
+                return False
+        return os.path.exists(path)
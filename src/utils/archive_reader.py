@@ -0,0 +1,413 @@
+"""
+압축 파일(만화책 아카이브) 읽기.
+
+    reader = open_archive("book.cbt")
+    for name in reader.names():
+        path = reader.extract(name)   # 필요한 페이지만 임시 폴더에 풀어 경로 반환
+
+지원 형식
+    .zip / .cbz          : 중앙 디렉터리로 임의 접근
+    .tar / .cbt          : 최초 열 때 멤버 오프셋 색인을 만들어 캐시에 저장, 이후 seek로 임의 접근
+    .tar.gz / .tgz 등    : 압축 tar는 솔리드 → 순차 스트림 프리페처
+    .7z / .cb7           : py7zr 필요, 솔리드 → 순차 스트림 프리페처
+    .rar / .cbr          : rarfile(+unrar) 필요, 솔리드 아카이브면 순차 스트림 프리페처
+"""
+import os
+import json
+import shutil
+import hashlib
+import tarfile
+import zipfile
+import time
+import tempfile
+import threading
+import subprocess
+from abc import ABC, abstractmethod
+
+from utils.image_utils import CACHE_DIR, is_image_file, natural_sort_key
+
+ARCHIVE_EXTENSIONS = (".zip", ".cbz", ".tar", ".cbt", ".tgz", ".tar.gz", ".tar.bz2", ".tar.xz", ".7z", ".cb7", ".rar", ".cbr")
+INDEX_DIR = os.path.join(CACHE_DIR, "archive_index")
+RAR_POLL_INTERVAL = 0.05  # 솔리드 RAR 해제 진행 확인 간격 (초)
+
+
+def is_archive_file(path):
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def _index_path(archive_path):
+    hashed = hashlib.md5(os.path.abspath(archive_path).encode()).hexdigest()
+    return os.path.join(INDEX_DIR, f"{hashed}.json")
+
+
+def load_index(archive_path):
+    """저장된 멤버 색인을 불러옵니다. 아카이브 크기/수정시각이 바뀌었으면 None."""
+    try:
+        st = os.stat(archive_path)
+        with open(_index_path(archive_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["size"] != st.st_size or data["mtime"] != st.st_mtime:
+            return None
+        return {name: tuple(entry) for name, entry in data["members"].items()}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_index(archive_path, members):
+    st = os.stat(archive_path)
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    with open(_index_path(archive_path), "w", encoding="utf-8") as f:
+        json.dump({"size": st.st_size, "mtime": st.st_mtime, "members": members}, f, ensure_ascii=False)
+
+
+class ArchiveReader(ABC):
+    solid = False
+
+    def __init__(self, path):
+        self.path = path
+        self.temp_dir = tempfile.mkdtemp(prefix="viewer_extract_")
+        self._names = []
+        self._order = {}
+        self._targets = {}
+
+    def _set_names(self, names):
+        self._names = sorted(names, key=natural_sort_key)
+        self._order = {name: i for i, name in enumerate(self._names)}
+
+    def names(self):
+        """이미지 멤버 이름 목록 (자연 정렬)"""
+        return list(self._names)
+
+    def has(self, name):
+        return name in self._order
+
+    @abstractmethod
+    def size(self, name) -> int:
+        """멤버의 압축 해제 후 크기 (바이트)"""
+        pass
+
+    def target_path(self, name):
+        # 하위 폴더를 평탄화하고 순번을 붙여 이름 충돌을 막음 (확장자는 유지)
+        if name not in self._targets:
+            index = self._order[name]
+            self._targets[name] = os.path.join(self.temp_dir, f"{index:05d}_{os.path.basename(name)}")
+        return self._targets[name]
+
+    @abstractmethod
+    def read(self, name) -> bytes:
+        """멤버 전체 바이트"""
+        pass
+
+    def ready(self, name):
+        """extract()가 기다리지 않고 바로 끝나는지"""
+        return True
+
+    def extract(self, name):
+        """멤버를 임시 폴더에 풀고 파일 경로를 반환합니다 (이미 풀린 경우 바로 반환)."""
+        target = self.target_path(name)
+        if not os.path.exists(target):
+            data = self.read(name)
+            tmp = target + ".part"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+        return target
+
+    def close(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class ZipArchiveReader(ArchiveReader):
+    def __init__(self, path):
+        super().__init__(path)
+        self._zip = zipfile.ZipFile(path, "r")
+        self._lock = threading.Lock()
+        self._set_names(n for n in self._zip.namelist() if is_image_file(n))
+
+    def size(self, name):
+        return self._zip.getinfo(name).file_size
+
+    def read(self, name):
+        with self._lock:
+            return self._zip.read(name)
+
+    def close(self):
+        self._zip.close()
+        super().close()
+
+
+class TarArchiveReader(ArchiveReader):
+    """비압축 tar: (데이터 오프셋, 크기) 색인으로 seek 후 바로 읽음"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._members = load_index(path)
+        if self._members is None:
+            with tarfile.open(path, "r:") as tf:
+                self._members = {
+                    m.name: (m.offset_data, m.size)
+                    for m in tf.getmembers() if m.isfile() and is_image_file(m.name)
+                }
+            save_index(path, self._members)
+
+        self._set_names(self._members)
+        self._file = open(path, "rb")
+        self._lock = threading.Lock()
+
+    def size(self, name):
+        return self._members[name][1]
+
+    def read(self, name):
+        offset, size = self._members[name]
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class SolidArchiveReader(ArchiveReader):
+    """
+    솔리드 아카이브: 임의 접근 비용이 앞부분 전체 해제와 같으므로,
+    백그라운드 스레드가 처음부터 한 번만 순서대로 풀어두고 extract()는 해당 멤버를 기다립니다.
+    """
+    solid = True
+
+    def __init__(self, path):
+        super().__init__(path)
+        # 목록을 얻는 것도 전체 해제 비용이 들므로 색인에 저장해 재사용 (값: 저장 순번, 크기)
+        members = load_index(path)
+        if members is None or any(len(entry) < 2 for entry in members.values()):  # 크기가 없는 예전 색인
+            members = {name: (i, size) for i, (name, size) in enumerate(self._list_members().items())}
+            save_index(path, members)
+        self._set_names(members)
+        self._sizes = {name: entry[1] for name, entry in members.items()}
+        self._done = {name: threading.Event() for name in self._names}
+        self._error = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._stream, daemon=True)
+        self._thread.start()
+
+    @abstractmethod
+    def _list_members(self):
+        """이미지 멤버 {이름: 압축 해제 후 크기} (저장 순서)"""
+        pass
+
+    @abstractmethod
+    def _extract_members(self):
+        """
+        아카이브를 처음부터 한 번만 순서대로 풀면서, 다 풀린 멤버마다 _store 또는 _publish를 호출합니다.
+        self._stop이 설정되면 가능한 빨리 멈춰야 합니다 (close()가 임시 폴더를 지우기 전에).
+        """
+        pass
+
+    def _store(self, name, data):
+        if name not in self._done:
+            return
+        target = self.target_path(name)
+        with open(target + ".part", "wb") as f:
+            f.write(data)
+        os.replace(target + ".part", target)
+        self._done[name].set()
+
+    def _publish(self, name, src):
+        """staging 폴더에 다 풀린 파일을 대상 경로로 옮기고 알림"""
+        if name in self._done and os.path.exists(src):
+            os.replace(src, self.target_path(name))
+            self._done[name].set()
+
+    def _stream(self):
+        try:
+            self._extract_members()
+        except Exception as e:
+            self._error = e
+        finally:
+            # 실패/중단 시 대기 중인 extract()가 영원히 멈추지 않도록 모두 깨움
+            for event in self._done.values():
+                event.set()
+
+    def size(self, name):
+        return self._sizes[name]
+
+    def ready(self, name):
+        return self._done[name].is_set()
+
+    def read(self, name):
+        with open(self.extract(name), "rb") as f:
+            return f.read()
+
+    def extract(self, name):
+        self._done[name].wait()
+        target = self.target_path(name)
+        if not os.path.exists(target):
+            raise RuntimeError(f"압축 해제 실패: {name} ({self._error})")
+        return target
+
+    def close(self):
+        self._stop.set()
+        # 해제 스레드는 _stop을 확인하고 멈추므로, 끝날 때까지 기다린 뒤 임시 폴더를 지움
+        self._thread.join()
+        super().close()
+
+
+class CompressedTarArchiveReader(SolidArchiveReader):
+    def _list_members(self):
+        with tarfile.open(self.path, "r:*") as tf:
+            return {m.name: m.size for m in tf.getmembers() if m.isfile() and is_image_file(m.name)}
+
+    def _extract_members(self):
+        with tarfile.open(self.path, "r|*") as tf:
+            for m in tf:
+                if self._stop.is_set():
+                    return
+                if m.isfile() and is_image_file(m.name):
+                    self._store(m.name, tf.extractfile(m).read())
+
+
+class SevenZipArchiveReader(SolidArchiveReader):
+    def _list_members(self):
+        import py7zr
+        with py7zr.SevenZipFile(self.path, "r") as zf:
+            return {f.filename: f.uncompressed for f in zf.list() if not f.is_directory and is_image_file(f.filename)}
+
+    def _extract_members(self):
+        # 전체를 메모리에 올리지 않도록 디스크로 순차 해제하면서, 파일이 끝날 때마다 알림을 받음
+        import py7zr
+        from py7zr.callbacks import ExtractCallback
+
+        reader = self
+        staging = os.path.join(self.temp_dir, "_staging")
+
+        class _Stopped(Exception):
+            pass
+
+        class _Callback(ExtractCallback):
+            def _check_stop(self):
+                # close()가 임시 폴더를 지우기 전에 해제를 중단
+                if reader._stop.is_set():
+                    raise _Stopped()
+
+            def report_start_preparation(self):
+                pass
+
+            def report_start(self, processing_file_path, processing_bytes):
+                self._check_stop()
+
+            def report_update(self, decompressed_bytes):
+                self._check_stop()
+
+            def report_end(self, processing_file_path, wrote_bytes):
+                path = str(processing_file_path)
+                name = os.path.relpath(path, staging) if os.path.isabs(path) else path
+                name = name.replace(os.sep, "/")
+                reader._publish(name, os.path.join(staging, name))
+                self._check_stop()
+
+            def report_postprocess(self):
+                pass
+
+            def report_warning(self, message):
+                pass
+
+        try:
+            with py7zr.SevenZipFile(self.path, "r") as zf:
+                zf.extractall(path=staging, callback=_Callback())
+        except _Stopped:
+            pass
+
+
+class RarArchiveReader(ArchiveReader):
+    def __init__(self, path):
+        import rarfile
+        super().__init__(path)
+        self._rar = rarfile.RarFile(path)
+        self._lock = threading.Lock()
+        self._set_names(n for n in self._rar.namelist() if is_image_file(n))
+
+    def size(self, name):
+        return self._rar.getinfo(name).file_size
+
+    def read(self, name):
+        with self._lock:
+            return self._rar.read(name)
+
+    def close(self):
+        self._rar.close()
+        super().close()
+
+
+class SolidRarArchiveReader(SolidArchiveReader):
+    def _list_members(self):
+        import rarfile
+        with rarfile.RarFile(self.path) as rf:
+            return {info.filename: info.file_size for info in rf.infolist() if is_image_file(info.filename)}
+
+    def _extract_members(self):
+        # 솔리드 RAR은 멤버마다 rf.read()를 부르면 매번 처음부터 다시 풀리므로 (책 한 권이 O(n²)),
+        # unrar 한 번으로 staging 폴더에 저장 순서대로 풀고, 다음 멤버 파일이 생기면 앞 멤버가 끝난 것으로 봄
+        import rarfile
+
+        with rarfile.RarFile(self.path) as rf:
+            order = [info.filename for info in rf.infolist() if not info.isdir()]
+        staging = os.path.join(self.temp_dir, "_staging")
+        os.makedirs(staging, exist_ok=True)
+        staged = lambda name: os.path.join(staging, *name.split("/"))
+
+        try:
+            proc = subprocess.Popen(
+                [rarfile.UNRAR_TOOL, "x", "-y", "-idq", self.path, staging + os.sep],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            # unrar가 없으면 rarfile이 고른 도구(unar / bsdtar)로 한 번에 전부 푼 뒤 알림
+            with rarfile.RarFile(self.path) as rf:
+                rf.extractall(staging)
+            for name in order:
+                self._publish(name, staged(name))
+            return
+        try:
+            pending = list(order)
+            while pending:
+                if self._stop.is_set():
+                    return
+                finished = proc.poll() is not None
+                while pending and (finished or len(pending) > 1 and os.path.exists(staged(pending[1]))):
+                    name = pending.pop(0)
+                    self._publish(name, staged(name))
+                if not finished:
+                    time.sleep(RAR_POLL_INTERVAL)
+            if proc.wait() != 0:
+                raise RuntimeError(f"unrar 종료 코드 {proc.returncode}")
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+
+
+def _is_compressed(path):
+    # gzip / bzip2 / xz 매직 바이트
+    with open(path, "rb") as f:
+        head = f.read(6)
+    return head.startswith((b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00"))
+
+
+def open_archive(path):
+    """확장자(와 솔리드 여부)에 맞는 ArchiveReader를 반환합니다."""
+    lower = path.lower()
+    if lower.endswith((".zip", ".cbz")):
+        return ZipArchiveReader(path)
+    if lower.endswith((".tar", ".cbt")):
+        # .cbt도 가끔 압축 tar인 경우가 있음
+        return CompressedTarArchiveReader(path) if _is_compressed(path) else TarArchiveReader(path)
+    if lower.endswith((".tgz", ".tar.gz", ".tar.bz2", ".tar.xz")):
+        return CompressedTarArchiveReader(path)
+    if lower.endswith((".7z", ".cb7")):
+        return SevenZipArchiveReader(path)
+    if lower.endswith((".rar", ".cbr")):
+        import rarfile
+        with rarfile.RarFile(path) as rf:
+            solid = rf.is_solid()
+        return SolidRarArchiveReader(path) if solid else RarArchiveReader(path)
+    raise ValueError(f"지원하지 않는 압축 형식: {os.path.splitext(path)[1]}")
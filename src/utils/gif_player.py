@@ -1,5 +1,7 @@
 import logging
+import threading
 
+import numpy as np
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QLabel, QMessageBox
@@ -9,39 +11,68 @@ try:
 except ImportError:
     iio = None
 
+REFILL_AHEAD = 8      # 회수된 프레임을 재생 위치부터 미리 채워 둘 프레임 수
+REFILL_RETRY_MS = 15  # 다음 프레임이 아직 채워지지 않았을 때 다시 확인할 간격
+
 
 class GifPlayer:
     def __init__(self, label: QLabel, scale_factor=1.0, fit_to_window=True):
         self.label = label
         self.scale_factor = scale_factor
         self.fit_to_window = fit_to_window
-        self.frames = []
+        self.path = None
+        self.frames = []  # 메모리 회수 후에는 None 항목이 섞일 수 있음 (백그라운드에서 다시 디코딩)
         self.durations = []
         self.index = 0
+        # 회수된 프레임을 다시 채우는 순차 디코더 (재생 순서대로 앞으로만 seek하므로 프레임당 한 번 디코딩)
+        self._seq = None
+        self._seq_lock = threading.Lock()
+        self._generation = 0
+        self._refill = None
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
 
     def load(self, path):
         if iio is None:
-            QMessageBox.warning(None, "라이브러리 누락", "GIF 재생을 위해 imageio가 필요합니다.")
+            QMessageBox.warning(None, "라이브러리 누락", "애니메이션 재생을 위해 imageio가 필요합니다.")
             return False
 
-        self.frames.clear()
-        self.durations.clear()
-        self.index = 0
+        with self._seq_lock:
+            self._generation += 1  # 이전 파일의 채우기 중단
+            self._close_seq()
+            self.frames.clear()
+            self.durations.clear()
+            self.index = 0
+            self.path = path
 
         try:
-            for frame in iio.imiter(path, plugin="pillow", mode="RGB"):
-                self.frames.append(frame)
-            meta = iio.immeta(path, plugin="pillow")
-            duration = meta.get("duration", 100)
-            self.durations = [duration for _ in self.frames]
+            # GIF / 애니메이션 WebP / APNG / AVIF 시퀀스 모두 Pillow 플러그인으로 (프레임마다 표시 시간이 다를 수 있음)
+            with iio.imopen(path, "r", plugin="pillow") as image:
+                for i, frame in enumerate(image.iter(mode="RGB")):
+                    self.frames.append(frame)
+                    duration = image.metadata(index=i).get("duration") or 100
+                    self.durations.append(int(duration))
         except Exception as e:
-            logging.error(f"[GIF 오류] {e}")
+            logging.error(f"[애니메이션 오류] {e}")
             return False
 
         return True
 
+    def nbytes(self):
+        return sum(f.nbytes for f in self.frames if f is not None)
+
+    def evict(self, bytes_needed):
+        """현재 프레임을 제외한 디코딩된 프레임을 해제합니다."""
+        freed = 0
+        current = (self.index - 1) % len(self.frames) if self.frames else -1
+        for i, frame in enumerate(self.frames):
+            if freed >= bytes_needed:
+                break
+            if frame is not None and i != current:
+                freed += frame.nbytes
+                self.frames[i] = None
+        return freed
+
     def start(self):
         if not self.frames:
             return
@@ -50,11 +81,53 @@ class GifPlayer:
     def stop(self):
         self.timer.stop()
 
+    def _close_seq(self):
+        if self._seq is not None:
+            self._seq.close()
+            self._seq = None
+
+    def _missing_ahead(self):
+        """재생 위치부터 REFILL_AHEAD개 중 회수된 프레임 (재생 순서)"""
+        n = len(self.frames)
+        ahead = ((self.index + k) % n for k in range(min(REFILL_AHEAD, n)))
+        return [i for i in ahead if self.frames[i] is None]
+
+    def _ensure_refill(self):
+        if self._refill is None or not self._refill.is_alive():
+            self._refill = threading.Thread(
+                target=self._refill_frames, args=(self._generation, self.path), daemon=True
+            )
+            self._refill.start()
+
+    def _refill_frames(self, generation, path):
+        """재생 위치부터 REFILL_AHEAD개 안의 회수된 프레임을 순서대로 다시 디코딩 (GUI 스레드 밖)"""
+        from PIL import Image
+
+        try:
+            while True:
+                with self._seq_lock:
+                    if generation != self._generation or not self.frames:
+                        return
+                    missing = self._missing_ahead()
+                    if not missing:
+                        return
+                    if self._seq is None:
+                        self._seq = Image.open(path)
+                    self._seq.seek(missing[0])
+                    self.frames[missing[0]] = np.asarray(self._seq.convert("RGB"))
+        except Exception as e:
+            logging.error(f"[애니메이션 오류] 프레임 다시 디코딩 실패: {e}")
+
     def update_frame(self):
         if not self.frames:
             return
 
         frame = self.frames[self.index]
+        if frame is None:
+            # 회수된 프레임: GUI 스레드에서 디코딩하지 않고, 채워질 때까지 현재 화면 유지
+            self._ensure_refill()
+            self.timer.start(REFILL_RETRY_MS)
+            return
         h, w, ch = frame.shape
         bytes_per_line = ch * w
         qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
@@ -69,3 +142,6 @@ class GifPlayer:
 
         self.index = (self.index + 1) % len(self.frames)
         self.timer.start(self.durations[self.index])
+        # 다음 프레임들이 회수돼 있으면 표시 시각 전에 미리 채움
+        if self._missing_ahead():
+            self._ensure_refill()
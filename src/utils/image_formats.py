@@ -0,0 +1,115 @@
+"""
+지원 이미지 형식 표 + 매직 바이트 판별.
+
+폴더/압축 파일 목록은 확장자(IMAGE_EXTENSIONS)로 빠르게 거르고,
+디코더 선택(core.decoders)과 애니메이션 판별은 확장자 대신 파일 앞부분의 매직 바이트로 합니다.
+(확장자가 틀린 파일, 확장자가 같아도 정지/애니메이션이 갈리는 WebP/PNG/AVIF)
+"""
+import os
+from typing import NamedTuple
+
+SNIFF_BYTES = 64  # 형식 판별에 읽는 앞부분 크기
+
+
+class ImageFormat(NamedTuple):
+    name: str
+    extensions: tuple
+    animated: bool = False     # 애니메이션을 담을 수 있는 형식
+    fast_reduce: bool = False  # 디코딩 단계에서 축소 (전체를 풀지 않으므로 축소 미리보기가 빠름)
+
+
+FORMATS = {f.name: f for f in (
+    ImageFormat("jpeg", (".jpg", ".jpeg", ".jfif"), fast_reduce=True),  # DCT 축소
+    ImageFormat("png", (".png", ".apng"), animated=True),
+    ImageFormat("gif", (".gif",), animated=True),
+    ImageFormat("webp", (".webp",), animated=True),
+    ImageFormat("avif", (".avif",), animated=True),
+    ImageFormat("bmp", (".bmp",)),
+    ImageFormat("tiff", (".tif", ".tiff")),
+)}
+IMAGE_EXTENSIONS = tuple(ext for f in FORMATS.values() for ext in f.extensions)
+_BY_EXTENSION = {ext: f.name for f in FORMATS.values() for ext in f.extensions}
+
+
+def format_from_extension(path):
+    return _BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+
+
+def _ftyp_brands(head):
+    """ISO BMFF ftyp 상자의 major + compatible brand 목록"""
+    size = int.from_bytes(head[:4], "big")
+    box = head[8:min(size, len(head))]
+    return {box[:4]} | {box[i:i + 4] for i in range(8, len(box) - 3, 4)}
+
+
+def sniff(head):
+    """
+    파일 앞부분 바이트로 형식 이름을 판별합니다 (모르는 형식이면 None).
+
+    Args:
+        head (bytes): 파일 앞 SNIFF_BYTES 바이트 (더 짧아도 됨)
+    """
+    head = bytes(head[:SNIFF_BYTES])
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    if head[4:8] == b"ftyp" and _ftyp_brands(head) & {b"avif", b"avis"}:
+        return "avif"
+    if head.startswith(b"BM"):
+        return "bmp"
+    if head.startswith((b"II*\x00", b"MM\x00*")):
+        return "tiff"
+    return None
+
+
+def detect_format(path):
+    """매직 바이트로 판별한 형식 (읽을 수 없거나 모르는 형식이면 확장자로 추정)"""
+    try:
+        with open(path, "rb") as f:
+            fmt = sniff(f.read(SNIFF_BYTES))
+    except OSError:
+        fmt = None
+    return fmt or format_from_extension(path)
+
+
+def _png_has_actl(f):
+    """APNG: 첫 IDAT 앞에 acTL 청크가 있음 (청크 머리만 건너뛰며 확인)"""
+    f.seek(8)
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return False
+        kind = header[4:8]
+        if kind == b"acTL":
+            return True
+        if kind in (b"IDAT", b"IEND"):
+            return False
+        f.seek(int.from_bytes(header[:4], "big") + 4, os.SEEK_CUR)
+
+
+def is_animated(path):
+    """
+    애니메이션 엔진으로 재생할 페이지인지 (헤더만 읽음).
+    파일이 아직 없으면 (풀리지 않은 압축 내부 페이지) 확장자로 추정합니다.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(SNIFF_BYTES)
+            fmt = sniff(head)
+            if fmt == "gif":
+                return True  # 프레임 수를 세려면 전체를 읽어야 하므로 GIF는 모두 애니메이션 엔진으로
+            if fmt == "webp":
+                # VP8X 확장 머리의 애니메이션 플래그
+                return head[12:16] == b"VP8X" and len(head) > 20 and bool(head[20] & 0x02)
+            if fmt == "avif":
+                return b"avis" in _ftyp_brands(head)  # 이미지 시퀀스
+            if fmt == "png":
+                return _png_has_actl(f)
+            return False
+    except OSError:
+        return format_from_extension(path) == "gif"
@@ -1,8 +1,11 @@
 import os
+import re
+import shutil
 import hashlib
-import zipfile
 import tempfile
 
+from utils.image_formats import IMAGE_EXTENSIONS
+
 CACHE_DIR = "src/cache"
 
 def get_cache_path(img_path):
@@ -10,41 +13,54 @@ def get_cache_path(img_path):
     return os.path.join(CACHE_DIR, f"{hashed}.png")
 
 def is_image_file(filename):
-    return filename.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))
+    return filename.lower().endswith(IMAGE_EXTENSIONS)
+
+def natural_sort_key(name):
+    """
+    "page2"가 "page10"보다 앞에 오도록 숫자 부분을 0으로 채운 정렬 키.
+    문자열이므로 카탈로그 DB 색인에도 그대로 사용합니다.
+    """
+    return re.sub(r"\d+", lambda m: m.group().zfill(20), name.casefold())
+
+def list_image_files(folder):
+    """폴더 안 이미지 파일의 전체 경로 목록 (뷰어 페이지 목록, 썸네일, 중복 검색이 같은 순서를 사용)"""
+    names = sorted((f for f in os.listdir(folder) if is_image_file(f)), key=natural_sort_key)
+    return [os.path.join(folder, f) for f in names]
 
 def extract_archive(archive_path, image_extensions=None):
     """
-    압축 파일을 임시 디렉토리에 해제하고, 이미지 파일 경로 리스트 반환
+    압축 파일을 새 임시 디렉토리에 해제하고, 이미지 파일 경로 리스트 반환
+    (임시 디렉토리는 호출한 쪽이 정리)
 
     Args:
-        archive_path (str): ZIP 또는 CBZ 파일 경로
+        archive_path (str): 압축 파일 경로 (zip/cbz, tar/cbt, 7z/cb7, rar/cbr)
         image_extensions (set[str], optional): 허용할 이미지 확장자 (예: {'.png', '.jpg'})
 
     Returns:
         list[str]: 이미지 파일 경로 리스트
     """
-    if image_extensions is None:
-        image_extensions = {".png", ".jpg", ".jpeg", ".bmp", ".gif"}
-
-    ext = os.path.splitext(archive_path)[1].lower()
-    temp_dir = tempfile.mkdtemp(prefix="viewer_extract_")
-
-    if ext not in [".zip", ".cbz"]:
-        raise ValueError(f"지원하지 않는 압축 형식: {ext}")
+    # archive_reader가 이 모듈을 import하므로 순환 import를 피하기 위해 지연 import
+    from utils.archive_reader import open_archive
 
+    reader = open_archive(archive_path)
     try:
-        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+        names = [
+            n for n in reader.names()
+            if image_extensions is None or os.path.splitext(n)[1].lower() in image_extensions
+        ]
+        # 리더의 임시 폴더는 close()에서 지워지므로 결과는 별도 폴더로 옮김
+        out_dir = tempfile.mkdtemp(prefix="viewer_archive_")
+        paths = []
+        for n in names:
+            src = reader.extract(n)
+            dst = os.path.join(out_dir, os.path.basename(src))
+            shutil.move(src, dst)
+            paths.append(dst)
+        return paths
     except Exception as e:
         raise RuntimeError(f"압축 해제 실패: {e}")
-
-    image_list = sorted([
-        os.path.join(temp_dir, f)
-        for f in os.listdir(temp_dir)
-        if os.path.splitext(f)[1].lower() in image_extensions
-    ])
-
-    return image_list
+    finally:
+        reader.close()
 
 def get_file_extension(path):
     return os.path.splitext(path)[1].lower()
\ No newline at end of file
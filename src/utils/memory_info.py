@@ -0,0 +1,40 @@
+"""시스템/프로세스 메모리 조회 (Linux는 /proc, 그 외에는 psutil)"""
+
+
+def read_meminfo():
+    """/proc/meminfo 값을 byte 단위 dict로 반환합니다 (Linux 외에는 psutil 사용)."""
+    try:
+        info = {}
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                info[key] = int(value.split()[0]) * 1024
+        return info
+    except OSError:
+        pass
+
+    try:
+        import psutil
+        vm = psutil.virtual_memory()
+        return {"MemTotal": vm.total, "MemAvailable": vm.available}
+    except ImportError:
+        return {}
+
+
+def available_memory_bytes(default=2 * 1024 ** 3):
+    return read_meminfo().get("MemAvailable", default)
+
+
+def process_rss_bytes():
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return 0
@@ -0,0 +1,130 @@
+"""
+가벼운 성능 계측 도구.
+
+    from utils.perf_trace import tracer
+
+    with tracer.span("decode"):
+        img = decode_rgb(path)
+    tracer.count("pixmap_cache", hit=True)
+
+비활성 상태에서는 span()이 공유된 빈 컨텍스트를 돌려주므로 비용이 거의 없습니다.
+활성화하면 구간을 메모리에 기록하고 Chrome trace(Perfetto) JSON으로 내보낼 수 있습니다.
+"""
+import os
+import json
+import time
+import threading
+from collections import deque, defaultdict
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+class Tracer:
+    def __init__(self, max_events=200_000):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self.counters = defaultdict(lambda: [0, 0])  # name -> [hit, miss]
+        self.last_durations = {}  # name -> 마지막 소요 시간(ms), 오버레이 표시용
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def count(self, name, hit):
+        if not self.enabled:
+            return
+        self.counters[name][0 if hit else 1] += 1
+
+    def hit_rate(self, name):
+        hit, miss = self.counters.get(name, (0, 0))
+        total = hit + miss
+        return hit / total if total else 0.0
+
+    def _record(self, name, start_ns, dur_ns, args):
+        event = (name, start_ns - self._origin, dur_ns, os.getpid(), threading.get_ident(), args)
+        with self._lock:
+            self.events.append(event)
+        self.last_durations[name] = dur_ns / 1e6
+
+    def drain(self):
+        """
+        기록된 구간을 꺼내고 비웁니다 (워커 프로세스 -> 부모 전달용).
+        시작 시각은 이 프로세스의 기준점이 아닌 perf_counter_ns 값 그대로입니다.
+        """
+        with self._lock:
+            events = [(name, start + self._origin, dur, pid, tid, args) for name, start, dur, pid, tid, args in self.events]
+            self.events.clear()
+        return events
+
+    def merge(self, events):
+        """다른 프로세스에서 drain()한 구간을 기록합니다 (perf_counter는 시스템 단조 시계라 프로세스 간 비교 가능)."""
+        if not self.enabled or not events:
+            return
+        with self._lock:
+            for name, start_ns, dur_ns, pid, tid, args in events:
+                self.events.append((name, start_ns - self._origin, dur_ns, pid, tid, args))
+        for name, _, dur_ns, _, _, _ in events:
+            self.last_durations[name] = dur_ns / 1e6
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+        self.counters.clear()
+        self.last_durations.clear()
+
+    def export_chrome_trace(self, path):
+        """chrome://tracing 또는 ui.perfetto.dev 에서 열 수 있는 JSON으로 저장합니다."""
+        with self._lock:
+            events = list(self.events)
+
+        trace = [
+            {
+                "name": name, "ph": "X", "ts": start / 1000, "dur": dur / 1000,
+                "pid": pid, "tid": tid, "args": args,
+            }
+            for name, start, dur, pid, tid, args in events
+        ]
+        for name, (hit, miss) in self.counters.items():
+            trace.append({"name": name, "ph": "C", "ts": 0, "pid": os.getpid(), "args": {"hit": hit, "miss": miss}})
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+tracer = Tracer()
@@ -1,6 +1,7 @@
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QImage
 from PySide6.QtCore import Qt
 from collections import OrderedDict
+from utils.perf_trace import tracer
 
 class QPixmapLRUCache:
     def __init__(self, max_size=100, thumb_size=(100, 100)):
@@ -9,6 +10,7 @@ class QPixmapLRUCache:
         self.cache = OrderedDict()
 
     def get(self, image_path: str) -> QPixmap:
+        tracer.count("pixmap_cache", hit=image_path in self.cache)
         if image_path in self.cache:
             # 최근 사용으로 갱신
             self.cache.move_to_end(image_path)
@@ -30,6 +32,45 @@ class QPixmapLRUCache:
             self.cache.popitem(last=False)  # 가장 오래된 항목 제거
 
         return pixmap
-    
+
+    def peek(self, image_path: str):
+        """캐시에 있으면 QPixmap, 없으면 None (디코딩하지 않음)"""
+        pixmap = self.cache.get(image_path)
+        tracer.count("pixmap_cache", hit=pixmap is not None)
+        if pixmap is not None:
+            self.cache.move_to_end(image_path)
+        return pixmap
+
+    def put(self, image_path: str, img):
+        """워커에서 축소 디코딩한 RGB ndarray를 QPixmap으로 바꿔 넣습니다."""
+        h, w, ch = img.shape
+        qimg = QImage(img.data, w, h, ch * w, QImage.Format_RGB888)
+        self.cache[image_path] = QPixmap.fromImage(qimg)
+        self.cache.move_to_end(image_path)
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+        return self.cache[image_path]
+
+    def warm(self, image_paths, decode_service):
+        """
+        디코드 서비스의 워커 프로세스에서 썸네일을 병렬로 축소 디코딩해 캐시를 미리 채웁니다.
+        (QPixmap 변환만 GUI 스레드에서 수행)
+        """
+        todo = [p for p in image_paths[:self.max_size] if p not in self.cache]
+        for path, img in zip(todo, decode_service.map(todo, max_side=max(self.thumb_size))):
+            if img is not None:
+                self.put(path, img)
+
+    def nbytes(self):
+        return sum(p.width() * p.height() * p.depth() // 8 for p in self.cache.values())
+
+    def evict(self, bytes_needed):
+        """오래된 항목부터 bytes_needed만큼 제거하고 해제한 크기를 반환합니다."""
+        freed = 0
+        while self.cache and freed < bytes_needed:
+            _, pixmap = self.cache.popitem(last=False)
+            freed += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        return freed
+
     def clear(self):
         self.cache.clear()
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+단일 인스턴스 실행.
+
+이미 실행 중인 뷰어가 있으면 새로 실행된 프로세스는 Qt 초기화/모델 로드 없이
+로컬 소켓으로 열 경로만 넘기고 바로 종료합니다.
+
+    if send_to_running(paths):
+        sys.exit(0)
+    server = InstanceServer()
+    server.filesReceived.connect(viewer.open_files)
+    server.listen()
+
+메시지는 한 줄짜리 JSON ({"paths": [...]}) 입니다. 실행 위치가 서로 다르므로 경로는 절대 경로로 보냅니다.
+"""
+import os
+import json
+import logging
+import getpass
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+
+def server_name():
+    """사용자별 소켓 이름 (다른 사용자의 뷰어로 파일이 넘어가지 않도록)"""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return f"ai-image-viewer-{user}"
+
+
+def encode_message(paths):
+    return (json.dumps({"paths": [os.path.abspath(p) for p in paths]}, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def decode_message(data):
+    """잘못된 메시지는 빈 목록"""
+    try:
+        paths = json.loads(bytes(data).decode("utf-8")).get("paths", [])
+    except (ValueError, AttributeError):
+        return []
+    return [p for p in paths if isinstance(p, str)]
+
+
+def send_to_running(paths, timeout_ms=500, name=None):
+    """
+    실행 중인 인스턴스에 경로를 넘깁니다.
+
+    Returns:
+        bool: 넘겼으면 True (실행 중인 인스턴스가 없거나 응답이 없으면 False)
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write(encode_message(paths))
+    sent = socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(timeout_ms)
+    return sent
+
+
+class InstanceServer(QObject):
+    """새로 실행된 프로세스가 넘긴 경로를 받아 filesReceived(list[str])로 알립니다."""
+    filesReceived = Signal(list)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+        self.buffers = {}  # socket -> 받은 바이트
+
+    def listen(self):
+        if self.server.listen(self.name):
+            return True
+        # 비정상 종료로 남은 소켓 파일이면 지우고 다시 시도
+        QLocalServer.removeServer(self.name)
+        if self.server.listen(self.name):
+            return True
+        logging.error(f"[단일 인스턴스] 서버 시작 실패: {self.server.errorString()}")
+        return False
+
+    def close(self):
+        self.server.close()
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self.buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self.on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self.on_disconnected(s))
+
+    def on_ready_read(self, socket):
+        if socket not in self.buffers:
+            return
+        self.buffers[socket] += bytes(socket.readAll())
+        if b"\n" in self.buffers[socket]:
+            message = self.buffers.pop(socket).split(b"\n", 1)[0]
+            socket.disconnectFromServer()
+            self.filesReceived.emit(decode_message(message))
+
+    def on_disconnected(self, socket):
+        # 줄바꿈 전에 끊긴 메시지도 처리
+        data = self.buffers.pop(socket, b"") + bytes(socket.readAll())
+        if data.strip():
+            self.filesReceived.emit(decode_message(data))
+        socket.deleteLater()
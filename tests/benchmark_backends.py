@@ -0,0 +1,124 @@
+"""
+CPU 추론 백엔드별 정확도/속도 비교 리포트를 만드는 스크립트입니다.
+fp32 결과를 기준으로 각 백엔드의 PSNR, 최대 오차, 처리 속도(MP/s)를 측정합니다.
+
+python tests/benchmark_backends.py --model src/models/RealESRNet_x4plus.pth --backends fp32 torchscript int8 onnx
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from config.settings_loader import AppSettings
+from plugins.plugin_loader import create_upscaler
+from plugins.inference_backends import BACKENDS
+
+
+def psnr(a, b):
+    mse = np.mean((a.astype(np.float64) - b.astype(np.float64)) ** 2)
+    return float("inf") if mse == 0 else 10 * np.log10(255.0 ** 2 / mse)
+
+
+def load_images(asset_dir, max_side):
+    images = {}
+    for name in sorted(os.listdir(asset_dir)):
+        if not name.lower().endswith((".jpg", ".jpeg", ".png")):
+            continue
+        img = cv2.cvtColor(cv2.imread(os.path.join(asset_dir, name)), cv2.COLOR_BGR2RGB)
+        ratio = max_side / max(img.shape[:2])
+        if ratio < 1.0:
+            img = cv2.resize(img, (int(img.shape[1] * ratio), int(img.shape[0] * ratio)), interpolation=cv2.INTER_AREA)
+        images[name] = img
+    return images
+
+
+def run_backend(backend, args, images):
+    # 백엔드끼리 같은 타일 설정으로 비교하도록 자동 타일 계획은 끔 (켜면 tile/tile_pad가 무시됨)
+    settings = AppSettings(
+        model_path=args.model, tile=args.tile, tile_pad=args.tile_pad, auto_tile=False,
+        inference_backends={"real-esrgan": backend}, inference_threads=args.threads,
+    )
+    t0 = time.perf_counter()
+    upscaler = create_upscaler("real-esrgan", settings)
+    load_time = time.perf_counter() - t0
+
+    # 첫 호출 비용(compile/ONNX 초기화)은 측정에서 제외
+    first = next(iter(images.values()))
+    upscaler.upscale(first)
+
+    outputs, elapsed, megapixels = {}, 0.0, 0.0
+    for name, img in images.items():
+        t0 = time.perf_counter()
+        outputs[name] = np.ascontiguousarray(upscaler.upscale(img))
+        elapsed += time.perf_counter() - t0
+        megapixels += img.shape[0] * img.shape[1] / 1e6
+
+    return load_time, elapsed, megapixels, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', type=str, default='src/models/RealESRNet_x4plus.pth', help='모델 파일 경로')
+    parser.add_argument('--assets', type=str, default=os.path.join(ROOT, 'tests', 'test_asset'), help='입력 이미지 폴더')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), help='비교할 백엔드 목록')
+    parser.add_argument('--max_side', type=int, default=256, help='입력 이미지 긴 변 크기')
+    parser.add_argument('--tile', type=int, default=128, help='타일 크기')
+    parser.add_argument('--tile_pad', type=int, default=4, help='타일 패딩')
+    parser.add_argument('--threads', type=int, default=0, help='추론 스레드 수 (0이면 기본값)')
+    parser.add_argument('--output', type=str, default=os.path.join(ROOT, 'tests', 'output', 'backend_report.json'))
+    args = parser.parse_args()
+
+    images = load_images(args.assets, args.max_side)
+    if not images:
+        print(f"[!] 입력 이미지가 없습니다: {args.assets}")
+        sys.exit(1)
+
+    backends = ["fp32"] + [b for b in args.backends if b != "fp32"]
+    reference = None
+    report = []
+
+    for backend in backends:
+        print(f"[→] 백엔드 측정 중: {backend}")
+        try:
+            load_time, elapsed, megapixels, outputs = run_backend(backend, args, images)
+        except Exception as e:
+            print(f"[!] {backend} 실패: {e}\n")
+            continue
+
+        if reference is None:
+            reference = outputs
+            base_time = elapsed
+
+        scores = [psnr(reference[n], outputs[n]) for n in outputs]
+        max_err = max(int(np.abs(reference[n].astype(np.int16) - outputs[n].astype(np.int16)).max()) for n in outputs)
+        report.append({
+            "backend": backend,
+            "load_sec": round(load_time, 3),
+            "infer_sec": round(elapsed, 3),
+            "mp_per_sec": round(megapixels / elapsed, 4),
+            "speedup": round(base_time / elapsed, 2),
+            "psnr_db": round(min(scores), 2),
+            "max_abs_err": max_err,
+        })
+
+    print(f"{'backend':<12}{'load(s)':>9}{'infer(s)':>10}{'MP/s':>9}{'speedup':>9}{'PSNR(dB)':>10}{'maxerr':>8}")
+    for r in report:
+        print(f"{r['backend']:<12}{r['load_sec']:>9}{r['infer_sec']:>10}{r['mp_per_sec']:>9}"
+              f"{r['speedup']:>9}{r['psnr_db']:>10}{r['max_abs_err']:>8}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"settings": vars(args), "results": report}, f, indent=4, ensure_ascii=False)
+    print(f"[✓] 리포트 저장 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
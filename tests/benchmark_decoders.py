@@ -0,0 +1,93 @@
+"""
+형식/디코더별 디코딩 속도 벤치마크.
+
+같은 페이지를 형식마다 인코딩한 뒤, core.decoders에 등록된 디코더 각각으로
+전체/축소(1/2, 1/4, 1/8) 디코딩 시간을 잽니다. DECODERS의 형식별 순서(빠른 순)를 정할 때 사용합니다.
+
+python tests/benchmark_decoders.py --page_size 1600 2400 --repeat 5 --output tests/output/bench_decoders.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import cv2
+import numpy as np
+
+
+def make_page(size):
+    """사진과 선화가 섞인 만화 페이지 비슷한 이미지 (무작위 노이즈보다 실제 압축률에 가까움)"""
+    w, h = size
+    rng = np.random.default_rng(0)
+    small = rng.integers(0, 255, (h // 16, w // 16, 3), dtype=np.uint8)
+    img = cv2.GaussianBlur(cv2.resize(small, (w, h), interpolation=cv2.INTER_CUBIC), (0, 0), 3)
+    for y in range(0, h, max(1, h // 40)):
+        cv2.line(img, (0, y), (w, (y * 7) % h), (0, 0, 0), 2)
+    return img
+
+
+def encode(img, fmt):
+    if fmt == "gif":
+        from PIL import Image
+        buf = io.BytesIO()
+        Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB)).save(buf, "GIF")
+        return buf.getvalue()
+    ext = {"jpeg": ".jpg", "tiff": ".tiff"}.get(fmt, f".{fmt}")
+    ok, buf = cv2.imencode(ext, img)
+    if not ok:
+        raise ValueError(f"{fmt} 인코딩 불가")
+    return buf.tobytes()
+
+
+def time_decode(decode, data, reduce, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        img = decode(data, reduce)
+        times.append(time.perf_counter() - start)
+        if img is None:
+            return None
+    return round(sorted(times)[len(times) // 2] * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--page_size', nargs=2, type=int, default=[1600, 2400], metavar=('W', 'H'))
+    parser.add_argument('--formats', nargs='+', default=None, help='기본: 등록된 모든 형식')
+    parser.add_argument('--reduce', nargs='+', type=int, default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=str, default=None)
+    args = parser.parse_args()
+
+    from core.decoders import DECODERS
+
+    img = make_page(args.page_size)
+    results = {}
+    header = "".join(f"{'1/' + str(r):>10}" for r in args.reduce)
+    print(f"{'format':<6} {'decoder':<8} {'KB':>7}{header}   (ms, median)")
+    for fmt in args.formats or list(DECODERS):
+        try:
+            data = np.frombuffer(encode(img, fmt), np.uint8)
+        except Exception as e:
+            print(f"{fmt:<6} 건너뜀: {e}")
+            continue
+        for decoder in DECODERS[fmt]:
+            row = {r: time_decode(decoder.decode, data, r, args.repeat) for r in args.reduce}
+            results.setdefault(fmt, {})[decoder.name] = {"kb": round(len(data) / 1024, 1), "ms": row}
+            cells = "".join(f"{('-' if v is None else v):>10}" for v in row.values())
+            print(f"{fmt:<6} {decoder.name:<8} {len(data) / 1024:>7.0f}{cells}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+느린 저장소에서의 페이지 넘김 처리량 벤치마크.
+
+LatencyOpener로 open/read마다 왕복 지연을 넣은 상태에서, 한 장씩 읽고 디코딩하는 방식(요청 시 읽기)과
+ReadAheadReader로 다음 페이지를 미리 읽는 방식의 페이지당 대기 시간을 로컬 디스크와 비교합니다.
+
+python tests/benchmark_io.py --pages 40 --latency 0.02 --output tests/output/bench_io.json
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import cv2
+import numpy as np
+
+
+def make_pages(workdir, count, size):
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(count):
+        path = os.path.join(workdir, f"page_{i:04d}.jpg")
+        if not os.path.exists(path):
+            small = rng.integers(0, 255, (size[1] // 8, size[0] // 8, 3), dtype=np.uint8)
+            cv2.imwrite(path, cv2.resize(small, tuple(size)), [cv2.IMWRITE_JPEG_QUALITY, 90])
+        paths.append(path)
+    return paths
+
+
+def read_through(opener, path):
+    with opener(path, "rb") as f:
+        return f.read()
+
+
+def run_on_demand(paths, opener, read_time):
+    """페이지마다 읽기가 끝날 때까지 기다린 뒤 디코딩 (기존 방식)"""
+    waits = []
+    for path in paths:
+        start = time.perf_counter()
+        data = read_through(opener, path)
+        cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        waits.append(time.perf_counter() - start)
+        time.sleep(read_time)  # 읽는 시간 (다음 페이지로 넘기기 전)
+    return waits
+
+
+def run_read_ahead(paths, opener, read_time, workers, ahead):
+    from core.io_service import ReadAheadReader
+    reader = ReadAheadReader(workers=workers, opener=opener)
+    waits = []
+    try:
+        for i, path in enumerate(paths):
+            start = time.perf_counter()
+            reader.read_ahead(paths[i + 1:i + 1 + ahead])
+            buf = reader.read(path).result()
+            data = np.ndarray((len(buf),), np.uint8, buffer=buf.shm.buf)
+            cv2.imdecode(data, cv2.IMREAD_COLOR)
+            del data
+            waits.append(time.perf_counter() - start)
+            time.sleep(read_time)
+    finally:
+        reader.shutdown()
+    return waits
+
+
+def summary(waits):
+    waits = sorted(waits)
+    return {
+        "mean_ms": round(sum(waits) / len(waits) * 1000, 2),
+        "p95_ms": round(waits[int(0.95 * (len(waits) - 1))] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--page_size', nargs=2, type=int, default=[1600, 2400], metavar=('W', 'H'))
+    parser.add_argument('--latency', type=float, default=0.02, help='open/read 호출당 왕복 지연 (초)')
+    parser.add_argument('--bandwidth_mb', type=float, default=50.0, help='전송 속도 (MB/s, 0이면 무제한)')
+    parser.add_argument('--read_time', type=float, default=0.05, help='페이지당 읽는 시간 (초)')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--ahead', type=int, default=8)
+    parser.add_argument('--workdir', type=str, default=None)
+    parser.add_argument('--output', type=str, default=None)
+    args = parser.parse_args()
+
+    from core.io_service import LatencyOpener
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_io_")
+    os.makedirs(workdir, exist_ok=True)
+    paths = make_pages(workdir, args.pages, args.page_size)
+    slow = LatencyOpener(args.latency, args.bandwidth_mb * 1024 ** 2 if args.bandwidth_mb else None)
+
+    results = {
+        "local_on_demand": summary(run_on_demand(paths, open, args.read_time)),
+        "slow_on_demand": summary(run_on_demand(paths, slow, args.read_time)),
+        "slow_read_ahead": summary(run_read_ahead(paths, slow, args.read_time, args.workers, args.ahead)),
+    }
+    for name, result in results.items():
+        print(f"{name:<18} mean {result['mean_ms']:8.2f} ms   p95 {result['p95_ms']:8.2f} ms")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
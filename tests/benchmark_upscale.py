@@ -1,53 +1,235 @@
 """
-모델을 반복적으로 적용하여 성능을 비교하는 스크립트입니다.
-다만 테스트용이라 현재 RRDBNet 모델만 사용하고 있습니다.
-추후 다른 모델도 추가할 예정입니다.
+업스케일 플러그인 벤치마크 스크립트입니다.
+플러그인 레지스트리의 업스케일러를 tile, tile_pad, 자동 타일 계획, 스레드 수, 추론 백엔드, 이미지 크기별로
+조합해 측정하고, 결과를 JSON으로 저장합니다. 이전 결과와 비교해 성능 저하도 확인할 수 있습니다.
+
+측정 항목
+    wall_sec    : 이미지 전체 처리 시간 (반복 평균 아님, 합계)
+    mp_per_sec  : 입력 메가픽셀 / 초
+    peak_rss_mb : 케이스별 최대 메모리 (케이스마다 새 프로세스에서 실행)
+    tile_ms     : 모델 호출(타일) 1회당 지연 시간 백분위수
+
+python tests/benchmark_upscale.py --plugins real-esrgan lanczos --tiles 0 128 256 --threads 1 4 \
+    --backends fp32 torchscript --sizes 256 512 --auto_tile 0 1 --output tests/output/bench_upscale.json
+python tests/benchmark_upscale.py ... --compare tests/output/bench_upscale_old.json
+
+--auto_tile 1 케이스는 자동 타일 계획이 tile/tile_pad를 정하므로 tile 조합 없이 한 번만 측정합니다.
 """
 
 import os
-import cv2
-from basicsr.archs.rrdbnet_arch import RRDBNet
-from realesrgan import RealESRGANer
-
-# 경로 설정
-input_path = './CLI_test/test_asset/cross.jpg'
-model_dir = './CLI_test/weights'
-output_dir = './CLI_test/benchmark_output'
-os.makedirs(output_dir, exist_ok=True)
-
-# 입력 이미지 확인
-if not os.path.exists(input_path):
-    print(f"[!] 입력 이미지가 존재하지 않습니다: {input_path}")
-    exit(1)
-
-img = cv2.imread(input_path, cv2.IMREAD_COLOR)
-if img is None:
-    print(f"[!] 이미지를 불러올 수 없습니다: {input_path}")
-    exit(1)
-
-# 모델 반복 적용
-for filename in os.listdir(model_dir):
-    if filename.endswith('.pth'):
-        model_path = os.path.join(model_dir, filename)
-        model_name = os.path.splitext(filename)[0]
-        print(f"[→] 모델 적용 중: {model_name}")
-
-        model = RRDBNet(num_in_ch=3, num_out_ch=3, num_feat=64,
-                        num_block=23, num_grow_ch=32, scale=4)
-
-        upscaler = RealESRGANer(
-            scale=4,
-            model_path=model_path,
-            model=model,
-            tile=0,
-            pre_pad=0,
-            half=False
-        )
+import sys
+import json
+import time
+import platform
+import argparse
+import itertools
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+# tile / tile_pad / backend 설정을 실제로 사용하는 플러그인
+TILED_PLUGINS = {"real-esrgan"}
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * q / 100
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 byte 단위
+        return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1024 / 1024
+
+
+def load_images(asset_dir, size):
+    import cv2
+
+    images = []
+    for name in sorted(os.listdir(asset_dir)):
+        if not name.lower().endswith((".jpg", ".jpeg", ".png")):
+            continue
+        img = cv2.cvtColor(cv2.imread(os.path.join(asset_dir, name)), cv2.COLOR_BGR2RGB)
+        ratio = size / max(img.shape[:2])
+        img = cv2.resize(img, (max(1, int(img.shape[1] * ratio)), max(1, int(img.shape[0] * ratio))),
+                         interpolation=cv2.INTER_AREA)
+        images.append(img)
+    return images
+
+
+class _TimedModel:
+    """모델 호출(= 타일 1개)마다 걸린 시간을 기록하는 래퍼"""
+
+    def __init__(self, model):
+        self.model = model
+        self.latencies = []
+
+    def __call__(self, x):
+        t0 = time.perf_counter()
+        out = self.model(x)
+        self.latencies.append((time.perf_counter() - t0) * 1000)
+        return out
+
+
+def run_case(case, model_path, asset_dir, repeat):
+    """새 프로세스에서 케이스 하나를 실행합니다 (메모리 최대치가 케이스별로 분리됨)."""
+    import cv2
+    from config.settings_loader import AppSettings
+    from plugins.plugin_loader import create_upscaler
+
+    cv2.setNumThreads(case["threads"])
+    settings = AppSettings(
+        model_path=model_path, tile=case["tile"], tile_pad=case["tile_pad"], auto_tile=case["auto_tile"],
+        inference_backends={case["plugin"]: case["backend"]}, inference_threads=case["threads"],
+    )
 
+    t0 = time.perf_counter()
+    upscaler = create_upscaler(case["plugin"], settings)
+    load_sec = time.perf_counter() - t0
+
+    images = load_images(asset_dir, case["size"])
+    upscaler.upscale(images[0])  # 워밍업 (compile/초기화 비용 제외)
+
+    timed = None
+    if hasattr(upscaler, "upscaler"):
+        timed = _TimedModel(upscaler.upscaler.model)
+        upscaler.upscaler.model = timed
+
+    call_ms = []
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for img in images:
+            c0 = time.perf_counter()
+            upscaler.upscale(img)
+            call_ms.append((time.perf_counter() - c0) * 1000)
+    wall_sec = time.perf_counter() - t0
+
+    megapixels = repeat * sum(img.shape[0] * img.shape[1] for img in images) / 1e6
+    latencies = timed.latencies if timed and timed.latencies else call_ms
+    return {
+        **case,
+        "load_sec": round(load_sec, 3),
+        "wall_sec": round(wall_sec, 3),
+        "mp_per_sec": round(megapixels / wall_sec, 4),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "tile_ms": {
+            "count": len(latencies),
+            "p50": round(percentile(latencies, 50), 2),
+            "p90": round(percentile(latencies, 90), 2),
+            "p99": round(percentile(latencies, 99), 2),
+        },
+    }
+
+
+def build_cases(args):
+    cases = []
+    for plugin in args.plugins:
+        tiled = plugin in TILED_PLUGINS
+        for auto_tile in (sorted(set(args.auto_tile)) if tiled else [0]):
+            # 자동 타일 계획이 켜져 있으면 tile/tile_pad 설정은 쓰이지 않으므로 조합하지 않음
+            fixed = tiled and not auto_tile
+            for tile, tile_pad, threads, backend, size in itertools.product(
+                args.tiles if fixed else [0],
+                args.tile_pads if fixed else [0],
+                args.threads,
+                args.backends if tiled else ["fp32"],
+                args.sizes,
+            ):
+                cases.append({"plugin": plugin, "backend": backend, "auto_tile": bool(auto_tile), "tile": tile,
+                              "tile_pad": tile_pad, "threads": threads, "size": size})
+    return cases
+
+
+def case_key(r):
+    return (r["plugin"], r["backend"], r.get("auto_tile", False), r["tile"], r["tile_pad"], r["threads"], r["size"])
+
+
+def compare(results, baseline_path, threshold):
+    """이전 결과 대비 처리량 변화를 출력하고, 기준보다 느려진 케이스 수를 반환합니다."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {case_key(r): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"\n[비교] 기준: {baseline_path}")
+    for r in results:
+        old = baseline.get(case_key(r))
+        if old is None:
+            continue
+        change = (r["mp_per_sec"] - old["mp_per_sec"]) / old["mp_per_sec"] * 100
+        flag = ""
+        if change < -threshold:
+            flag = "  ⚠️ 성능 저하"
+            regressions += 1
+        print(f"  {case_key(r)}: {old['mp_per_sec']} → {r['mp_per_sec']} MP/s ({change:+.1f}%){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--plugins', nargs='+', default=['real-esrgan'], help='측정할 업스케일러 (plugin_loader.PLUGINS 키)')
+    parser.add_argument('--model', type=str, default=os.path.join(ROOT, 'src', 'models', 'RealESRNet_x4plus.pth'))
+    parser.add_argument('--assets', type=str, default=os.path.join(ROOT, 'tests', 'test_asset'))
+    parser.add_argument('--tiles', nargs='+', type=int, default=[0, 128, 256])
+    parser.add_argument('--tile_pads', nargs='+', type=int, default=[4, 10])
+    parser.add_argument('--auto_tile', nargs='+', type=int, choices=[0, 1], default=[0],
+                        help='자동 타일 계획 (0: tile/tile_pad 고정 조합, 1: 자동 계획)')
+    parser.add_argument('--threads', nargs='+', type=int, default=[os.cpu_count() or 1])
+    parser.add_argument('--backends', nargs='+', default=['fp32'])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[256, 512], help='입력 긴 변 크기')
+    parser.add_argument('--repeat', type=int, default=2)
+    parser.add_argument('--output', type=str, default=os.path.join(ROOT, 'tests', 'output', 'bench_upscale.json'))
+    parser.add_argument('--compare', type=str, default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=10.0, help='성능 저하로 판단할 처리량 감소율(%%)')
+    args = parser.parse_args()
+
+    from plugins.plugin_loader import PLUGINS
+    unknown = [p for p in args.plugins if p not in PLUGINS]
+    if unknown:
+        print(f"[!] 지원하지 않는 업스케일러: {unknown}")
+        sys.exit(1)
+
+    results = []
+    for case in build_cases(args):
+        print(f"[→] {case}")
         try:
-            output, _ = upscaler.enhance(img)
-            save_path = os.path.join(output_dir, f'{model_name}.jpg')
-            cv2.imwrite(save_path, output)
-            print(f"[✓] 저장 완료 → {save_path}\n")
+            with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as pool:
+                result = pool.submit(run_case, case, args.model, args.assets, args.repeat).result()
         except Exception as e:
-            print(f"[!] {model_name} 처리 실패: {e}\n")
+            print(f"[!] 실패: {e}")
+            continue
+        print(f"    {result['mp_per_sec']} MP/s, RSS {result['peak_rss_mb']} MB, "
+              f"tile p50/p99 {result['tile_ms']['p50']}/{result['tile_ms']['p99']} ms")
+        results.append(result)
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "cpu_count": os.cpu_count(),
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }, f, indent=4, ensure_ascii=False)
+    print(f"[✓] 결과 저장 → {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
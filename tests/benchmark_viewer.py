@@ -0,0 +1,260 @@
+"""
+뷰어 주요 경로 벤치마크 스크립트입니다. Qt offscreen 플랫폼으로 화면 없이 실행됩니다.
+합성 폴더(100 ~ 50k 파일), ZIP, 긴 GIF를 만들어 다음 경로의 p50/p95 지연 시간과 메모리를 측정합니다.
+
+    page_turn  : 다음 페이지 넘김 → 전체 해상도가 그려질 때까지 (점진 표시면 워커 디코딩 포함)
+    first_paint: 다음 페이지 넘김 → 첫 화면 (점진 표시의 축소 미리보기, 아니면 page_turn과 같음)
+    thumbnails : ThumbnailDialog 생성 시간
+    gif        : GifPlayer.load 시간, update_frame 프레임당 비용
+    archive    : extract_archive 압축 열기 시간
+
+python tests/benchmark_viewer.py --counts 100 1000 10000 50000 --output tests/output/bench_viewer.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import zipfile
+import tempfile
+import argparse
+import platform
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import cv2
+import numpy as np
+from PIL import Image
+from PySide6.QtWidgets import QApplication
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * q / 100
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def rss_mb():
+    # /proc가 없으면 최대치(ru_maxrss)로 대신함
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def summarize(name, samples_ms, **extra):
+    return {
+        "name": name,
+        "count": len(samples_ms),
+        "p50_ms": round(percentile(samples_ms, 50), 2),
+        "p95_ms": round(percentile(samples_ms, 95), 2),
+        "max_ms": round(max(samples_ms), 2) if samples_ms else 0.0,
+        "rss_mb": round(rss_mb(), 1),
+        **extra,
+    }
+
+
+# ---------------------------------------------------------------- 합성 데이터
+
+def synthetic_page(width, height, seed):
+    # 스캔 페이지와 비슷하게 그라디언트 + 노이즈 + 글자 모양 블록
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    img = np.repeat(np.repeat(y, width, axis=1)[:, :, None], 3, axis=2)
+    img += rng.normal(0, 12, img.shape).astype(np.float32)
+    for _ in range(40):
+        x0, y0 = rng.integers(0, width - 60), rng.integers(0, height - 20)
+        img[y0:y0 + 16, x0:x0 + 60] = 20
+    return np.clip(img, 0, 255).astype(np.uint8)
+
+
+def make_folder(base, count, width, height, variants=8):
+    """count개의 JPEG가 든 폴더 생성 (몇 가지 인코딩 결과를 복사해 빠르게 만듦)"""
+    folder = os.path.join(base, f"folder_{count}")
+    os.makedirs(folder, exist_ok=True)
+    blobs = [cv2.imencode(".jpg", synthetic_page(width, height, i), [cv2.IMWRITE_JPEG_QUALITY, 90])[1].tobytes()
+             for i in range(variants)]
+    for i in range(count):
+        with open(os.path.join(folder, f"page{i:06d}.jpg"), "wb") as f:
+            f.write(blobs[i % variants])
+    return folder
+
+
+def make_zip(base, folder, limit):
+    path = os.path.join(base, f"{os.path.basename(folder)}.cbz")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        for name in sorted(os.listdir(folder))[:limit]:
+            zf.write(os.path.join(folder, name), name)
+    return path
+
+
+def make_gif(base, frames, width, height):
+    path = os.path.join(base, f"long_{frames}.gif")
+    images = [Image.fromarray(synthetic_page(width, height, i)).quantize(64) for i in range(min(frames, 16))]
+    images = [images[i % len(images)] for i in range(frames)]
+    images[0].save(path, save_all=True, append_images=images[1:], duration=40, loop=0)
+    return path
+
+
+# ---------------------------------------------------------------- 측정
+
+def wait_presented(app, viewer, timeout=30.0):
+    # 점진 표시는 load_next_image가 워커에 디코딩을 맡기고 바로 돌아오므로, 전체 해상도가 그려질 때까지 대기
+    path = viewer.current_image_path
+    deadline = time.perf_counter() + timeout
+    while viewer.presented_path != path and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def bench_page_turn(app, viewer, folder, turns):
+    """Returns: (첫 화면까지 ms 목록, 전체 해상도까지 ms 목록)"""
+    files = sorted(os.listdir(folder))
+    viewer.open_image(os.path.join(folder, files[0]))
+    app.processEvents()
+    wait_presented(app, viewer)
+
+    first_paint, full = [], []
+    for _ in range(min(turns, len(files) - 1)):
+        t0 = time.perf_counter()
+        viewer.load_next_image()
+        app.processEvents()
+        first_paint.append((time.perf_counter() - t0) * 1000)
+        wait_presented(app, viewer)
+        full.append((time.perf_counter() - t0) * 1000)
+    return first_paint, full
+
+
+def bench_thumbnails(app, viewer, folder, rounds):
+    from ui.thumbnail_dialog import ThumbnailDialog
+
+    samples = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        dialog = ThumbnailDialog(folder, parent=viewer)
+        app.processEvents()
+        samples.append((time.perf_counter() - t0) * 1000)
+        dialog.close()
+        dialog.deleteLater()
+        app.processEvents()
+    return samples
+
+
+def bench_gif(app, viewer, gif_path, frames):
+    from utils.gif_player import GifPlayer
+
+    player = GifPlayer(viewer.image_label)
+    t0 = time.perf_counter()
+    player.load(gif_path)
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    samples = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        player.update_frame()
+        app.processEvents()
+        samples.append((time.perf_counter() - t0) * 1000)
+    player.stop()
+    return load_ms, samples
+
+
+def bench_archive(zip_path, rounds):
+    from utils.image_utils import extract_archive
+
+    samples = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        images = extract_archive(zip_path)
+        samples.append((time.perf_counter() - t0) * 1000)
+        shutil.rmtree(os.path.dirname(images[0]), ignore_errors=True)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--counts', nargs='+', type=int, default=[100, 1000, 10000], help='합성 폴더 파일 수')
+    parser.add_argument('--page_size', nargs=2, type=int, default=[1600, 2400], metavar=('W', 'H'))
+    parser.add_argument('--turns', type=int, default=100, help='측정할 페이지 넘김 횟수')
+    parser.add_argument('--thumb_rounds', type=int, default=3)
+    parser.add_argument('--zip_pages', type=int, default=200)
+    parser.add_argument('--gif_frames', type=int, default=300)
+    parser.add_argument('--workdir', type=str, default=None, help='합성 데이터 위치 (기본: 임시 폴더)')
+    parser.add_argument('--output', type=str, default=os.path.join(ROOT, 'tests', 'output', 'bench_viewer.json'))
+    args = parser.parse_args()
+
+    import ui.viewer_window as viewer_window
+    from plugins.plugin_loader import create_upscaler
+    from core.decode_service import shutdown_decode_service
+
+    # 모델 로드는 측정 대상이 아니므로 경량 업스케일러로 대체
+    viewer_window.create_upscaler = lambda name, settings: create_upscaler("lanczos", settings)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    viewer = viewer_window.ImageViewer()
+    viewer.resize(1000, 700)
+    viewer.show()
+    app.processEvents()
+
+    base = args.workdir or tempfile.mkdtemp(prefix="viewer_bench_")
+    width, height = args.page_size
+    results = []
+
+    try:
+        for count in args.counts:
+            print(f"[→] 합성 폴더 생성: {count}개")
+            folder = make_folder(base, count, width, height)
+
+            first_paint, full = bench_page_turn(app, viewer, folder, args.turns)
+            results.append(summarize("first_paint", first_paint, files=count))
+            results.append(summarize("page_turn", full, files=count))
+            results.append(summarize("thumbnails", bench_thumbnails(app, viewer, folder, args.thumb_rounds), files=count))
+
+            zip_path = make_zip(base, folder, args.zip_pages)
+            results.append(summarize("archive_open", bench_archive(zip_path, 3), files=min(count, args.zip_pages)))
+
+        print(f"[→] GIF 생성: {args.gif_frames} 프레임")
+        gif_path = make_gif(base, args.gif_frames, width // 4, height // 4)
+        load_ms, frame_samples = bench_gif(app, viewer, gif_path, args.gif_frames)
+        results.append(summarize("gif_load", [load_ms], frames=args.gif_frames))
+        results.append(summarize("gif_frame", frame_samples, frames=args.gif_frames))
+    finally:
+        viewer.close()
+        shutdown_decode_service()
+        if not args.workdir:
+            shutil.rmtree(base, ignore_errors=True)
+
+    print(f"{'path':<14}{'files':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'max(ms)':>10}{'RSS(MB)':>10}")
+    for r in results:
+        print(f"{r['name']:<14}{r.get('files', r.get('frames', '')):>8}{r['p50_ms']:>10}"
+              f"{r['p95_ms']:>10}{r['max_ms']:>10}{r['rss_mb']:>10}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "page_size": args.page_size,
+            },
+            "results": results,
+        }, f, indent=4, ensure_ascii=False)
+    print(f"[✓] 결과 저장 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
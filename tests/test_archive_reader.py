@@ -0,0 +1,85 @@
+import os
+import io
+import tarfile
+import zipfile
+
+import utils.archive_reader as archive_reader
+from utils.archive_reader import open_archive, load_index, TarArchiveReader, CompressedTarArchiveReader
+
+PAGES = {"b/002.png": b"second", "a/001.jpg": b"first", "notes.txt": b"skip"}
+
+def _make_tar(path, mode):
+    with tarfile.open(path, mode) as tf:
+        for name, data in PAGES.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+def _read_all(reader):
+    try:
+        return {n: open(reader.extract(n), "rb").read() for n in reader.names()}
+    finally:
+        reader.close()
+
+def test_zip_reader(tmp_path):
+    path = str(tmp_path / "book.cbz")
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in PAGES.items():
+            zf.writestr(name, data)
+    assert _read_all(open_archive(path)) == {"a/001.jpg": b"first", "b/002.png": b"second"}
+
+def test_tar_reader_persists_offset_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_reader, "INDEX_DIR", str(tmp_path / "index"))
+    path = str(tmp_path / "book.cbt")
+    _make_tar(path, "w")
+
+    reader = open_archive(path)
+    assert isinstance(reader, TarArchiveReader)
+    assert reader.size("b/002.png") == 6
+    assert _read_all(reader) == {"a/001.jpg": b"first", "b/002.png": b"second"}
+    assert set(load_index(path)) == {"a/001.jpg", "b/002.png"}
+
+    # 아카이브가 바뀌면 색인은 무효
+    os.utime(path, (0, 0))
+    assert load_index(path) is None
+
+def test_compressed_tar_streams(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_reader, "INDEX_DIR", str(tmp_path / "index"))
+    path = str(tmp_path / "book.tar.gz")
+    _make_tar(path, "w:gz")
+
+    reader = open_archive(path)
+    assert isinstance(reader, CompressedTarArchiveReader)
+    assert reader.size("a/001.jpg") == 5 and reader.size("b/002.png") == 6
+    assert _read_all(reader) == {"a/001.jpg": b"first", "b/002.png": b"second"}
+
+def test_readers_must_implement_read():
+    import pytest
+
+    class Incomplete(archive_reader.SolidArchiveReader):
+        def _list_members(self):
+            return {}
+
+    with pytest.raises(TypeError):
+        archive_reader.ArchiveReader("x.zip")
+    with pytest.raises(TypeError):
+        Incomplete("x.tar.gz")
+
+def test_close_stops_streaming(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_reader, "INDEX_DIR", str(tmp_path / "index"))
+    path = str(tmp_path / "book.tar.gz")
+    _make_tar(path, "w:gz")
+    reader = open_archive(path)
+    reader.close()
+    assert not reader._thread.is_alive()
+    assert not os.path.exists(reader.temp_dir)
+
+def test_extract_archive_outlives_reader(tmp_path):
+    from utils.image_utils import extract_archive
+
+    path = str(tmp_path / "book.cbz")
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in PAGES.items():
+            zf.writestr(name, data)
+    paths = extract_archive(path)
+    assert [open(p, "rb").read() for p in paths] == [b"first", b"second"]
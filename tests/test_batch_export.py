@@ -0,0 +1,101 @@
+import zipfile
+
+import cv2
+import numpy as np
+
+from core.batch_export import ExportPipeline, export_source, fit_size
+
+def _page(w, h, value):
+    img = np.zeros((h, w, 3), np.uint8)
+    img[: h // 2] = value  # 위쪽 절반만 칠해 회전 확인
+    return img
+
+def test_fit_size():
+    assert fit_size(1000, 2000) == (1000, 2000)
+    assert fit_size(1000, 2000, max_height=1000) == (500, 1000)
+    assert fit_size(1000, 2000, scale=2.0, max_width=1500) == (1500, 3000)
+
+def test_export_folder_to_directory(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(5):
+        cv2.imwrite(str(src / f"page{i + 1}.png"), _page(40, 80, 200))
+    out = tmp_path / "out"
+
+    pipeline = ExportPipeline(rotation=90, max_height=20, format="jpg", quality=80)
+    done, failed = export_source(str(src), pipeline, str(out), workers=2, max_inflight=2)
+    assert (done, failed) == (5, 0)
+
+    img = cv2.imread(str(out / "page3.jpg"))
+    # 80×40 (회전) -> 높이 20에 맞춰 40×20
+    assert img.shape[:2] == (20, 40)
+    # 시계 방향 90° 회전: 위쪽 절반이 오른쪽으로
+    assert img[:, -5:].mean() > 150 and img[:, :5].mean() < 50
+
+def test_export_archive_to_cbz_in_order(tmp_path):
+    archive = tmp_path / "book.cbz"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for i in (1, 2, 10):
+            ok, buf = cv2.imencode(".png", _page(16, 16, i * 10))
+            zf.writestr(f"ch1/p{i}.png", buf.tobytes())
+        zf.writestr("ch1/broken.png", b"not an image")
+    out = tmp_path / "out.cbz"
+
+    progress = []
+    done, failed = export_source(
+        str(archive), ExportPipeline(flip_vertical=True, format="webp"), str(out),
+        names=["ch1/p1.png", "ch1/p2.png", "ch1/broken.png", "ch1/p10.png"],
+        workers=2, progress=lambda d, t: progress.append(d)
+    )
+    assert (done, failed) == (3, 1)
+    assert progress == [1, 2, 3, 4]
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.namelist() == ["ch1/p1.webp", "ch1/p2.webp", "ch1/p10.webp"]
+        data = np.frombuffer(zf.read("ch1/p10.webp"), np.uint8)
+    img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+    # 상하 반전: 칠한 절반이 아래로
+    assert img[-4:].mean() > 90 and img[:4].mean() < 10
+
+def test_stop_leaves_remaining_pages(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(6):
+        cv2.imwrite(str(src / f"{i}.png"), _page(8, 8, 100))
+    done, failed = export_source(
+        str(src), ExportPipeline(), str(tmp_path / "out"), workers=1, max_inflight=1, stop=lambda: True
+    )
+    assert (done, failed) == (0, 0)
+
+def test_directory_output_rejects_escaping_names(tmp_path):
+    archive = tmp_path / "evil.cbz"
+    ok, buf = cv2.imencode(".png", _page(8, 8, 50))
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../../escaped.png", buf.tobytes())
+        zf.writestr("/abs.png", buf.tobytes())
+        zf.writestr("ok/page.png", buf.tobytes())
+    out = tmp_path / "out" / "a"
+
+    done, failed = export_source(str(archive), ExportPipeline(), str(out), workers=1)
+    assert (done, failed) == (1, 2)
+    assert (out / "ok" / "page.png").exists()
+    assert not (tmp_path / "escaped.png").exists() and not (tmp_path / "out" / "escaped.png").exists()
+
+def test_model_upscale_limits_workers(tmp_path, monkeypatch):
+    import core.batch_export as batch_export
+
+    created = []
+    class FakePool:
+        def __init__(self, max_workers, **kwargs):
+            created.append(max_workers)
+        def submit(self, fn, *args):
+            raise RuntimeError("not used")
+        def shutdown(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(batch_export, "ProcessPoolExecutor", FakePool)
+    writer = batch_export.DirectoryWriter(str(tmp_path / "out"))
+    items = [(f"{i}.png", lambda: b"") for i in range(8)]
+    batch_export.export_batch(items, ExportPipeline(upscale="real-esrgan"), writer, workers=4)
+    batch_export.export_batch(items, ExportPipeline(upscale="lanczos"), writer, workers=4)
+    assert created == [batch_export.MODEL_WORKERS, 4]
@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+import pytest
+
+from core.decode_service import DecodeService, share_array, attach_shared
+from utils.perf_trace import tracer
+
+def _pages(tmp_path, count):
+    paths = []
+    for i in range(count):
+        img = np.full((40, 60 + i * 10, 3), i * 40, np.uint8)
+        path = str(tmp_path / f"{i:03d}.png")
+        cv2.imwrite(path, img)
+        paths.append(path)
+    return paths
+
+def test_share_array_round_trip():
+    for arr in (np.arange(24, dtype=np.uint8).reshape(2, 4, 3), np.linspace(0, 1, 10, dtype=np.float32)):
+        name, shape, dtype = share_array(arr)
+        shared = attach_shared(name, shape, dtype)
+        assert shared.dtype == arr.dtype and np.array_equal(shared, arr)
+        # 받는 쪽이 열면서 이름을 제거 (배열은 계속 유효)
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        assert shared.sum() == arr.sum()
+
+    # 빈 배열도 1바이트 블록으로 전달
+    empty = attach_shared(*share_array(np.zeros((0, 3), np.uint8)))
+    assert empty.shape == (0, 3)
+
+def test_submit_map_and_cancel(tmp_path):
+    paths = _pages(tmp_path, 4)
+    service = DecodeService(workers=1)
+    try:
+        img = service.submit(paths[1]).result()
+        assert img.shape == (40, 70, 3) and img[0, 0, 0] == 40
+
+        # 입력 순서대로, 실패는 None
+        results = list(service.map(paths + [str(tmp_path / "missing.png")], max_side=35))
+        assert [r.shape[1] for r in results[:4]] == [35, 35, 35, 35]
+        assert [int(r[0, 0, 0]) for r in results[:4]] == [0, 40, 80, 120]
+        assert results[4] is None
+
+        futures = [service.submit(p) for p in paths]
+        assert futures[-1].cancel()
+        assert futures[-1].cancelled()
+        assert [f.result().shape[1] for f in futures[:3]] == [60, 70, 80]
+        # 취소 뒤에도 서비스는 그대로 사용 가능
+        assert service.decode(paths[3], reduce=2).shape == (20, 45, 3)
+    finally:
+        service.shutdown()
+
+def test_failed_read_falls_back_to_path(tmp_path):
+    path = _pages(tmp_path, 1)[0]
+
+    class BrokenReader:
+        def read(self, p):
+            future = Future()
+            future.set_exception(RuntimeError("read layer closed"))
+            return future
+
+    service = DecodeService(workers=1)
+    service.set_reader(BrokenReader())
+    try:
+        assert service.submit(path).result(timeout=30).shape == (40, 60, 3)
+    finally:
+        service.shutdown()
+
+def test_worker_spans_reach_parent_tracer(tmp_path):
+    path = _pages(tmp_path, 1)[0]
+    service = DecodeService(workers=1)
+    tracer.clear()
+    tracer.enable()
+    try:
+        service.decode(path, max_side=30)
+        names = {e[0] for e in tracer.events if e[3] != os.getpid()}
+        assert {"decode", "scale", "color"} <= names
+        assert "decode" in tracer.last_durations
+    finally:
+        tracer.enable(False)
+        tracer.clear()
+        service.shutdown()
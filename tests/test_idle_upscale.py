@@ -0,0 +1,60 @@
+import time
+
+import cv2
+import numpy as np
+
+from config.settings_loader import AppSettings
+from core.idle_upscale import IdleUpscaler, ProgressStore, plan_queue
+
+def test_plan_queue_reading_order():
+    paths = ["a.jpg", "b.png", "c.gif", "d.jpg", "e.jpg"]
+    cached = {"d.jpg"}
+    assert plan_queue(paths, 1, cached.__contains__) == ["b.png", "e.jpg"]
+    assert plan_queue(paths, 0, cached.__contains__, ahead=1) == ["a.jpg", "b.png"]
+    assert plan_queue(paths, -1, cached.__contains__, ahead=1) == ["a.jpg", "b.png"]
+
+def test_plan_queue_limit_stops_scanning():
+    paths = [f"{i}.jpg" for i in range(100)]
+    checked = []
+    def cached(p):
+        checked.append(p)
+        return p in ("0.jpg", "1.jpg")
+    assert plan_queue(paths, 0, cached, animated=lambda p: False, limit=1) == ["2.jpg"]
+    assert checked == ["0.jpg", "1.jpg", "2.jpg"]
+
+def test_progress_persists(tmp_path):
+    store = ProgressStore(str(tmp_path / "progress.json"))
+    store.update("/books/vol1.cbz", 3, 10)
+    store.save()
+    assert ProgressStore(str(tmp_path / "progress.json")).get("/books/vol1.cbz") == {"done": 3, "total": 10}
+    assert ProgressStore(str(tmp_path / "missing.json")).get("x") == {"done": 0, "total": 0}
+
+def _wait_results(upscaler, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        done = upscaler.poll()
+        if done:
+            return done
+        time.sleep(0.02)
+    return []
+
+def test_paused_worker_makes_no_progress(tmp_path):
+    src = tmp_path / "page.png"
+    cv2.imwrite(str(src), np.full((16, 24, 3), 128, dtype=np.uint8))
+    cache = tmp_path / "cached.png"
+
+    settings = AppSettings()
+    settings.scale_factor = 2.0
+    upscaler = IdleUpscaler(settings, model="lanczos")
+    try:
+        upscaler.pause()
+        upscaler.submit(str(src), str(cache))
+        time.sleep(0.5)
+        assert upscaler.poll() == [] and upscaler.busy() and not cache.exists()
+
+        upscaler.resume()
+        assert _wait_results(upscaler) == [(str(src), True)]
+        assert not upscaler.busy()
+        assert cv2.imread(str(cache)).shape == (32, 48, 3)
+    finally:
+        upscaler.stop()
@@ -0,0 +1,60 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+from core import decoders
+from core.decode_service import decode_rgb
+from utils.image_formats import sniff, detect_format, is_animated
+from utils.image_utils import is_image_file
+
+def _frames(count=3):
+    return [Image.fromarray(np.full((24, 40, 3), i * 70, np.uint8)) for i in range(count)]
+
+def test_sniff_ignores_extension(tmp_path):
+    img = np.random.default_rng(0).integers(0, 255, (16, 16, 3), dtype=np.uint8)
+    for fmt, ext in (("jpeg", ".jpg"), ("png", ".png"), ("webp", ".webp"), ("avif", ".avif"), ("bmp", ".bmp"), ("tiff", ".tiff")):
+        ok, buf = cv2.imencode(ext, img)
+        assert sniff(buf.tobytes()) == fmt
+        # 확장자가 틀린 파일도 내용으로 판별해 디코딩
+        path = tmp_path / f"wrong_{fmt}.gif"
+        path.write_bytes(buf.tobytes())
+        assert detect_format(str(path)) == fmt
+        assert decode_rgb(str(path)).shape == (16, 16, 3)
+    assert sniff(b"not an image") is None
+    assert is_image_file("a.WEBP") and is_image_file("b.avif") and not is_image_file("c.txt")
+
+def test_animated_detection(tmp_path):
+    frames = _frames()
+    for ext in ("gif", "webp", "png", "avif"):
+        anim = tmp_path / f"anim.{ext}"
+        frames[0].save(anim, save_all=True, append_images=frames[1:], duration=[40, 80, 120], loop=0)
+        assert is_animated(str(anim)), ext
+        if ext != "gif":
+            still = tmp_path / f"still.{ext}"
+            frames[0].save(still)
+            assert not is_animated(str(still)), ext
+            assert decode_rgb(str(anim)).shape == (24, 40, 3)
+    # 아직 풀리지 않은 압축 페이지는 확장자로 추정
+    assert is_animated(str(tmp_path / "missing.gif"))
+    assert not is_animated(str(tmp_path / "missing.webp"))
+
+def test_reduce_and_fallback(tmp_path):
+    img = np.random.default_rng(1).integers(0, 255, (64, 96, 3), dtype=np.uint8)
+    ok, buf = cv2.imencode(".jpg", img)
+    for decoder in decoders.DECODERS["jpeg"]:
+        assert decoder.decode(buf, 4).shape[:2] == (16, 24), decoder.name
+
+    calls = []
+    def broken(data, reduce=1):
+        calls.append(reduce)
+        raise RuntimeError("unsupported")
+
+    saved = list(decoders.DECODERS["jpeg"])
+    try:
+        decoders.register_decoder("jpeg", "broken", broken, first=True)
+        assert decoders.decoders_for("jpeg")[0].name == "broken"
+        # 앞 디코더가 실패하면 다음 디코더로
+        assert decoders.decode_bgr(buf, 2).shape[:2] == (32, 48)
+        assert calls == [2]
+    finally:
+        decoders.DECODERS["jpeg"] = saved
@@ -0,0 +1,38 @@
+import cv2
+import numpy as np
+
+from core.image_hash import hash_images, hamming, HammingIndex, HashStore, HASH_KINDS
+
+def _page(seed):
+    rng = np.random.default_rng(seed)
+    return cv2.GaussianBlur(rng.integers(0, 256, (240, 160, 3), dtype=np.uint8), (15, 15), 5)
+
+def test_hashes_survive_resize_but_separate_different_images():
+    page = _page(0)
+    hashes = hash_images([page, cv2.resize(page, (80, 120), interpolation=cv2.INTER_AREA), _page(1)])
+    phash = HASH_KINDS.index("phash")
+    assert hamming(hashes[0, phash], hashes[1, phash]) <= 6
+    assert hamming(hashes[0, phash], hashes[2, phash]) > 6
+
+def test_index_query_matches_linear_scan():
+    rng = np.random.default_rng(0)
+    hashes = rng.integers(0, 2 ** 63, 5000, dtype=np.uint64)
+    hashes[10] = hashes[20] ^ np.uint64(0b1011)   # 거리 3
+    hashes[30] = hashes[20]                        # 완전히 같음
+    index = HammingIndex(hashes, max_distance=4)
+
+    rows, dists = index.query(hashes[20])
+    expected = np.flatnonzero(hamming(hashes, hashes[20]) <= 4)
+    assert rows.tolist() == expected.tolist() == [10, 20, 30]
+    assert dists.tolist() == [3, 0, 0]
+    assert index.duplicate_groups() == [[10, 20, 30]]
+
+def test_store_invalidates_changed_source(tmp_path):
+    path = str(tmp_path / "hashes.json")
+    store = HashStore(path)
+    store.put("a.jpg", (100, 1.5), (1, 2, 2 ** 64 - 1))
+    store.save()
+
+    store = HashStore(path)
+    assert store.get("a.jpg", (100, 1.5)) == (1, 2, 2 ** 64 - 1)
+    assert store.get("a.jpg", (100, 2.0)) is None
@@ -0,0 +1,92 @@
+import time
+
+import cv2
+import numpy as np
+
+from core.decode_service import DecodeService
+from core.io_service import ReadAheadReader, LatencyOpener
+
+def _files(tmp_path, count, size=64 * 1024):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"{i:03d}.bin"
+        path.write_bytes(bytes([i]) * size)
+        paths.append(str(path))
+    return paths
+
+def test_read_ahead_hides_latency(tmp_path):
+    paths = _files(tmp_path, 8)
+    opener = LatencyOpener(latency=0.03)
+
+    # 요청할 때마다 기다리는 경우: 파일마다 open + read + EOF 확인 3번 왕복
+    serial = ReadAheadReader(workers=1, opener=opener)
+    start = time.perf_counter()
+    for p in paths:
+        serial.read(p).result()
+    serial_time = time.perf_counter() - start
+    serial.shutdown()
+
+    reader = ReadAheadReader(workers=4, opener=opener)
+    start = time.perf_counter()
+    reader.read_ahead(paths)
+    data = [reader.read(p).result() for p in paths]
+    ahead_time = time.perf_counter() - start
+    assert [d.tobytes()[:1] for d in data] == [bytes([i]) for i in range(8)]
+    reader.shutdown()
+
+    assert ahead_time < serial_time / 2
+
+def test_same_file_is_read_once(tmp_path):
+    path = _files(tmp_path, 1)[0]
+    opens = []
+
+    def opener(p, mode="rb"):
+        opens.append(p)
+        return open(p, mode)
+
+    reader = ReadAheadReader(workers=2, opener=opener)
+    first = reader.read(path)
+    assert reader.read(path) is first
+    assert first.result().tobytes() == bytes([0]) * 64 * 1024
+    reader.read(path).result()
+    assert opens == [path]
+    reader.shutdown()
+
+def test_budget_evicts_oldest_and_skips_failures(tmp_path):
+    paths = _files(tmp_path, 4, size=1000)
+    opens = []
+
+    def opener(p, mode="rb"):
+        opens.append(p)
+        return open(p, mode)
+
+    reader = ReadAheadReader(workers=1, budget_bytes=2500, opener=opener)
+    for p in paths:
+        reader.read(p).result()
+    assert reader.nbytes() == 2000
+    reader.read(paths[3]).result()
+    reader.read(paths[0]).result()  # 예산을 넘어 먼저 해제된 파일은 다시 읽음
+    assert opens == paths + [paths[0]]
+
+    assert reader.read(str(tmp_path / "missing.jpg")).result() is None
+    assert reader.evict(10 ** 6) == 2000 and reader.nbytes() == 0
+    reader.shutdown()
+
+def test_decode_from_read_ahead_buffer(tmp_path):
+    img = np.zeros((40, 64, 3), dtype=np.uint8)
+    img[:, :32] = (255, 0, 0)
+    path = str(tmp_path / "page.png")
+    cv2.imwrite(path, img)
+
+    service = DecodeService(workers=1)
+    reader = ReadAheadReader(workers=2, opener=LatencyOpener(latency=0.01))
+    service.set_reader(reader)
+    try:
+        rgb = service.decode(path)
+        assert rgb.shape == (40, 64, 3)
+        assert tuple(rgb[0, 0]) == (0, 0, 255)  # BGR로 저장한 파랑
+        assert service.decode(path, reduce=2).shape == (20, 32, 3)
+        assert service.decode(str(tmp_path / "missing.png")) is None
+    finally:
+        service.shutdown()
+        reader.shutdown()
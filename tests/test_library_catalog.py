@@ -0,0 +1,85 @@
+import os
+import zipfile
+
+from PIL import Image
+
+from core.library_catalog import LibraryCatalog
+from utils.image_utils import natural_sort_key, list_image_files
+
+def _save(folder, name, size, frames=1):
+    path = os.path.join(folder, name)
+    images = [Image.new("RGB", size, (i * 40, 0, 0)) for i in range(frames)]
+    images[0].save(path, save_all=frames > 1, append_images=images[1:])
+    return path
+
+def test_natural_sort_key():
+    names = ["page10.png", "Page2.png", "page1.png"]
+    assert sorted(names, key=natural_sort_key) == ["page1.png", "Page2.png", "page10.png"]
+
+def test_folder_scan_sort_filter_and_jump(tmp_path):
+    folder = str(tmp_path)
+    _save(folder, "page10.png", (100, 50))
+    _save(folder, "page2.png", (60, 120))
+    _save(folder, "page1.gif", (30, 30), frames=3)
+    catalog = LibraryCatalog(str(tmp_path / "catalog" / "library.sqlite3"))
+
+    assert catalog.list_pages(folder) is None
+    assert catalog.scan_folder(folder) == 3
+    assert catalog.list_pages(folder) == ["page1.gif", "page2.png", "page10.png"]
+    assert [os.path.basename(p) for p in list_image_files(folder)] == catalog.list_pages(folder)
+    assert catalog.list_pages(folder, sort="pixels", descending=True) == ["page2.png", "page10.png", "page1.gif"]
+    assert catalog.list_pages(folder, filter_by="portrait") == ["page2.png"]
+    assert catalog.first_page(folder, filter_by="animated") == "page1.gif"
+    assert catalog.next_page(folder, "page2.png", filter_by="landscape") == "page10.png"
+    assert catalog.info(folder, "page1.gif")[:4] == (30, 30, "GIF", 3)
+    catalog.close()
+
+def test_folder_rescan_is_incremental(tmp_path):
+    folder = str(tmp_path / "pages")
+    os.makedirs(folder)
+    for i in range(5):
+        _save(folder, f"p{i}.png", (10, 10))
+    catalog = LibraryCatalog(str(tmp_path / "library.sqlite3"))
+    catalog.scan_folder(folder)
+
+    assert catalog.scan_folder(folder) == 0
+    os.remove(os.path.join(folder, "p0.png"))
+    path = _save(folder, "p1.png", (20, 40))
+    os.utime(path, (1, 1))
+    assert catalog.scan_folder(folder) == 1
+    assert catalog.list_pages(folder, filter_by="portrait") == ["p1.png"]
+    assert len(catalog.list_pages(folder)) == 4
+    catalog.close()
+
+def test_archive_scan(tmp_path, monkeypatch):
+    import utils.archive_reader as archive_reader
+    monkeypatch.setattr(archive_reader, "INDEX_DIR", str(tmp_path / "index"))
+    _save(str(tmp_path), "a.png", (10, 30))
+    _save(str(tmp_path), "b.png", (30, 10))
+    archive = str(tmp_path / "book.cbz")
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(str(tmp_path / "a.png"), "ch1/a.png")
+        zf.write(str(tmp_path / "b.png"), "ch1/b.png")
+    catalog = LibraryCatalog(str(tmp_path / "library.sqlite3"))
+
+    assert catalog.scan_archive(archive) == 2
+    assert catalog.scan_archive(archive) == 0
+    assert catalog.list_pages(archive, filter_by="landscape") == ["ch1/b.png"]
+    # 멤버마다 실제 크기를 기록 (압축 파일 크기가 아님)
+    assert catalog.info(archive, "ch1/a.png")[4] == os.path.getsize(str(tmp_path / "a.png"))
+    assert catalog.info(archive, "ch1/b.png")[4] == os.path.getsize(str(tmp_path / "b.png"))
+    catalog.close()
+
+def test_interrupted_scan_resumes(tmp_path):
+    folder = str(tmp_path / "pages")
+    os.makedirs(folder)
+    for i in range(4):
+        _save(folder, f"p{i}.png", (10, 10))
+    catalog = LibraryCatalog(str(tmp_path / "library.sqlite3"))
+
+    calls = iter([False, False, True])
+    assert catalog.scan_folder(folder, stop=lambda: next(calls)) == 2
+    assert catalog.list_pages(folder) is None
+    assert catalog.scan_folder(folder) == 2
+    assert len(catalog.list_pages(folder)) == 4
+    catalog.close()
@@ -0,0 +1,49 @@
+from core.memory_governor import MemoryGovernor
+
+MB = 1024 ** 2
+
+class FakeCache:
+    def __init__(self, size):
+        self.size = size
+        self.evicted = 0
+
+    def nbytes(self):
+        return self.size
+
+    def evict(self, bytes_needed):
+        freed = min(self.size, bytes_needed)
+        self.size -= freed
+        self.evicted += freed
+        return freed
+
+def register(governor, name, priority, cache):
+    governor.register(name, priority, cache.nbytes, cache.evict)
+
+def test_evicts_lowest_priority_first():
+    governor = MemoryGovernor(budget_bytes=100 * MB)
+    prefetch, page, model = FakeCache(50 * MB), FakeCache(40 * MB), FakeCache(60 * MB)
+    register(governor, "prefetch", 10, prefetch)
+    register(governor, "current_page", 80, page)
+    register(governor, "model", 90, model)
+
+    freed = governor.enforce(meminfo={"MemTotal": 8192 * MB, "MemAvailable": 4096 * MB})
+
+    assert freed == {"prefetch": 50 * MB}
+    assert page.evicted == 0 and model.evicted == 0
+
+def test_system_pressure_triggers_eviction_under_budget():
+    governor = MemoryGovernor(budget_bytes=1024 * MB, min_available_ratio=0.1)
+    prefetch = FakeCache(100 * MB)
+    register(governor, "prefetch", 10, prefetch)
+
+    # 가용 메모리가 전체의 10%보다 30MB 부족
+    governor.enforce(meminfo={"MemTotal": 1000 * MB, "MemAvailable": 70 * MB})
+    assert prefetch.evicted == 30 * MB
+
+def test_unregister():
+    governor = MemoryGovernor(budget_bytes=1)
+    cache = FakeCache(10 * MB)
+    register(governor, "thumbnails", 20, cache)
+    governor.unregister("thumbnails")
+    assert governor.enforce(meminfo={}) == {}
+    assert governor.usage() == {}
@@ -0,0 +1,44 @@
+import json
+from utils.perf_trace import Tracer
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("decode"):
+        pass
+    tracer.count("pixmap_cache", hit=True)
+    assert len(tracer.events) == 0
+    assert tracer.hit_rate("pixmap_cache") == 0.0
+
+def test_chrome_trace_export(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("decode", path="a.jpg"):
+        pass
+    tracer.count("pixmap_cache", hit=True)
+    tracer.count("pixmap_cache", hit=False)
+
+    out = tracer.export_chrome_trace(str(tmp_path / "trace.json"))
+    with open(out, "r", encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+
+    spans = [e for e in events if e["ph"] == "X"]
+    assert spans[0]["name"] == "decode"
+    assert spans[0]["args"] == {"path": "a.jpg"}
+    assert tracer.hit_rate("pixmap_cache") == 0.5
+
+def test_merge_events_from_another_process():
+    worker = Tracer()
+    worker.enable()
+    with worker.span("decode", reduce=2):
+        pass
+    events = worker.drain()
+    assert len(worker.events) == 0
+
+    parent = Tracer()
+    parent.merge(events)  # 비활성이면 무시
+    assert len(parent.events) == 0
+    parent.enable()
+    parent.merge([(name, start, dur, 12345, tid, args) for name, start, dur, _, tid, args in events])
+    name, start, dur, pid, _, args = parent.events[0]
+    assert (name, pid, args) == ("decode", 12345, {"reduce": 2})
+    assert "decode" in parent.last_durations
@@ -0,0 +1,101 @@
+import numpy as np
+
+from core.roi_upscale import RegionTileCache, visible_region, grid_tiles, upscale_region, crop_upscaled
+
+class FakeUpscaler:
+    """최근접 2배 확대 (타일 경계와 무관하게 결과가 전체 확대와 같아야 함)"""
+
+    def __init__(self, scale=2):
+        self.scale = scale
+        self.batches = []
+
+    def upscale_batch(self, images):
+        self.batches.append([img.shape[:2] for img in images])
+        return [img.repeat(self.scale, axis=0).repeat(self.scale, axis=1) for img in images]
+
+def _image(w, h):
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, (h, w, 3), dtype=np.uint8)
+
+def test_visible_region():
+    assert visible_region(800, 600, 1.0) == (0, 0, 800, 600)
+    assert visible_region(800, 600, 0.5) == (0, 0, 800, 600)  # 1배 미만은 전체
+    assert visible_region(800, 600, 2.0) == (200, 150, 400, 300)
+    # 가장자리를 넘는 중심은 이미지 안으로
+    assert visible_region(800, 600, 4.0, center=(0.0, 0.0)) == (0, 0, 200, 150)
+    assert visible_region(800, 600, 4.0, center=(1.0, 1.0)) == (600, 450, 200, 150)
+    assert visible_region(10, 10, 1000.0) == (4, 4, 1, 1)
+
+def test_grid_tiles_align_and_clamp():
+    covered, tiles = grid_tiles((300, 300, 100, 100), 600, 500, tile=256, margin=64)
+    assert tiles == [(0, 0, 256, 256), (256, 0, 256, 256), (0, 256, 256, 244), (256, 256, 256, 244)]
+    assert covered == (0, 0, 512, 500)
+
+    # 오른쪽/아래 끝 타일은 이미지 경계에서 잘림
+    covered, tiles = grid_tiles((500, 420, 100, 80), 600, 500, tile=256, margin=64)
+    assert tiles == [(256, 256, 256, 244), (512, 256, 88, 244)]
+    assert covered == (256, 256, 344, 244)
+
+def test_upscale_region_matches_full_upscale():
+    img = _image(300, 200)
+    full = img.repeat(2, axis=0).repeat(2, axis=1)
+    upscaler = FakeUpscaler()
+    cache = RegionTileCache()
+
+    region = (130, 70, 100, 90)
+    canvas, covered = upscale_region(img, region, upscaler, cache, "page", tile=64, margin=16, pad=4)
+    cx, cy, cw, ch = covered
+    assert canvas.shape == (ch * 2, cw * 2, 3)
+    assert np.array_equal(canvas, full[cy * 2:(cy + ch) * 2, cx * 2:(cx + cw) * 2])
+
+    x, y, w, h = region
+    view = crop_upscaled(canvas, covered, region)
+    assert np.array_equal(view, full[y * 2:(y + h) * 2, x * 2:(x + w) * 2])
+    # 한 번의 upscale_batch로 모든 타일 처리, 이미지 경계 쪽 패딩은 잘림
+    assert len(upscaler.batches) == 1
+    assert (72, 72) in upscaler.batches[0] and all(h <= 72 and w <= 72 for h, w in upscaler.batches[0])
+
+def test_edge_region_is_clamped_to_image():
+    img = _image(150, 100)
+    full = img.repeat(2, axis=0).repeat(2, axis=1)
+    region = visible_region(150, 100, 3.0, center=(1.0, 1.0))
+    canvas, covered = upscale_region(img, region, FakeUpscaler(), RegionTileCache(), "page", tile=64, margin=16)
+    cx, cy, cw, ch = covered
+    assert cx + cw == 150 and cy + ch == 100
+    assert np.array_equal(canvas, full[cy * 2:, cx * 2:])
+
+def test_cached_tiles_are_reused():
+    img = _image(300, 200)
+    upscaler = FakeUpscaler()
+    cache = RegionTileCache()
+
+    first, _ = upscale_region(img, (130, 70, 60, 60), upscaler, cache, "page", tile=64, margin=0)
+    tiles = len(cache.cache)
+    again, _ = upscale_region(img, (130, 70, 60, 60), upscaler, cache, "page", tile=64, margin=0)
+    assert np.array_equal(first, again)
+    assert len(upscaler.batches) == 1  # 모두 캐시 적중
+
+    # 옆으로 패닝하면 겹치는 타일은 재사용하고 새로 보이는 열만 업스케일
+    upscale_region(img, (160, 70, 60, 60), upscaler, cache, "page", tile=64, margin=0)
+    assert len(upscaler.batches) == 2 and len(upscaler.batches[1]) == 2
+    assert len(cache.cache) == tiles + 2
+
+    # 이미지 키가 다르면 (다른 페이지/회전) 공유하지 않음
+    upscale_region(img, (130, 70, 60, 60), upscaler, cache, "rotated", tile=64, margin=0)
+    assert len(upscaler.batches[2]) == tiles
+
+def test_region_tile_cache_lru_and_evict():
+    cache = RegionTileCache(max_tiles=2)
+    a, b, c = (np.zeros((10, 10, 3), np.uint8) for _ in range(3))
+    cache.put("a", a)
+    cache.put("b", b)
+    assert cache.get("a") is a  # a가 최근 사용으로
+    cache.put("c", c)
+    assert cache.get("b") is None and cache.get("a") is a and cache.get("c") is c
+    assert cache.nbytes() == 600
+
+    assert cache.evict(1) == 300 and cache.get("a") is None  # 가장 오래된 것부터
+    assert cache.evict(10 ** 6) == 300 and cache.nbytes() == 0
+    cache.put("a", a)
+    cache.clear()
+    assert cache.get("a") is None
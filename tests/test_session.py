@@ -0,0 +1,32 @@
+import os
+
+from core.session import SessionState, load_session, save_session, snapshot_valid
+
+def test_session_roundtrip(tmp_path):
+    folder = tmp_path / "book"
+    folder.mkdir()
+    path = str(tmp_path / "session.json")
+    state = SessionState(source=str(folder), page="010.jpg", index=9, page_mode="strip", page_offset=0.25, rotation_angle=90)
+    save_session(state, path)
+
+    loaded = load_session(path)
+    assert loaded == state
+    assert not loaded.is_archive and loaded.page_path() == os.path.join(str(folder), "010.jpg")
+
+def test_missing_source_or_bad_file_is_ignored(tmp_path):
+    path = str(tmp_path / "session.json")
+    save_session(SessionState(source=str(tmp_path / "gone.cbz"), page="001.jpg"), path)
+    assert load_session(path) is None
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{broken")
+    assert load_session(path) is None
+    assert load_session(str(tmp_path / "none.json")) is None
+
+def test_snapshot_must_belong_to_session(tmp_path):
+    snapshot = tmp_path / "snapshot.jpg"
+    snapshot.write_bytes(b"jpeg")
+    state = SessionState(source=str(tmp_path), page="a.jpg", snapshot_mtime=os.path.getmtime(snapshot))
+    assert snapshot_valid(state, str(snapshot))
+    os.utime(snapshot, (0, 0))
+    assert not snapshot_valid(state, str(snapshot))
@@ -0,0 +1,44 @@
+import os
+import time
+import uuid
+
+from PySide6.QtCore import QCoreApplication
+
+from utils.single_instance import encode_message, decode_message, send_to_running, InstanceServer
+
+
+def test_message_roundtrip_uses_absolute_paths():
+    data = encode_message(["a.jpg", "/tmp/만화.cbz"])
+    assert data.endswith(b"\n")
+    assert decode_message(data) == [os.path.abspath("a.jpg"), "/tmp/만화.cbz"]
+
+
+def test_bad_message_is_ignored():
+    assert decode_message(b"not json") == []
+    assert decode_message(b'{"paths": [1, "x.png"]}') == ["x.png"]
+
+
+def test_paths_are_handed_to_running_instance(tmp_path):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    name = f"viewer-test-{uuid.uuid4().hex[:12]}"
+    server = InstanceServer(name=name)
+    received = []
+    server.filesReceived.connect(received.append)
+    assert server.listen()
+    try:
+        cwd = os.getcwd()
+        os.chdir(tmp_path)
+        try:
+            assert send_to_running(["page1.jpg", "book.cbz"], name=name)
+        finally:
+            os.chdir(cwd)
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        assert received == [[str(tmp_path / "page1.jpg"), str(tmp_path / "book.cbz")]]
+    finally:
+        server.close()
+
+    # 듣고 있는 인스턴스가 없으면 False (새 프로세스가 직접 창을 띄움)
+    assert not send_to_running(["page1.jpg"], timeout_ms=200, name=name)
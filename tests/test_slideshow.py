@@ -0,0 +1,38 @@
+from core.slideshow import SlideshowClock, scroll_window, is_tall_page
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+def test_deadlines_do_not_drift():
+    clock = FakeClock()
+    show = SlideshowClock(interval=2.0, clock=clock)
+    assert show.start() == 102.0
+    assert not show.record(102.005, prepare_time=0.1)
+    assert show.deadline == 104.0          # 5ms 늦게 그려도 다음 마감은 그대로
+    assert show.record(104.5, prepare_time=0.1)
+    assert show.deadline == 106.0
+    show.record(109.0, prepare_time=0.1)   # 한 주기 넘게 밀리면 다시 맞춤
+    assert show.deadline == 111.0
+    assert show.stats()["misses"] == 2
+
+def test_quality_drops_on_miss_and_recovers():
+    show = SlideshowClock(interval=1.0, clock=FakeClock())
+    show.start()
+    show.record(show.deadline + 0.2, prepare_time=0.9)
+    assert show.reduce == 2
+    show.record(show.deadline, prepare_time=0.9)
+    assert show.reduce == 4
+    # 한 단계 올려도 여유가 있는 상태가 3번 이어지면 복구
+    for _ in range(3):
+        show.record(show.deadline, prepare_time=0.05)
+    assert show.reduce == 2
+
+def test_scroll_window_covers_tall_page():
+    assert is_tall_page(800, 6000, 1000, 700)
+    assert not is_tall_page(800, 1200, 1000, 700)
+    assert scroll_window(800, 6000, 1000, 700, 0.0) == (0, 560)
+    assert scroll_window(800, 6000, 1000, 700, 1.0) == (5440, 560)
@@ -0,0 +1,20 @@
+from core.strip_layout import StripLayout
+
+def test_offsets_follow_display_width():
+    layout = StripLayout([(800, 1600), (800, 400), None], width=400)
+    assert [layout.page_height(i) for i in range(3)] == [800, 200, 560]
+    assert [layout.offset(i) for i in range(3)] == [0, 800, 1000]
+    assert layout.total_height() == 1560
+    layout.set_width(200)
+    assert layout.offset(2) == 500
+
+def test_visible_range_and_correction():
+    layout = StripLayout([(100, 100)] * 1000, width=100)
+    assert layout.page_at(250) == 2
+    assert layout.visible_range(250, 550) == (2, 5)
+    assert layout.visible_range(-50, 150) == (0, 1)   # 여유분이 맨 위를 넘어가도 됨
+    assert layout.page_at(10 ** 9) == 999
+    # 크기를 몰랐던 페이지가 디코딩되면 뒤 페이지 위치가 밀림
+    assert not layout.set_size(0, 50, 50)
+    assert layout.set_size(0, 100, 300)
+    assert layout.offset(1) == 300
@@ -0,0 +1,26 @@
+from core.tile_planner import plan_tiles, load_calibration, save_calibration, Calibration
+
+MB = 1024 ** 2
+GB = 1024 ** 3
+
+def test_small_image_is_not_tiled():
+    plan = plan_tiles(256, 256, bytes_per_megapixel=1 * GB, max_batch=4, available=8 * GB)
+    assert plan.tile == 0
+    assert plan.batch == 4
+
+def test_large_image_fits_tile_in_budget():
+    budget = 2 * GB
+    plan = plan_tiles(4000, 6000, bytes_per_megapixel=int(9.5 * GB), available=budget, memory_ratio=0.5)
+    assert 0 < plan.tile < 4000
+    assert plan.est_peak_bytes <= budget * 0.5
+
+def test_less_memory_means_smaller_tiles():
+    big = plan_tiles(4000, 6000, bytes_per_megapixel=int(9.5 * GB), available=8 * GB)
+    small = plan_tiles(4000, 6000, bytes_per_megapixel=int(9.5 * GB), available=512 * MB)
+    assert small.tile < big.tile
+
+def test_calibration_roundtrip(tmp_path):
+    path = str(tmp_path / "calibration.json")
+    assert load_calibration("real-esrgan|fp32|4", path) is None
+    save_calibration("real-esrgan|fp32|4", Calibration(123, 4.5), path)
+    assert load_calibration("real-esrgan|fp32|4", path) == Calibration(123, 4.5)
@@ -0,0 +1,54 @@
+import threading
+
+import numpy as np
+
+from config.settings_loader import AppSettings
+from core.upscale_daemon import UpscaleDaemon, DaemonClient, RemoteUpscaler
+from plugins.lanczos_plugin import LanczosUpscaler
+
+def _start(tmp_path):
+    settings = AppSettings()
+    settings.scale_factor = 2.0
+    daemon = UpscaleDaemon(LanczosUpscaler(settings), str(tmp_path / "daemon.sock"), b"test-key")
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    return settings, daemon, thread
+
+def test_clients_share_one_model(tmp_path):
+    settings, daemon, thread = _start(tmp_path)
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, 255, (20, 30, 3), dtype=np.uint8) for _ in range(3)]
+    expected = LanczosUpscaler(settings).upscale_batch(images)
+
+    clients = [DaemonClient(daemon.address, authkey=b"test-key") for _ in range(3)]
+    results = [None] * len(clients)
+
+    def run(i):
+        results[i] = RemoteUpscaler(clients[i], clients[i].info()).upscale_batch(images)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(clients))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    for outputs in results:
+        assert all(np.array_equal(a, b) for a, b in zip(outputs, expected))
+
+    info = clients[0].info()
+    assert info["model"] == "lanczos" and info["clients"] == 3 and info["served"] == 9
+    clients[0].stop_daemon()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not (tmp_path / "daemon.sock").exists()
+
+def test_wrong_authkey_is_rejected(tmp_path):
+    _, daemon, thread = _start(tmp_path)
+    try:
+        DaemonClient(daemon.address, authkey=b"other")
+    except Exception:
+        pass
+    else:
+        raise AssertionError("인증 키가 다른 연결이 허용됨")
+    daemon.stop()
+    thread.join(5)